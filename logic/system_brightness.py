@@ -27,6 +27,7 @@ class SystemBacklightController:
     def __init__(self, info: BacklightInfo) -> None:
         self._info = info
         self._last_raw_value: Optional[int] = None
+        self._brightness_fd: Optional[int] = None  # opened on first write, kept until close()
 
     @property
     def name(self) -> str:
@@ -96,23 +97,48 @@ class SystemBacklightController:
                 max_brightness=max_value,
             )
 
+    def raw_for_level(self, level: float) -> int:
+        """Raw device value for a 0..1 level (clamped)."""
+        clamped = max(0.0, min(1.0, float(level)))
+        return int(round(clamped * self._info.max_brightness))
+
     def set_level(self, level: float) -> None:
         """Set backlight level, clamping to 0..1."""
-        clamped = max(0.0, min(1.0, float(level)))
-        raw_value = int(round(clamped * self._info.max_brightness))
+        self.set_raw(self.raw_for_level(level))
+
+    def set_raw(self, raw_value: int) -> None:
+        """Write a raw device value (clamped to 0..max_brightness); repeated values are skipped."""
+        raw_value = max(0, min(self._info.max_brightness, raw_value))
         if self._last_raw_value is not None and raw_value == self._last_raw_value:
             return
 
         try:
-            with open(self._info.brightness_path, "w", encoding="utf-8") as handle:
-                handle.write(f"{raw_value}\n")
+            if self._brightness_fd is None:
+                self._brightness_fd = os.open(
+                    self._info.brightness_path, os.O_WRONLY | getattr(os, "O_CLOEXEC", 0)
+                )
+            # sysfs applies each write() as a whole value; offset 0 keeps the node readable as usual
+            os.pwrite(self._brightness_fd, f"{raw_value}\n".encode("ascii"), 0)
         except PermissionError as exc:
+            self.close()
             raise PermissionError(
                 f"Permission denied while writing {self._info.brightness_path}. "
                 "Grant write access or run the app with sudo/setcap."
             ) from exc
+        except OSError:
+            self.close()  # reopen on the next write (e.g. device went away and came back)
+            raise
         self._last_raw_value = raw_value
 
+    def close(self) -> None:
+        """Close the cached brightness file descriptor, if open."""
+        if self._brightness_fd is not None:
+            try:
+                os.close(self._brightness_fd)
+            except OSError:
+                pass
+            self._brightness_fd = None
+
     def get_level(self) -> float:
         """Return current backlight level in range 0..1."""
         raw_value = self._read_int(self._info.brightness_path)
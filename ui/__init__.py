@@ -1,6 +1,6 @@
 """User interface components."""
 
-from .animations import AnimatedPanel, AnimatedSlideContainer, SlideType
+from .animations import AnimatedPanel, AnimatedSlideContainer, SlideType, WeatherSlideData
 from .controls import ModernColorButton, ModernSlider
 from .ndot_clock_slider import NDotClockSlider
 from .popups import ConfirmationPopup, DownloadProgressPopup, NotificationPopup
@@ -9,6 +9,7 @@ __all__ = [
     "AnimatedPanel",
     "AnimatedSlideContainer",
     "SlideType",
+    "WeatherSlideData",
     "ModernColorButton",
     "ModernSlider",
     "NDotClockSlider",
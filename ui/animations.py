@@ -1,9 +1,9 @@
 """Animated containers and panels used by the UI layer."""
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from PyQt6.QtCore import pyqtProperty
+from PyQt6.QtCore import QTimer, pyqtProperty
 from PyQt6.QtGui import QColor, QPainter, QPaintEvent
 from PyQt6.QtWidgets import QFrame, QGraphicsOpacityEffect, QWidget
 
@@ -18,20 +18,72 @@ class SlideType(Enum):
     ADD = "add"
 
 
+class WeatherSlideData:
+    """Visibility flags for the weather slide elements.
+
+    Kept as a ``__slots__`` object instead of a dict so the paint path reads
+    plain attributes; converted to/from dicts only at the settings boundary.
+    """
+
+    __slots__ = ("show_temp", "show_icon", "show_desc", "show_wind")
+
+    def __init__(self, show_temp: bool = True, show_icon: bool = True,
+                 show_desc: bool = True, show_wind: bool = True):
+        self.show_temp = show_temp
+        self.show_icon = show_icon
+        self.show_desc = show_desc
+        self.show_wind = show_wind
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "WeatherSlideData":
+        if isinstance(data, cls):
+            return data
+        data = data or {}
+        return cls(
+            show_temp=bool(data.get("show_temp", True)),
+            show_icon=bool(data.get("show_icon", True)),
+            show_desc=bool(data.get("show_desc", True)),
+            show_wind=bool(data.get("show_wind", True)),
+        )
+
+    def to_dict(self) -> Dict[str, bool]:
+        return {
+            "show_temp": self.show_temp,
+            "show_icon": self.show_icon,
+            "show_desc": self.show_desc,
+            "show_wind": self.show_wind,
+        }
+
+
 class AnimatedSlideContainer(QWidget):
     """Container for managing slide animations with batched updates and motion blur."""
 
+    # Dirty bits for properties changed since the last batched update
+    DIRTY_OFFSET_X = 1
+    DIRTY_SCALE = 2
+    DIRTY_OFFSET_Y = 4
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._offset_x = 0.0
         self._scale = 1.0
         self._offset_y = 0.0
-        self._batch_update_pending = False  # ARM optimization: batch updates
+        self._dirty = 0  # ARM optimization: batch updates (DIRTY_* bits)
 
         # Fix: Motion blur effect for fast swiping (lightweight implementation)
         self._last_offset_x = 0.0
         self._velocity = 0.0
         self._motion_blur_opacity = 0.0
+        self._blur_color = QColor(0, 0, 0, 0)  # alpha updated in place per blurred frame
+
+        self._parent: Optional[QWidget] = None
+        self._parent_update_webviews = None  # bound parent.update_active_webviews, if any
+        self.bind_parent(parent)
+
+    def bind_parent(self, parent: Optional[QWidget]):
+        """Resolve the parent callbacks once instead of on every batched update."""
+        self._parent = parent
+        self._parent_update_webviews = getattr(parent, 'update_active_webviews', None)
 
     def get_offset_x(self) -> float:
         return self._offset_x
@@ -50,56 +102,48 @@ class AnimatedSlideContainer(QWidget):
             self._motion_blur_opacity = 0.0
 
         self._offset_x = value
-        self._schedule_batched_update()
+        self._schedule_batched_update(self.DIRTY_OFFSET_X)
 
     def get_scale(self) -> float:
         return self._scale
 
     def set_scale(self, value: float):
         self._scale = value
-        self._schedule_batched_update()
+        self._schedule_batched_update(self.DIRTY_SCALE)
 
     def get_offset_y(self) -> float:
         return self._offset_y
 
     def set_offset_y(self, value: float):
         self._offset_y = value
-        self._schedule_batched_update()
+        self._schedule_batched_update(self.DIRTY_OFFSET_Y)
 
-    def _schedule_batched_update(self):
+    def _schedule_batched_update(self, dirty_bit: int):
         """ARM optimization: batch all updates into single frame to reduce repaints."""
-        if not self._batch_update_pending:
-            self._batch_update_pending = True
-            # Fix: Use immediate update for drag, batched for animations
-            # This prevents lag during swipes while keeping optimization for animations
-            from PyQt6.QtCore import QTimer
-            parent = self.parentWidget()
-            is_dragging = parent and hasattr(parent, 'is_dragging') and parent.is_dragging
-
-            if is_dragging:
-                # Immediate update during drag for responsive feel
-                self._perform_batched_update()
-            else:
-                # Batched update for animations
-                QTimer.singleShot(0, self._perform_batched_update)
+        was_clean = not self._dirty
+        self._dirty |= dirty_bit
+        if was_clean:
+            # Drags and animations alike flush once per event-loop iteration; update()
+            # coalesces anyway, so this costs no responsiveness while a finger is down
+            QTimer.singleShot(0, self._perform_batched_update)
 
     def _perform_batched_update(self):
         """Perform batched update of container and webviews."""
-        if not self._batch_update_pending:
+        if not self._dirty:
             return
-        self._batch_update_pending = False
+        self._dirty = 0
 
         # Single update call for container
         self.update()
 
         # Single notification to parent
-        parent = self.parentWidget()
+        parent = self._parent
         if parent is not None:
             parent.update()
 
             # Update webviews once per batch instead of per property
-            if hasattr(parent, 'update_active_webviews'):
-                parent.update_active_webviews()
+            if self._parent_update_webviews is not None:
+                self._parent_update_webviews()
 
     offset_x = pyqtProperty(float, get_offset_x, set_offset_x)
     scale = pyqtProperty(float, get_scale, set_scale)
@@ -109,16 +153,18 @@ class AnimatedSlideContainer(QWidget):
         """Add motion blur overlay during fast swipes."""
         super().paintEvent(event)
 
-        # Only apply motion blur if velocity is high enough
-        if self._motion_blur_opacity > 0.0:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)  # Fast rendering
+        # Only apply motion blur if velocity is high enough (not the case on almost every frame)
+        if self._motion_blur_opacity <= 0.0:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)  # Fast rendering
 
-            # Draw semi-transparent overlay for blur effect
-            blur_color = QColor(0, 0, 0, int(255 * self._motion_blur_opacity))
-            painter.fillRect(self.rect(), blur_color)
+        # Draw semi-transparent overlay for blur effect
+        self._blur_color.setAlpha(int(255 * self._motion_blur_opacity))
+        painter.fillRect(event.rect(), self._blur_color)
 
-            painter.end()
+        painter.end()
 
 
 class AnimatedPanel(QFrame):
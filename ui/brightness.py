@@ -1,12 +1,120 @@
 import os
 import sys
-import math
-from typing import Optional, Tuple, List
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtWidgets import QCheckBox
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from logic import AmbientLightMonitor, SystemBacklightController
-from ui.controls import ModernSlider
+
+_TRUTHY_ENV = ("1", "true", "yes")
+
+# Verbosity is fixed for the process, so hot paths test a module global instead of an attribute
+_SYSTEM_BACKLIGHT_VERBOSE = os.environ.get("NDOT_SYSTEM_BACKLIGHT_VERBOSE", "").lower() in _TRUTHY_ENV
+_AUTO_BRIGHTNESS_VERBOSE = (
+    os.environ.get("NDOT_AUTO_BRIGHTNESS_VERBOSE", "").lower() in _TRUTHY_ENV or _SYSTEM_BACKLIGHT_VERBOSE
+)
+
+
+class _AutoBrightnessEnv(NamedTuple):
+    """NDOT_* brightness environment overrides, validated and clamped."""
+
+    system_backlight: str
+    system_backlight_parts: Tuple[str, ...]
+    gamma: float
+    interval_override: Optional[int]
+    smoothing: float
+    min_update_interval: Optional[float]
+    min_override: Optional[float]
+    max_override: Optional[float]
+    camera_ambient_min: Optional[float]
+    camera_ambient_max: Optional[float]
+    camera_ambient_darkroom: Optional[float]
+
+
+def _log_env(message: str):
+    print(f"[AutoBrightness] {message}", file=sys.stderr, flush=True)
+
+
+def _env_float(name: str, low: float, high: float, verbose: bool) -> Optional[float]:
+    """Clamped float value of ``name``, or None when unset or invalid."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return max(low, min(float(raw), high))
+    except ValueError:
+        if verbose:
+            _log_env(f"Invalid {name}='{raw}', ignoring")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _auto_brightness_env() -> _AutoBrightnessEnv:
+    """Read and validate every NDOT_* brightness variable once per process."""
+    verbose = _AUTO_BRIGHTNESS_VERBOSE
+
+    # Gamma curve
+    gamma = _env_float("NDOT_AUTO_BRIGHTNESS_GAMMA", 0.3, 5.0, verbose)
+    if gamma is None:
+        gamma = 2.0
+        if verbose:
+            _log_env(f"Using brightness gamma {gamma:.3f}")
+    elif verbose:
+        _log_env(f"NDOT_AUTO_BRIGHTNESS_GAMMA -> using {gamma:.3f}")
+
+    # Interval
+    interval = _env_float("NDOT_AUTO_BRIGHTNESS_INTERVAL_MS", 150, 60000, verbose)
+    interval_override = int(interval) if interval is not None else None
+    if interval_override is not None and verbose:
+        _log_env(f"NDOT_AUTO_BRIGHTNESS_INTERVAL_MS={interval_override}")
+
+    # Smoothing
+    smoothing = _env_float("NDOT_AUTO_BRIGHTNESS_SMOOTHING", 0.0, 0.95, verbose)
+    if smoothing is None:
+        smoothing = 0.85
+    elif verbose:
+        _log_env(f"NDOT_AUTO_BRIGHTNESS_SMOOTHING={smoothing:.3f}")
+
+    # Min interval
+    min_update_interval = _env_float("NDOT_AUTO_BRIGHTNESS_MIN_INTERVAL", 0.02, 1.0, verbose)
+    if min_update_interval is not None and verbose:
+        _log_env(f"NDOT_AUTO_BRIGHTNESS_MIN_INTERVAL={min_update_interval:.3f}s")
+
+    # Min/Max overrides
+    min_override = _env_float("NDOT_AUTO_BRIGHTNESS_MIN", 0.0, 1.0, verbose)
+    max_override = _env_float("NDOT_AUTO_BRIGHTNESS_MAX", 0.0, 1.0, verbose)
+    if min_override is not None and max_override is not None and min_override > max_override:
+        if verbose:
+            _log_env("MIN override is greater than MAX override, swapping them")
+        min_override, max_override = max_override, min_override
+
+    # Camera calibration overrides (from calibrate_camera.py results)
+    camera_ambient = {}
+    for name in ("NDOT_CAMERA_AMBIENT_MIN", "NDOT_CAMERA_AMBIENT_MAX", "NDOT_CAMERA_AMBIENT_DARKROOM"):
+        value = _env_float(name, 0.0, 1.0, verbose)
+        if value is not None and verbose:
+            _log_env(f"{name}={value:.3f}")
+        camera_ambient[name] = value
+
+    # Backlight device list, e.g. "auto" or "rpi_backlight,/sys/class/backlight/10-0045"
+    system_backlight = os.environ.get("NDOT_SYSTEM_BACKLIGHT", "").strip()
+    system_backlight_parts = tuple(part.strip() for part in system_backlight.split(",") if part.strip())
+
+    return _AutoBrightnessEnv(
+        system_backlight=system_backlight,
+        system_backlight_parts=system_backlight_parts or ("auto",),
+        gamma=gamma,
+        interval_override=interval_override,
+        smoothing=smoothing,
+        min_update_interval=min_update_interval,
+        min_override=min_override,
+        max_override=max_override,
+        camera_ambient_min=camera_ambient["NDOT_CAMERA_AMBIENT_MIN"],
+        camera_ambient_max=camera_ambient["NDOT_CAMERA_AMBIENT_MAX"],
+        camera_ambient_darkroom=camera_ambient["NDOT_CAMERA_AMBIENT_DARKROOM"],
+    )
+
 
 class BrightnessManager(QObject):
     """Manages screen brightness, auto-brightness, and system backlight."""
@@ -38,44 +146,55 @@ class BrightnessManager(QObject):
         self._auto_brightness_smoothed = self._manual_brightness
         self._current_display_brightness = self._manual_brightness
         self._cached_brightness = self._manual_brightness  # Cache for fast access
+        self._last_written_int_level = -1  # last raw backlight level sent to sysfs (-1: none yet)
         self._ambient_light_monitor: Optional[AmbientLightMonitor] = None
         self._pending_auto_brightness_activation = False
         self._suppress_auto_brightness_save = False
         
-        # Smoothing buffers
-        self._ambient_brightness_buffer = []
-        self._ambient_brightness_buffer_size = 5
+        # Ambient pre-filter: EMA with alpha ~ 2/(N+1) for the former 5-sample average
+        self._ambient_ema: Optional[float] = None
+        self._ambient_ema_alpha = 0.35
         self._last_brightness_update_time = 0
         self._min_brightness_update_interval = 0.05
         self._last_auto_sample_time = 0.0
         self._auto_brightness_last_interval = self._auto_brightness_interval_ms / 1000.0
         
-        # Logging state
-        self._auto_log_last_measured: Optional[float] = None
-        self._auto_log_last_target: Optional[float] = None
-        self._auto_log_last_smoothed: Optional[float] = None
-        
         # System backlight
         self._system_backlight: Optional[SystemBacklightController] = None
         self._system_backlight_error_notified = False
-        self._system_backlight_verbose = os.environ.get("NDOT_SYSTEM_BACKLIGHT_VERBOSE", "").lower() in ("1", "true", "yes")
-        self._system_backlight_last_ui_log: Optional[float] = None
-        
-        # Verbose logging
-        auto_verbose_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_VERBOSE", "")
-        self._auto_brightness_verbose = auto_verbose_env.lower() in ("1", "true", "yes") or self._system_backlight_verbose
+        self._system_backlight_last_ui_log = -1.0  # Below any level, so the first write logs
         
         # Animation
-        self._brightness_animation_target = self._manual_brightness
-        self._brightness_animation = QPropertyAnimation(self, b"animatedBrightness")
-        self._brightness_animation.setDuration(800)
-        self._brightness_animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        # Animation: a plain ~30 fps timer interpolates start -> end with a cubic ease-in-out
+        self._anim_start_value = self._manual_brightness
+        self._anim_end_value = self._manual_brightness
+        self._anim_start_time = 0.0
+        self._anim_duration = 0.8  # seconds
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(33)
+        self._anim_timer.timeout.connect(self._anim_tick)
+
+        # brightness_changed is throttled: UI consumers get at most ~30 updates per second
+        self._pending_emit_value: Optional[float] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(33)
+        self._emit_timer.timeout.connect(self._flush_brightness_emit)
+
+        # sysfs backlight writes are rate limited (see _write_backlight)
+        self._pending_backlight: Optional[Tuple[float, int]] = None
+        self._backlight_write_timer = QTimer(self)
+        self._backlight_write_timer.setSingleShot(True)
+        self._backlight_write_timer.setInterval(20)
+        self._backlight_write_timer.timeout.connect(self._flush_pending_backlight)
         
         # Camera reconnection state
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 10
-        self._reconnect_interval_ms = 30000  # 30 seconds
-        self._reconnect_timer: Optional[QTimer] = None
+        self._reconnect_max_interval_ms = 60000  # backoff doubles from 1s up to this
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._do_camera_reconnect)
         
         # Load environment overrides
         self._load_auto_brightness_env_overrides()
@@ -83,154 +202,35 @@ class BrightnessManager(QObject):
         # Initialize system backlight
         self._initialize_system_backlight()
 
-    @pyqtProperty(float)
-    def animatedBrightness(self):
-        """Property for brightness animation"""
-        return self._brightness_animation_target
-    
-    @animatedBrightness.setter
-    def animatedBrightness(self, value: float):
-        """Setter for animated brightness"""
-        self._brightness_animation_target = value
-        self._apply_brightness_direct(value)
+    def _anim_tick(self):
+        """Advance the brightness animation by one timer tick"""
+        elapsed = time.monotonic() - self._anim_start_time
+        t = max(0.0, min(1.0, elapsed / self._anim_duration))
+        eased = t * t * (3.0 - 2.0 * t)  # cubic ease-in-out
+        self._apply_brightness_direct(self._anim_start_value + (self._anim_end_value - self._anim_start_value) * eased)
+        if t >= 1.0:
+            self._anim_timer.stop()
 
     def _load_auto_brightness_env_overrides(self):
-        """Load auto-brightness configuration from environment variables"""
-        # Gamma curve
-        gamma_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_GAMMA", "").strip()
-        self._auto_brightness_curve_gamma = 2.0
-        if gamma_env:
-            try:
-                parsed_gamma = float(gamma_env)
-                self._auto_brightness_curve_gamma = max(0.3, min(parsed_gamma, 5.0))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_AUTO_BRIGHTNESS_GAMMA={parsed_gamma:.3f} -> using {self._auto_brightness_curve_gamma:.3f}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_GAMMA='{gamma_env}', falling back to {self._auto_brightness_curve_gamma:.3f}", file=sys.stderr, flush=True)
-        elif self._auto_brightness_verbose:
-            print(f"[AutoBrightness] Using default brightness gamma {self._auto_brightness_curve_gamma:.3f}", file=sys.stderr, flush=True)
-
-        # Interval
-        interval_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_INTERVAL_MS", "").strip()
-        self._auto_brightness_interval_override: Optional[int] = None
-        if interval_env:
-            try:
-                parsed_interval = int(float(interval_env))
-                parsed_interval = max(150, min(parsed_interval, 60000))
-                self._auto_brightness_interval_override = parsed_interval
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_AUTO_BRIGHTNESS_INTERVAL_MS={parsed_interval}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_INTERVAL_MS='{interval_env}', ignoring", file=sys.stderr, flush=True)
-
-        # Smoothing
-        self._auto_brightness_smoothing = 0.85
-        smoothing_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_SMOOTHING", "").strip()
-        if smoothing_env:
-            try:
-                parsed_smoothing = float(smoothing_env)
-                self._auto_brightness_smoothing = max(0.0, min(parsed_smoothing, 0.95))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_AUTO_BRIGHTNESS_SMOOTHING={self._auto_brightness_smoothing:.3f}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_SMOOTHING='{smoothing_env}', ignoring", file=sys.stderr, flush=True)
-
-        # Min interval
-        min_interval_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_MIN_INTERVAL", "").strip()
-        if min_interval_env:
-            try:
-                parsed_min_interval = float(min_interval_env)
-                self._min_brightness_update_interval = max(0.02, min(parsed_min_interval, 1.0))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_AUTO_BRIGHTNESS_MIN_INTERVAL={self._min_brightness_update_interval:.3f}s", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_MIN_INTERVAL='{min_interval_env}', ignoring", file=sys.stderr, flush=True)
+        """Load auto-brightness configuration from environment variables (parsed once per process)"""
+        env = _auto_brightness_env()
+        self._auto_brightness_curve_gamma = env.gamma
+        self._auto_brightness_interval_override: Optional[int] = env.interval_override
+        self._auto_brightness_smoothing = env.smoothing
+        if env.min_update_interval is not None:
+            self._min_brightness_update_interval = env.min_update_interval
 
         # Min/Max overrides
-        self._auto_brightness_min_override: Optional[float] = None
-        self._auto_brightness_max_override: Optional[float] = None
-        min_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_MIN", "").strip()
-        max_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_MAX", "").strip()
-        
-        if min_env:
-            try:
-                parsed_min = float(min_env)
-                self._auto_brightness_min_override = max(0.0, min(parsed_min, 1.0))
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_MIN='{min_env}', ignoring", file=sys.stderr, flush=True)
-        
-        if max_env:
-            try:
-                parsed_max = float(max_env)
-                self._auto_brightness_max_override = max(0.0, min(parsed_max, 1.0))
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_MAX='{max_env}', ignoring", file=sys.stderr, flush=True)
-
-        if (self._auto_brightness_min_override is not None and 
-            self._auto_brightness_max_override is not None and 
-            self._auto_brightness_min_override > self._auto_brightness_max_override):
-            if self._auto_brightness_verbose:
-                print("[AutoBrightness] MIN override is greater than MAX override, swapping them", file=sys.stderr, flush=True)
-            self._auto_brightness_min_override, self._auto_brightness_max_override = (
-                self._auto_brightness_max_override, self._auto_brightness_min_override
-            )
+        self._auto_brightness_min_override: Optional[float] = env.min_override
+        self._auto_brightness_max_override: Optional[float] = env.max_override
 
         # Camera calibration overrides (from calibrate_camera.py results)
-        self._camera_ambient_min_override: Optional[float] = None
-        self._camera_ambient_max_override: Optional[float] = None
-        self._camera_ambient_darkroom_override: Optional[float] = None
-        
-        cam_min_env = os.environ.get("NDOT_CAMERA_AMBIENT_MIN", "").strip()
-        cam_max_env = os.environ.get("NDOT_CAMERA_AMBIENT_MAX", "").strip()
-        cam_darkroom_env = os.environ.get("NDOT_CAMERA_AMBIENT_DARKROOM", "").strip()
-        
-        if cam_min_env:
-            try:
-                self._camera_ambient_min_override = max(0.0, min(float(cam_min_env), 1.0))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_CAMERA_AMBIENT_MIN={self._camera_ambient_min_override:.3f}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_CAMERA_AMBIENT_MIN='{cam_min_env}', ignoring", file=sys.stderr, flush=True)
-        
-        if cam_max_env:
-            try:
-                self._camera_ambient_max_override = max(0.0, min(float(cam_max_env), 1.0))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_CAMERA_AMBIENT_MAX={self._camera_ambient_max_override:.3f}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_CAMERA_AMBIENT_MAX='{cam_max_env}', ignoring", file=sys.stderr, flush=True)
-        
-        if cam_darkroom_env:
-            try:
-                self._camera_ambient_darkroom_override = max(0.0, min(float(cam_darkroom_env), 1.0))
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] NDOT_CAMERA_AMBIENT_DARKROOM={self._camera_ambient_darkroom_override:.3f}", file=sys.stderr, flush=True)
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_CAMERA_AMBIENT_DARKROOM='{cam_darkroom_env}', ignoring", file=sys.stderr, flush=True)
-
-        # Calibration decay
-        calibration_decay_env = os.environ.get("NDOT_AUTO_BRIGHTNESS_CALIBRATION_DECAY", "").strip()
-        self._ambient_calibration_decay = 0.005
-        if calibration_decay_env:
-            try:
-                parsed_decay = float(calibration_decay_env)
-                self._ambient_calibration_decay = max(0.001, min(parsed_decay, 0.2))
-            except ValueError:
-                if self._auto_brightness_verbose:
-                    print(f"[AutoBrightness] Invalid NDOT_AUTO_BRIGHTNESS_CALIBRATION_DECAY='{calibration_decay_env}', ignoring", file=sys.stderr, flush=True)
-
-        self._ambient_dynamic_min: Optional[float] = None
-        self._ambient_dynamic_max: Optional[float] = None
-        self._ambient_calibration_last_log: Optional[Tuple[float, float]] = None
+        self._camera_ambient_min_override: Optional[float] = env.camera_ambient_min
+        self._camera_ambient_max_override: Optional[float] = env.camera_ambient_max
+        self._camera_ambient_darkroom_override: Optional[float] = env.camera_ambient_darkroom
+
+        self._rebuild_ambient_mapping()
+
         self._auto_brightness_has_sample = False
         
         # Fix: Track stopping monitors to prevent race conditions
@@ -257,6 +257,7 @@ class BrightnessManager(QObject):
             auto_min, auto_max = auto_max, auto_min
         self._auto_brightness_min = max(0.0, min(1.0, auto_min))
         self._auto_brightness_max = max(self._auto_brightness_min, min(1.0, auto_max))
+        self._rebuild_ambient_mapping()
         
         # Re-apply env overrides if they exist
         if self._auto_brightness_interval_override is not None:
@@ -290,22 +291,23 @@ class BrightnessManager(QObject):
 
     def _initialize_system_backlight(self):
         """Configure optional system backlight controller."""
-        config_value = os.environ.get("NDOT_SYSTEM_BACKLIGHT", "").strip()
+        env = _auto_brightness_env()
+        config_value = env.system_backlight
         if not config_value:
             controller = SystemBacklightController.auto_detect()
             if controller:
                 self._system_backlight = controller
-                if self._system_backlight_verbose:
+                if _SYSTEM_BACKLIGHT_VERBOSE:
                     print(f"[Backlight] Auto-detected system backlight device '{controller.name}' (max={controller.max_brightness})", file=sys.stderr, flush=True)
                 return
             else:
-                if self._system_backlight_verbose:
+                if _SYSTEM_BACKLIGHT_VERBOSE:
                     print("[Backlight] No system backlight device found. Software brightness only.", file=sys.stderr, flush=True)
                 return
 
-        controller = self._resolve_backlight_controller(config_value)
+        controller = self._resolve_backlight_controller(env.system_backlight_parts)
         if controller is None:
-            if self._system_backlight_verbose:
+            if _SYSTEM_BACKLIGHT_VERBOSE:
                 print(f"[Backlight] No system backlight matched '{config_value}'. Keep using software brightness.", file=sys.stderr, flush=True)
             if not self._system_backlight_error_notified:
                 self._system_backlight_error_notified = True
@@ -313,15 +315,11 @@ class BrightnessManager(QObject):
             return
 
         self._system_backlight = controller
-        if self._system_backlight_verbose:
+        if _SYSTEM_BACKLIGHT_VERBOSE:
             print(f"[Backlight] Using system backlight device '{controller.name}' (max={controller.max_brightness})", file=sys.stderr, flush=True)
 
-    def _resolve_backlight_controller(self, config_value: str) -> Optional[SystemBacklightController]:
-        """Resolve backlight device from configuration string."""
-        parts = [part.strip() for part in config_value.split(",") if part.strip()]
-        if not parts:
-            parts = ["auto"]
-
+    def _resolve_backlight_controller(self, parts: Tuple[str, ...]) -> Optional[SystemBacklightController]:
+        """Resolve backlight device from the pre-split configuration entries."""
         for part in parts:
             lowered = part.lower()
             if lowered in ("auto", "detect", "default"):
@@ -373,7 +371,7 @@ class BrightnessManager(QObject):
 
         # If there are any stopping monitors, wait for them to finish
         if self._stopping_monitors:
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print("[AutoBrightness] Waiting for previous monitor(s) to stop...", file=sys.stderr, flush=True)
             self._pending_enable = True
             return
@@ -381,7 +379,7 @@ class BrightnessManager(QObject):
         self._pending_enable = False
         
         if not self._ambient_light_monitor:
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print("[AutoBrightness] Starting ambient light monitor...", file=sys.stderr, flush=True)
             
             interval = self._auto_brightness_interval_override or self._auto_brightness_interval_ms
@@ -397,13 +395,13 @@ class BrightnessManager(QObject):
             
             # Reset smoothing state
             self._auto_brightness_smoothed = self._current_display_brightness
-            self._ambient_brightness_buffer.clear()
+            self._ambient_ema = None
             self._auto_brightness_has_sample = False
 
     def _teardown_ambient_monitor(self):
         """Stop and cleanup ambient light monitor."""
         if self._ambient_light_monitor:
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print("[AutoBrightness] Stopping ambient light monitor...", file=sys.stderr, flush=True)
             
             monitor = self._ambient_light_monitor
@@ -442,39 +440,17 @@ class BrightnessManager(QObject):
 
     def _on_ambient_brightness_measured(self, ambient: float):
         """Handle new ambient brightness measurement."""
-        import time
-        now = time.time()
-        
         # Reset reconnect counter on successful measurement
         self._on_camera_connected_successfully()
         
-        # Add to buffer
-        self._ambient_brightness_buffer.append(ambient)
-        if len(self._ambient_brightness_buffer) > self._ambient_brightness_buffer_size:
-            self._ambient_brightness_buffer.pop(0)
-            
-        # Calculate average ambient brightness
-        avg_ambient = sum(self._ambient_brightness_buffer) / len(self._ambient_brightness_buffer)
-        
-        # Dynamic calibration
-        if self._ambient_dynamic_min is None:
-            self._ambient_dynamic_min = avg_ambient
-            self._ambient_dynamic_max = avg_ambient + 0.001
+        # Exponentially averaged ambient brightness (first sample seeds the average)
+        if self._ambient_ema is None:
+            avg_ambient = ambient
         else:
-            # Expand range
-            if avg_ambient < self._ambient_dynamic_min:
-                self._ambient_dynamic_min = avg_ambient
-            if avg_ambient > self._ambient_dynamic_max:
-                self._ambient_dynamic_max = avg_ambient
-                
-            # Decay range
-            self._ambient_dynamic_min += (avg_ambient - self._ambient_dynamic_min) * self._ambient_calibration_decay
-            self._ambient_dynamic_max -= (self._ambient_dynamic_max - avg_ambient) * self._ambient_calibration_decay
-            
-            # Ensure valid range
-            if self._ambient_dynamic_max <= self._ambient_dynamic_min:
-                self._ambient_dynamic_max = self._ambient_dynamic_min + 0.001
-
+            alpha = self._ambient_ema_alpha
+            avg_ambient = alpha * ambient + (1.0 - alpha) * self._ambient_ema
+        self._ambient_ema = avg_ambient
+        
         # Map to target brightness
         target_brightness = self._map_ambient_to_user_brightness(avg_ambient)
         
@@ -492,15 +468,16 @@ class BrightnessManager(QObject):
         self._apply_brightness(self._auto_brightness_smoothed, from_auto=True, animate=False)
         
         # Logging
-        if self._auto_brightness_verbose:
+        if _AUTO_BRIGHTNESS_VERBOSE:
+            now = time.monotonic()
             dt = now - self._last_auto_sample_time
             if dt >= 2.0:  # Log every 2 seconds
                 self._last_auto_sample_time = now
                 print(f"[AutoBrightness] Ambient={avg_ambient:.4f} (raw={ambient:.4f}) -> Target={target_brightness:.4f} -> Smoothed={self._auto_brightness_smoothed:.4f}", file=sys.stderr, flush=True)
 
-    def _map_ambient_to_user_brightness(self, ambient: float) -> float:
-        """Map ambient light level to screen brightness.
-        
+    def _rebuild_ambient_mapping(self):
+        """Build ``_map_ambient_to_user_brightness`` for the current calibration and range.
+
         Uses camera calibration values to normalize the ambient reading,
         then maps to screen brightness range.
         
@@ -508,6 +485,11 @@ class BrightnessManager(QObject):
         
         If darkroom calibration is available, use it as the effective minimum
         for typical usage (more realistic than camera covered).
+
+        Runs on construction and whenever the brightness range is reconfigured. The
+        mapper is a closure over the resolved coefficients, so each ambient sample is
+        one multiply-add and a clamp on local cells. No gamma curve is applied here
+        (NDOT_AUTO_BRIGHTNESS_GAMMA is parsed but the mapping is linear).
         """
         # Get camera calibration values (can be overridden via env vars)
         cam_min = self._camera_ambient_min_override if self._camera_ambient_min_override is not None else self._camera_ambient_min
@@ -526,20 +508,26 @@ class BrightnessManager(QObject):
         if cam_range < 0.01:
             cam_range = 0.01  # Prevent division by zero
         
-        # Map camera value to 0.0-1.0 range
-        normalized = (ambient - effective_min) / cam_range
-        normalized = max(0.0, min(1.0, normalized))
-        
         # Get screen brightness range
         min_b = self._auto_brightness_min_override if self._auto_brightness_min_override is not None else self._auto_brightness_min
         max_b = self._auto_brightness_max_override if self._auto_brightness_max_override is not None else self._auto_brightness_max
         
-        # Map to screen brightness range
-        return min_b + (max_b - min_b) * normalized
+        # Camera range -> 0.0-1.0 -> screen range, folded into one affine map; clamping the
+        # result to the screen range equals clamping the normalized value to 0.0-1.0
+        gain = (max_b - min_b) / cam_range
+        offset = min_b - effective_min * gain
+        # Output bounds (an override may put min above max; the old mapping stayed between them)
+        low = min(min_b, max_b)
+        high = max(min_b, max_b)
+
+        def map_ambient_to_user_brightness(ambient: float) -> float:
+            return max(low, min(high, gain * ambient + offset))
+
+        self._map_ambient_to_user_brightness = map_ambient_to_user_brightness
 
     def _on_ambient_light_error(self, error_code: str):
         """Handle ambient light monitor errors."""
-        if self._auto_brightness_verbose:
+        if _AUTO_BRIGHTNESS_VERBOSE:
             print(f"[AutoBrightness] Error: {error_code}", file=sys.stderr, flush=True)
         
         # Non-recoverable errors - disable immediately
@@ -558,7 +546,7 @@ class BrightnessManager(QObject):
         self._reconnect_attempts += 1
         
         if self._reconnect_attempts > self._max_reconnect_attempts:
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print(f"[AutoBrightness] Max reconnect attempts ({self._max_reconnect_attempts}) reached, disabling auto-brightness", file=sys.stderr, flush=True)
             self._stop_reconnect_timer()
             self._reconnect_attempts = 0
@@ -566,19 +554,16 @@ class BrightnessManager(QObject):
             self.error_occurred.emit(f"Auto-brightness disabled after {self._max_reconnect_attempts} failed reconnection attempts")
             return
         
-        if self._auto_brightness_verbose:
-            print(f"[AutoBrightness] Reconnect attempt {self._reconnect_attempts}/{self._max_reconnect_attempts} scheduled in {self._reconnect_interval_ms // 1000}s", file=sys.stderr, flush=True)
+        # Exponential backoff: quick retries for a transient unplug, slower ones for a dead camera
+        delay_ms = min(self._reconnect_max_interval_ms, 1000 << (self._reconnect_attempts - 1))
+        if _AUTO_BRIGHTNESS_VERBOSE:
+            print(f"[AutoBrightness] Reconnect attempt {self._reconnect_attempts}/{self._max_reconnect_attempts} scheduled in {delay_ms // 1000}s", file=sys.stderr, flush=True)
         
         # Teardown current monitor
         self._teardown_ambient_monitor()
         
         # Schedule reconnect attempt
-        if self._reconnect_timer is None:
-            self._reconnect_timer = QTimer(self)
-            self._reconnect_timer.setSingleShot(True)
-            self._reconnect_timer.timeout.connect(self._do_camera_reconnect)
-        
-        self._reconnect_timer.start(self._reconnect_interval_ms)
+        self._reconnect_timer.start(delay_ms)
 
     def _do_camera_reconnect(self):
         """Execute camera reconnection attempt."""
@@ -587,7 +572,7 @@ class BrightnessManager(QObject):
             self._reconnect_attempts = 0
             return
         
-        if self._auto_brightness_verbose:
+        if _AUTO_BRIGHTNESS_VERBOSE:
             print(f"[AutoBrightness] Attempting camera reconnection ({self._reconnect_attempts}/{self._max_reconnect_attempts})...", file=sys.stderr, flush=True)
         
         # Start new monitor
@@ -604,20 +589,17 @@ class BrightnessManager(QObject):
         
         # Reset smoothing state
         self._auto_brightness_smoothed = self._current_display_brightness
-        self._ambient_brightness_buffer.clear()
+        self._ambient_ema = None
         self._auto_brightness_has_sample = False
 
     def _stop_reconnect_timer(self):
-        """Stop and cleanup reconnect timer."""
-        if self._reconnect_timer:
-            self._reconnect_timer.stop()
-            self._reconnect_timer.deleteLater()
-            self._reconnect_timer = None
+        """Cancel a scheduled reconnect attempt."""
+        self._reconnect_timer.stop()
 
     def _on_camera_connected_successfully(self):
         """Reset reconnect counter on successful brightness measurement."""
         if self._reconnect_attempts > 0:
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print(f"[AutoBrightness] Camera reconnected successfully after {self._reconnect_attempts} attempt(s)", file=sys.stderr, flush=True)
             self._reconnect_attempts = 0
 
@@ -625,7 +607,7 @@ class BrightnessManager(QObject):
         """Handle camera index resolution."""
         if self._auto_brightness_camera_index != index:
             self._auto_brightness_camera_index = index
-            if self._auto_brightness_verbose:
+            if _AUTO_BRIGHTNESS_VERBOSE:
                 print(f"[AutoBrightness] Camera index updated to {index}", file=sys.stderr, flush=True)
 
     def _apply_brightness(self, value: float, *, from_auto: bool, animate: bool = True):
@@ -639,35 +621,79 @@ class BrightnessManager(QObject):
             if self._auto_brightness_enabled:
                 self.set_auto_brightness_enabled(False, user_triggered=True)
         
-        if not animate:
-            if self._brightness_animation.state() == QPropertyAnimation.State.Running:
-                self._brightness_animation.stop()
+        # A step too small to see fade through is applied at once
+        if not animate or abs(value - self._current_display_brightness) < 0.02:
+            self._anim_timer.stop()
             self._apply_brightness_direct(value)
             return
 
-        # Animate change
-        if self._brightness_animation.state() == QPropertyAnimation.State.Running:
-            self._brightness_animation.stop()
-            
-        self._brightness_animation.setStartValue(self._current_display_brightness)
-        self._brightness_animation.setEndValue(value)
-        self._brightness_animation.start()
+        # Already fading to this target: let it finish instead of restarting the 0.8 s curve
+        if self._anim_timer.isActive() and value == self._anim_end_value:
+            return
+
+        # Animate change (restarts from the currently displayed value)
+        self._anim_start_value = self._current_display_brightness
+        self._anim_end_value = value
+        self._anim_start_time = time.monotonic()
+        self._anim_timer.start()
 
     def _apply_brightness_direct(self, value: float):
         """Directly apply brightness without animation (called by animation)."""
         self._current_display_brightness = value
+
+        # Raw sysfs level this value maps to; computed once and written as-is below
+        # (-1 without a backlight device, which matches the initial "nothing written" level)
+        int_level = -1
+        if self._system_backlight:
+            int_level = self._system_backlight.raw_for_level(max(0.15, value))
+        brightness_moved = abs(self._cached_brightness - value) > 0.001
+        if int_level == self._last_written_int_level:
+            self._pending_backlight = None  # back at the written level: drop any trailing write
+            if not brightness_moved:
+                return  # neither the UI nor the backlight would change
         
         # Update cache only if changed significantly (reduces UI invalidations)
-        if abs(self._cached_brightness - value) > 0.001:
+        if brightness_moved:
             self._cached_brightness = value
-            # Emit signal for UI updates only when brightness actually changes
-            self.brightness_changed.emit(value)
-        
-        # Apply to system backlight
-        self._apply_system_backlight(value)
+            # Emit signal for UI updates only when brightness actually changes,
+            # at most once per _emit_timer interval with the latest value
+            self._pending_emit_value = value
+            if not self._emit_timer.isActive():
+                self._emit_timer.start()
+        
+        # Apply to system backlight: write now, then at most once per _backlight_write_timer
+        # interval; values arriving in between collapse into one trailing write of the latest
+        if int_level != self._last_written_int_level:
+            if self._backlight_write_timer.isActive():
+                self._pending_backlight = (value, int_level)
+            else:
+                self._write_backlight(value, int_level)
+
+    def _write_backlight(self, value: float, int_level: int):
+        """Write a backlight level and open the next rate-limit window."""
+        # Recorded even if the write failed: retrying the same level every tick won't fix a
+        # driver that refused it, the next distinct level gets a fresh attempt
+        self._apply_system_backlight(value, int_level)
+        self._last_written_int_level = int_level
+        self._backlight_write_timer.start()
+
+    def _flush_pending_backlight(self):
+        """Rate-limit window elapsed: write the latest level that arrived during it."""
+        pending = self._pending_backlight
+        self._pending_backlight = None
+        if pending is not None and pending[1] != self._last_written_int_level:
+            self._write_backlight(*pending)
+
+    def _flush_brightness_emit(self):
+        """Emit the latest brightness coalesced by _apply_brightness_direct."""
+        value = self._pending_emit_value
+        if value is None:
+            return
+        self._pending_emit_value = None
+        self.brightness_changed.emit(value)
 
-    def _apply_system_backlight(self, value: float):
-        """Apply brightness to system backlight controller."""
+    def _apply_system_backlight(self, value: float, raw_level: int):
+        """Write ``raw_level`` (the device value for ``value``) to the system backlight."""
         if not self._system_backlight:
             return
             
@@ -678,17 +704,15 @@ class BrightnessManager(QObject):
             backlight_value = max(0.15, value)
             
             # Log if changed significantly
-            if (self._system_backlight_last_ui_log is None or 
-                abs(self._system_backlight_last_ui_log - value) > 0.05):
-                if self._system_backlight_verbose:
-                    print(f"[Backlight] Setting system brightness: {value:.2f} -> {backlight_value:.2f}", file=sys.stderr, flush=True)
+            if _SYSTEM_BACKLIGHT_VERBOSE and abs(self._system_backlight_last_ui_log - value) > 0.05:
+                print(f"[Backlight] Setting system brightness: {value:.2f} -> {backlight_value:.2f}", file=sys.stderr, flush=True)
                 self._system_backlight_last_ui_log = value
                 
-            # Use set_level() which accepts 0.0-1.0 and handles conversion internally
-            self._system_backlight.set_level(backlight_value)
+            # The raw level was already derived from backlight_value; skip set_level()'s conversion
+            self._system_backlight.set_raw(raw_level)
             
         except Exception as e:
-            if self._system_backlight_verbose:
+            if _SYSTEM_BACKLIGHT_VERBOSE:
                 print(f"[Backlight] Error setting brightness: {e}", file=sys.stderr, flush=True)
 
     def get_brightness(self) -> float:
@@ -709,3 +733,11 @@ class BrightnessManager(QObject):
         self._stop_reconnect_timer()
         # Stop ambient light monitor
         self._teardown_ambient_monitor()
+        # Stop fade ticks and trailing writes first, or they would reopen the sysfs node
+        self._anim_timer.stop()
+        self._emit_timer.stop()
+        self._backlight_write_timer.stop()
+        self._pending_backlight = None
+        # Release the backlight's sysfs file descriptor
+        if self._system_backlight:
+            self._system_backlight.close()
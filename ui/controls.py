@@ -11,10 +11,10 @@ class ModernColorButton(QPushButton):
     """Color selector button with color picker dialog.
     
     Attributes:
-        color_changed: Signal emitted when color is changed
+        color_changed: Signal emitted with the new color as an unsigned ARGB integer
     """
 
-    color_changed = pyqtSignal(QColor)
+    color_changed = pyqtSignal('quint32')  # unsigned: opaque ARGB values exceed INT_MAX
 
     def __init__(self, color: QColor, button_type: str = "normal", size: int = 24) -> None:
         """Initialize color button.
@@ -54,7 +54,7 @@ class ModernColorButton(QPushButton):
             if color.isValid():
                 self.current_color = color
                 self.update_style()
-                self.color_changed.emit(self.current_color)
+                self.color_changed.emit(self.current_color.rgba())
         super().mousePressEvent(event)
 
     def update_style(self) -> None:
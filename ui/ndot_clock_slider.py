@@ -1,17 +1,24 @@
 """Main UI slider implementation for Ndot Clock."""
 
+from __future__ import annotations
+
 import json
+import logging
 import math
 import os
 import sys
 import time
 import webbrowser
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
+from PyQt6 import sip
 from PyQt6.QtCore import (
     QEvent,
     QEasingCurve,
+    QLineF,
     QPropertyAnimation,
     QRect,
     QRectF,
@@ -30,6 +37,7 @@ from PyQt6.QtGui import (
     QFontDatabase,
     QFontMetrics,
     QIcon,
+    QImage,
     QLinearGradient,
     QMouseEvent,
     QPainter,
@@ -39,11 +47,12 @@ from PyQt6.QtGui import (
     QPixmap,
     QRadialGradient,
     QRegion,
+    QStaticText,
+    QTextOption,
+    QTransform,
 )
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -77,20 +86,97 @@ from logic import (
     SystemBacklightController,
     UpdateChecker,
 )
-from ui.animations import AnimatedPanel, AnimatedSlideContainer, SlideType
+from ui.animations import AnimatedPanel, AnimatedSlideContainer, SlideType, WeatherSlideData
 from ui.controls import ModernColorButton, ModernSlider
 from ui.popups import ConfirmationPopup, DownloadProgressPopup, NotificationPopup, WiFiPopup, TextInputPopup
 from ui.brightness import BrightnessManager
 from ui.webviews import WebviewManager
+
 from ui.settings_manager import SettingsManager
 from ui.task_queue import TaskQueue
 
+if TYPE_CHECKING:
+    from PyQt6.QtWebEngineWidgets import QWebEngineView  # imported lazily by ui.webengine
+
+logger = logging.getLogger(__name__)
+
+# Enum members used on per-tick / per-event paths, resolved once at import
+_ANIM_RUNNING = QPropertyAnimation.State.Running
+_EVT_MOUSE_PRESS = QEvent.Type.MouseButtonPress
+_EVT_MOUSE_MOVE = QEvent.Type.MouseMove
+_EVT_MOUSE_RELEASE = QEvent.Type.MouseButtonRelease
+_WA_TRANSPARENT_FOR_MOUSE = Qt.WidgetAttribute.WA_TransparentForMouseEvents
+_RH_ANTIALIASING = QPainter.RenderHint.Antialiasing
+_RH_SMOOTH_PIXMAP = QPainter.RenderHint.SmoothPixmapTransform
+_TRANSPARENT = Qt.GlobalColor.transparent
+_NO_PEN = Qt.PenStyle.NoPen
+
+# Edit-mode card drag handle fills
+_DRAG_HANDLE_COLOR = QColor(255, 255, 255, 60)
+_DRAG_HANDLE_DOT_COLOR = QColor(255, 255, 255, 170)
+
+# Rendering brightness is quantized to this many steps so slider drags and
+# auto-brightness ramps only rebuild colour/pixmap caches on a visible change
+_BRIGHTNESS_BUCKETS = 32
+
+# Webview events the swipe filter acts on; everything else returns immediately
+_WEBVIEW_SWIPE_EVENTS = frozenset({_EVT_MOUSE_PRESS, _EVT_MOUSE_MOVE, _EVT_MOUSE_RELEASE})
+
+
+@lru_cache(maxsize=300)  # LRU limit - increased for better ARM performance
+def _build_glow_dot_pixmap(radius: int, r: int, g: int, b: int, brightness: float) -> QPixmap:
+    """Render a glowing dot (halo + matte core, матовый вид) into a transparent pixmap"""
+    is_red = r > max(g, b) * 1.2
+
+    # Calculate maximum size needed for pixmap
+    if brightness > 0.3:
+        halo_radius = radius * 2.0 if is_red else radius * 1.6
+    else:
+        halo_radius = radius
+
+    pixmap_size = int(halo_radius * 2.5)  # Extra padding for smooth edges
+    pixmap = QPixmap(pixmap_size, pixmap_size)
+    pixmap.fill(_TRANSPARENT)
+
+    pix_painter = QPainter(pixmap)
+    pix_painter.setRenderHint(_RH_ANTIALIASING, True)
+    pix_painter.setRenderHint(_RH_SMOOTH_PIXMAP, True)
+    pix_painter.setPen(_NO_PEN)
+
+    center = QPointF(pixmap_size / 2, pixmap_size / 2)
+    base_color = QColor(r, g, b, int(235 * brightness))
+
+    # Halo
+    if brightness > 0.3:
+        if is_red:
+            halo_alpha = int(180 * brightness)
+        else:
+            halo_alpha = int(120 * brightness * 0.7)
+
+        halo_gradient = QRadialGradient(center, halo_radius)
+        glow_color = QColor(base_color)
+        glow_color.setAlpha(halo_alpha)
+        halo_gradient.setColorAt(0.0, glow_color)
+        glow_color.setAlpha(0)
+        halo_gradient.setColorAt(1.0, glow_color)
+
+        pix_painter.setBrush(halo_gradient)
+        pix_painter.drawEllipse(center, halo_radius, halo_radius)
+
+    # Main circle - матовый вид без глянцевого highlight
+    inner_radius = radius * 0.9 if is_red else radius * 0.82
+    pix_painter.setBrush(base_color)
+    pix_painter.drawEllipse(center, inner_radius, inner_radius)
+
+    pix_painter.end()
+    return pixmap
+
 
 class BrightnessOverlay(QWidget):
     """Transparent overlay for software brightness control."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(_WA_TRANSPARENT_FOR_MOUSE)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self._opacity = 0.0
         self.hide()
@@ -152,6 +238,48 @@ class NDotClockSlider(QWidget):
     MONTHS = MONTHS_MAP
     TRANSLATIONS = TRANSLATIONS_MAP
 
+    # WMO weather code -> localized description (read on every weather paint)
+    _WEATHER_CODE_DESCRIPTIONS = {
+        0: {"RU": "Ясно", "EN": "Clear", "UA": "Ясно"},
+        1: {"RU": "Преимущественно ясно", "EN": "Mainly clear", "UA": "Переважно ясно"},
+        2: {"RU": "Переменная облачность", "EN": "Partly cloudy", "UA": "Мінлива хмарність"},
+        3: {"RU": "Пасмурно", "EN": "Overcast", "UA": "Похмуро"},
+        45: {"RU": "Туман", "EN": "Fog", "UA": "Туман"},
+        48: {"RU": "Изморозь", "EN": "Depositing rime fog", "UA": "Паморозь"},
+        51: {"RU": "Легкая морось", "EN": "Light drizzle", "UA": "Легка мряка"},
+        53: {"RU": "Морось", "EN": "Moderate drizzle", "UA": "Мряка"},
+        55: {"RU": "Сильная морось", "EN": "Dense drizzle", "UA": "Сильна мряка"},
+        56: {"RU": "Ледяная морось", "EN": "Light freezing drizzle", "UA": "Крижана мряка"},
+        57: {"RU": "Сильная ледяная морось", "EN": "Dense freezing drizzle", "UA": "Сильна крижана мряка"},
+        61: {"RU": "Небольшой дождь", "EN": "Light rain", "UA": "Невеликий дощ"},
+        63: {"RU": "Дождь", "EN": "Rain", "UA": "Дощ"},
+        65: {"RU": "Сильный дождь", "EN": "Heavy rain", "UA": "Сильний дощ"},
+        66: {"RU": "Ледяной дождь", "EN": "Light freezing rain", "UA": "Крижаний дощ"},
+        67: {"RU": "Сильный ледяной дождь", "EN": "Heavy freezing rain", "UA": "Сильний крижаний дощ"},
+        71: {"RU": "Небольшой снег", "EN": "Light snow", "UA": "Невеликий сніг"},
+        73: {"RU": "Снег", "EN": "Snow", "UA": "Сніг"},
+        75: {"RU": "Сильный снег", "EN": "Heavy snow", "UA": "Сильний сніг"},
+        77: {"RU": "Снежные зерна", "EN": "Snow grains", "UA": "Снігові зерна"},
+        80: {"RU": "Легкий ливень", "EN": "Light rain showers", "UA": "Легкий злива"},
+        81: {"RU": "Ливень", "EN": "Rain showers", "UA": "Злива"},
+        82: {"RU": "Сильный ливень", "EN": "Heavy rain showers", "UA": "Сильна злива"},
+        85: {"RU": "Снег с дождем", "EN": "Light snow showers", "UA": "Сніг з дощем"},
+        86: {"RU": "Сильный снег с дождем", "EN": "Heavy snow showers", "UA": "Сильний сніг з дощем"},
+        95: {"RU": "Гроза", "EN": "Thunderstorm", "UA": "Гроза"},
+        96: {"RU": "Гроза с градом", "EN": "Thunderstorm with slight hail", "UA": "Гроза з градом"},
+        99: {"RU": "Гроза с сильным градом", "EN": "Thunderstorm with heavy hail", "UA": "Гроза з сильним градом"},
+    }
+    _WEATHER_UNKNOWN_DESCRIPTION = {"RU": "Неизвестно", "EN": "Unknown", "UA": "Невідомо"}
+
+    # WMO weather code groups used to pick the icon
+    _WEATHER_CLEAR_CODES = frozenset({0, 1})
+    _WEATHER_CLOUDY_CODES = frozenset({3, 45, 48})
+    _WEATHER_RAIN_CODES = frozenset({51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82})
+    _WEATHER_SNOW_CODES = frozenset({71, 73, 75, 77, 85, 86})
+    _WEATHER_STORM_CODES = frozenset({95, 96, 99})
+
+    _COLON_BREATHING_LEVELS = 16  # distinct colon intensities (and glow pixmaps) per breathing cycle
+
     def __init__(self):
         super().__init__()
 
@@ -179,7 +307,9 @@ class NDotClockSlider(QWidget):
         self._background_color = settings['background_color']
         self._colon_color = settings['colon_color']
         self.current_language = settings['language']
+        self._refresh_date_tables()
         self.slides = settings['slides']
+        self._slide_index_by_type: Dict[SlideType, int] = {}  # filled by _ensure_slide_order
         self._ensure_slide_order()  # Ensure CLOCK first, ADD last
         self.location_lat = settings['location']['lat']
         self.location_lon = settings['location']['lon']
@@ -197,12 +327,14 @@ class NDotClockSlider(QWidget):
 
         # Initialize Webview Manager
         self.scale_factor = 1.0  # ensure available for dependent components
-        self.webview_manager = WebviewManager(self)
+        self._rebuild_scaled_sizes()
+        self.webview_manager = WebviewManager(self, cache_to_disk=settings['webview_cache_to_disk'])
         
         # Initialize Task Queue for lazy initialization
         self.task_queue = TaskQueue(self)
         
         # Derived settings
+        self._brightness_bucket: Optional[float] = None  # last bucket _update_cached_colors ran with
         self._digit_color_scaled = QColor(self._digit_color)
         self._colon_color_scaled = QColor(self._colon_color)
         self._date_color = QColor(self._digit_color)
@@ -211,6 +343,25 @@ class NDotClockSlider(QWidget):
         # Fix: Add LRU limit to prevent memory leak
         self._dot_pixmap_cache: Dict[Tuple[int, int, bool], QPixmap] = {}
         self._dot_pixmap_cache_max_size = 200  # LRU limit for dot patterns
+        # Whole-digit glyphs composed from a dot pixmap; cleared together with _dot_pixmap_cache
+        self._digit_glyph_cache: Dict[Tuple[str, int], QPixmap] = {}
+        # (key, pixmap) of the static clock face (digits + date) for the current minute
+        self._clock_face_cache: Optional[Tuple[tuple, QPixmap]] = None
+        # Rendered content of unfocused edit-mode cards, keyed by _edit_card_content_key
+        self._edit_card_cache: Dict[tuple, QPixmap] = {}
+        self._edit_card_cache_max_size = 12
+        # Drag-handle (pill, dots) paths in handle-local coordinates, keyed by handle size
+        self._drag_handle_path_cache: Dict[Tuple[int, int], Tuple[QPainterPath, QPainterPath]] = {}
+        # Fullscreen-button icon pens keyed by pen width; reset with the cached edit colours
+        self._pen_icon_cache: Dict[int, QPen] = {}
+        # Edit-mode language/update/autostart/WiFi buttons, keyed by text, size and colours
+        self._control_button_cache: Dict[tuple, QPixmap] = {}
+        self._control_button_cache_max_size = 16
+        # (key, active, inactive) navigation dot pixmaps shared by both dot strips
+        self._nav_dot_pixmaps: Optional[Tuple[tuple, QPixmap, QPixmap]] = None
+        # Edit-mode hint text layout, keyed by (text, QFont.key())
+        self._hint_static: Optional[QStaticText] = None
+        self._hint_static_key: Optional[tuple] = None
         
         # UI Setup
         self.setWindowTitle("Ndot Clock")
@@ -242,14 +393,23 @@ class NDotClockSlider(QWidget):
             intensity = t_val * t_val * (3 - 2 * t_val)  # Smoothstep
             self._breathing_lookup.append(intensity)
         self._breathing_frame = 0  # Current frame in breathing cycle
+        # Per-frame colon glow pixmaps, rebuilt lazily by _rebuild_colon_breathing_cache
+        self._colon_breathing_pixmaps: Optional[List[QPixmap]] = None
 
-        # ARM optimization: Cache for complete gradient dots (including halo) - матовый вид
-        self._glow_dot_cache: Dict[Tuple[int, int, int, int], QPixmap] = {}  # (radius, r, g, b) -> pixmap
-        self._glow_dot_cache_max_size = 300  # LRU limit - increased for better ARM performance
+        # Complete gradient dots (including halo) are cached by _build_glow_dot_pixmap
 
         # ARM optimization: SVG weather icon pixmap cache
-        self._svg_weather_cache: Dict[Tuple[int, int, int], QPixmap] = {}  # (code, is_day, size) -> pixmap
+        self._svg_weather_cache: Dict[Tuple[str, int], QPixmap] = {}  # (icon path, size) -> pixmap
+        self._webview_icon_cache: Dict[tuple, QPixmap] = {}  # webview slide glyph icons
+        self._webview_title_static_cache: Dict[tuple, QStaticText] = {}  # (title, font key, width)
+        # Re-rasterize the icons at the new size once a resize settles
+        self._icon_prewarm_timer = QTimer(self)
+        self._icon_prewarm_timer.setSingleShot(True)
+        self._icon_prewarm_timer.setInterval(250)
+        self._icon_prewarm_timer.timeout.connect(self._prewarm_svg_icons)
         self._svg_weather_cache_max_size = 20  # Max 20 different weather icons
+        self._available_icons: Optional[Set[str]] = None  # resources/ listing, read once
+        self._icon_path_cache: Dict[Tuple[int, int], Optional[str]] = {}  # (code, is_day) -> path
 
         # Fix: Prevent webview fade animation memory leak
         self._webview_fade_animations = []
@@ -267,6 +427,7 @@ class NDotClockSlider(QWidget):
         self.current_slide = 0
         self.edit_mode = False
         self._edit_transition_active = False
+        self._paint_impl = self._paint_normal  # swapped in enter_edit_mode/exit_edit_mode
         self._active_edit_animations: Set[QPropertyAnimation] = set()
         self.card_edit_mode = False
         self.current_edit_index: Optional[int] = None
@@ -275,7 +436,12 @@ class NDotClockSlider(QWidget):
         self.breathing_time = 0.0
         self.breathing_speed = 0.01
         self._last_update_second = -1  # Track last second for time change detection
+        self._last_update_minute = -1  # Minute of day; the clock face only changes per minute
+        self._colon_update_rect: Optional[QRect] = None  # Breathing-colon repaint area (clock slide)
+        self._digit_update_rects: List[QRect] = []  # Per-digit repaint areas for digit fades
         self._timer_interval_state = 'normal'  # Track timer interval state
+        self._idle_ticks = 0  # Consecutive idle ticks before entering deep idle
+        self._prev_animation_active = False
         self.nav_hidden = False
         self.nav_hide_timer = QTimer(self)
         self.nav_hide_timer.timeout.connect(self.hide_navigation)
@@ -305,7 +471,11 @@ class NDotClockSlider(QWidget):
         self._webview_mouse_start: Optional[QPoint] = None  # Track mouse start position for swipe detection
         self._active_webview_for_swipe: Optional[QWebEngineView] = None  # Currently swiped webview
         self._active_webview_type: Optional[SlideType] = None
+        self._last_webview_geom = QRect()  # Last geometry pushed by update_webview_geometry
         self._webview_was_transparent = False
+        # Arguments for deferred single-shot slots (read by bound methods, no closures)
+        self._pending_restore_webview: Optional[QWebEngineView] = None
+        self._pending_webview_url = ""
         self._youtube_page_loaded = False  # Track if YouTube page finished loading
         self._home_assistant_page_loaded = False  # Track if Home Assistant page finished loading
         # YouTube state
@@ -353,6 +523,12 @@ class NDotClockSlider(QWidget):
         # Fix: Add timeout detection for webview load hangs
         self._webview_load_timeouts = {'youtube': False, 'home_assistant': False}
         self._language_control_layout = None  # исправлено: переиспользуем геометрию кнопок языка
+        self._edit_card_geom_dirty = True  # edit-mode card geometry/pens, rebuilt on resize
+        self._cached_date_key = None  # (year, month, day, language) of _cached_date_str
+        self._cached_date_str = ""
+        self._cached_date_layout_key = None  # font/geometry inputs of _cached_date_font/_cached_date_rect
+        self._cached_date_font: Optional[QFont] = None
+        self._cached_date_rect: Optional[QRect] = None
         self._is_new_card = False  # Track if we are creating a new card to handle cancel correctly
         
         # Animation container
@@ -387,13 +563,15 @@ class NDotClockSlider(QWidget):
         self.location_loading = False
 
         # Fix: Cache QFont objects for performance (ARM optimization) with LRU limits
-        self._font_cache: Dict[Tuple[str, int], QFont] = {}
+        self._font_cache: Dict[Tuple[str, int, Optional[QFont.Weight]], QFont] = {}
         self._font_cache_max_size = 50  # LRU limit to prevent unbounded growth
-        self._fontmetrics_cache: Dict[Tuple[str, int], QFontMetrics] = {}
+        self._fontmetrics_cache: Dict[Tuple[str, int], Tuple[QFont, QFontMetrics]] = {}
         self._fontmetrics_cache_max_size = 50
 
         # Edit panel
         self.edit_panel = None
+        # Built editor panels kept for reuse, keyed by (panel_type, scale_factor, language)
+        self._panel_pool: Dict[Tuple[str, float, str], AnimatedPanel] = {}
         self.panel_animation = None
         self.panel_opacity_animation = None
         self.panel_scale_animation = None
@@ -429,21 +607,12 @@ class NDotClockSlider(QWidget):
                 del self._initial_settings
         
         self.task_queue.add_task(init_brightness, "Init Brightness", delay_ms=100)
+        self.task_queue.add_task(self._prewarm_svg_icons, "Prewarm Weather Icons", delay_ms=300)
 
-        # 2. Preload webviews (staggered)
-        # We add each webview load as a separate task with delay
-        for i, slide in enumerate(self.slides):
-            if slide['type'] == SlideType.WEBVIEW:
-                url = slide['data'].get('url')
-                if url:
-                    # Use a factory function to capture the variable properly
-                    def load_webview_task(u=url):
-                        self.webview_manager.load_url(u)
-                    
-                    # 800ms delay between heavy webview loads
-                    self.task_queue.add_task(load_webview_task, f"Load Webview {i}", delay_ms=800)
-        
-        # 3. Fetch location (for timezone sync) and weather
+        # Webviews are not preloaded: each QWebEngineView is created by
+        # update_active_webviews() the first time its slide becomes visible.
+
+        # 2. Fetch location (for timezone sync) and weather
         # Always fetch location at startup to sync timezone
         self.task_queue.add_task(self.fetch_location, "Fetch Location", delay_ms=1500)
         
@@ -461,7 +630,10 @@ class NDotClockSlider(QWidget):
 
     def _on_brightness_changed(self, value: float):
         """Handle brightness change signal."""
-        self._update_cached_colors()
+        # Cached colours only depend on the bucketed rendering brightness
+        bucket_changed = self._brightness_bucket_of(self.effective_brightness) != self._brightness_bucket
+        if bucket_changed:
+            self._update_cached_colors()
         
         # Update software overlay if no system backlight
         if not self.brightness_manager.has_system_backlight:
@@ -473,7 +645,8 @@ class NDotClockSlider(QWidget):
         else:
             self.brightness_overlay.hide()
             
-        self.update()
+        if bucket_changed:
+            self.update()
         
         # Sync slider if needed (without signaling)
         if self.brightness_slider:
@@ -506,6 +679,20 @@ class NDotClockSlider(QWidget):
             "8": [[1,1,1], [1,0,1], [1,1,1], [1,0,1], [1,1,1]],
             "9": [[1,1,1], [1,0,1], [1,1,1], [0,0,1], [1,1,1]],
         }
+        # Lit (col, row) cells per digit; scaled to pixel offsets in _rebuild_digit_offsets
+        self._digit_on_cells = {
+            digit: [(col, row) for row in range(5) for col in range(3) if pattern[row][col]]
+            for digit, pattern in self.digit_patterns.items()
+        }
+        self._digit_on_offsets: Dict[str, List[Tuple[int, int]]] = {}
+
+    def _rebuild_digit_offsets(self):
+        """Scale the lit digit cells by the current dot spacing (on layout change)."""
+        spacing = self.dot_spacing
+        self._digit_on_offsets = {
+            digit: [(col * spacing, row * spacing) for col, row in cells]
+            for digit, cells in self._digit_on_cells.items()
+        }
 
     def update_scale_factor(self):
         """Update scaling factor based on window size - optimized for 800x480"""
@@ -522,7 +709,14 @@ class NDotClockSlider(QWidget):
         else:
             # For larger screens, scale normally
             self.scale_factor = raw_scale
+        self._rebuild_scaled_sizes()
+        self.webview_manager.set_scale_factor(self.scale_factor)
+        if self._panel_pool and any(key[1] != self.scale_factor for key in self._panel_pool):
+            self._evict_panel_pool()
         self._language_control_layout = None  # исправлено: принудительно пересчитываем геометрию кнопок при смене масштаба
+        self._edit_card_geom_dirty = True
+        self._edit_card_cache.clear()
+        self._control_button_cache.clear()
 
     def get_scaled_font_size(self, base_size: int) -> int:
         """Get scaled font size based on current scale factor"""
@@ -540,6 +734,63 @@ class NDotClockSlider(QWidget):
             min_spacing = max(2, base_800x480 - 4)
         return max(min_spacing, int(base_800x480 * self.scale_factor))
 
+    def _rebuild_scaled_sizes(self):
+        """Precompute the UI sizes/spacings the settings panels and overlays use most (on scale change)."""
+        scale = self.scale_factor
+        self._sized = SimpleNamespace(
+            ui_12_10=self.get_ui_size(12, 10),
+            ui_8_6=self.get_ui_size(8, 6),
+            ui_32_26=self.get_ui_size(32, 26),
+            ui_75_60=self.get_ui_size(75, 60),
+            ui_16_12=self.get_ui_size(16, 12),
+            sp_4_2=self.get_spacing(4, 2),
+            sp_8_6=self.get_spacing(8, 6),
+            sp_8_5=self.get_spacing(8, 5),
+            sp_8_4=self.get_spacing(8, 4),
+            sp_12_8=self.get_spacing(12, 8),
+            sp_6_3=self.get_spacing(6, 3),
+            sp_10_6=self.get_spacing(10, 6),
+            # Paint-path metrics for the navigation dots and edit-mode overlay
+            nav_dot_w=int(22 * scale),
+            nav_dot_h=int(6 * scale),
+            nav_dot_gap=int(12 * scale),
+            nav_dots_bottom=int(42 * scale),
+            edit_dots_bottom=int(76 * scale),
+            fs_button=int(40 * scale),
+            fs_margin=int(20 * scale),
+            fs_icon_pad=int(10 * scale),
+            fs_pen_w=max(2, int(2 * scale)),
+            hint_font=max(10, int(12 * scale)),
+            hint_top=int(26 * scale),
+        )
+        sized = self._sized
+        fs_icon_size = sized.fs_button - 2 * sized.fs_icon_pad
+        sized.fs_lines_exit = self._fullscreen_icon_lines(fs_icon_size, inward=True)
+        sized.fs_lines_enter = self._fullscreen_icon_lines(fs_icon_size, inward=False)
+
+    @staticmethod
+    def _fullscreen_icon_lines(icon_size: int, inward: bool) -> List[QLineF]:
+        """Corner strokes of the fullscreen toggle icon, relative to the icon's top-left"""
+        corner = icon_size // 3
+        far = icon_size
+        if inward:
+            # "Exit fullscreen" icon (arrows pointing inward)
+            points = (
+                (corner, 0, 0, 0), (0, 0, 0, corner),
+                (far - corner, 0, far, 0), (far, 0, far, corner),
+                (0, far - corner, 0, far), (0, far, corner, far),
+                (far, far - corner, far, far), (far - corner, far, far, far),
+            )
+        else:
+            # "Enter fullscreen" icon (arrows pointing outward)
+            points = (
+                (0, corner, 0, 0), (0, 0, corner, 0),
+                (far, corner, far, 0), (far, 0, far - corner, 0),
+                (0, far - corner, 0, far), (0, far, corner, far),
+                (far, far - corner, far, far), (far, far, far - corner, far),
+            )
+        return [QLineF(x1, y1, x2, y2) for x1, y1, x2, y2 in points]
+
     def calculate_display_parameters(self):
         """Calculate dot sizes based on window size with division by zero protection"""
         canvas_width = max(1, self.width())
@@ -584,7 +835,37 @@ class NDotClockSlider(QWidget):
         self.time_top_margin = max((canvas_height - total_clock_date_height) // 2, 0)
         self.time_start_y = self.time_top_margin + self.dot_size // 2
         self.colon_center_y = self.time_start_y + 2 * self.dot_spacing
+        # Same x walk as draw_clock_slide: two digits, one inter-digit gap, half the colon gap
+        colon_center_x = (self.clock_left_margin + 2 * self.digit_actual_width
+                          + self.inter_digit_spacing + self.colon_gap / 2)
+        self._colon_center_x = colon_center_x
+        self._clock_face_cache = None
+        colon_half = int(self.dot_size * 1.5) + 2  # glow pixmap is ~2.5 radii each side
+        colon_offset = int(self.dot_spacing * 0.85)
+        self._colon_update_rect = QRect(
+            int(colon_center_x) - colon_half,
+            self.colon_center_y - colon_offset - colon_half,
+            2 * colon_half,
+            2 * (colon_offset + colon_half),
+        )
+        # Dot pixmaps pad the dot with max(6, 1.5 * radius) of halo on every side
+        dot_half = int(self.dot_size * 1.25) + 8
+        digit_rects = []
+        digit_left = self.clock_left_margin + self.dot_size / 2
+        for index in range(4):
+            digit_rects.append(QRect(
+                int(digit_left) - dot_half,
+                self.time_start_y - dot_half,
+                2 * self.dot_spacing + 2 * dot_half,
+                4 * self.dot_spacing + 2 * dot_half,
+            ))
+            digit_left += self.digit_actual_width
+            digit_left += self.colon_gap if index == 1 else self.inter_digit_spacing
+        self._digit_update_rects = digit_rects
+        self._rebuild_digit_offsets()
+        self._colon_breathing_pixmaps = None
         self._dot_pixmap_cache.clear()
+        self._digit_glyph_cache.clear()
 
     def _tr(self, key: str, **kwargs) -> str:
         lang_map = self.TRANSLATIONS.get(self.current_language)
@@ -618,7 +899,51 @@ class NDotClockSlider(QWidget):
     def _clear_i18n_widgets(self):
         self._i18n_widgets.clear()
 
+    def _release_edit_panel(self):
+        """Drop the current edit panel, hiding pooled panels instead of deleting them."""
+        panel = self.edit_panel
+        if panel is None:
+            return
+        self.edit_panel = None
+        if any(pooled is panel for pooled in self._panel_pool.values()):
+            panel.hide()
+        else:
+            panel.deleteLater()
+
+    def _evict_panel_pool(self):
+        """Delete pooled panels (used on scale or language change)."""
+        for panel in self._panel_pool.values():
+            if panel is not self.edit_panel:
+                panel.deleteLater()
+        self._panel_pool.clear()
+
+    def _reuse_pooled_panel(self, key: Tuple[str, float, str], width_ratio: float,
+                            height_ratio: float) -> bool:
+        """Re-show a pooled panel for ``key``; returns False if none is cached."""
+        panel = self._panel_pool.get(key)
+        if panel is None:
+            return False
+        self._release_edit_panel()
+        self.edit_panel = panel
+        self._edit_panel_ratios = (width_ratio, height_ratio)
+        self._apply_settings_panel_geometry()
+        panel.set_opacity(0.0)
+        panel.set_scale(0.8)
+        panel.show()
+        panel.raise_()
+        self._animate_panel_in()
+        return True
+
+    def _refresh_date_tables(self):
+        """Resolve the weekday/month name tables for the current language (used by draw_date)"""
+        language = self.current_language
+        self._weekdays_cur = self.WEEKDAYS.get(language, self.WEEKDAYS["EN"])
+        self._months_cur = self.MONTHS.get(language, self.MONTHS["EN"])
+        self._date_month_first = (language == "EN")
+
     def _apply_language(self):
+        self._refresh_date_tables()
+        self._control_button_cache.clear()  # selection and autostart label change with the language
         self.setWindowTitle(self._tr("window_title"))
 
         for key, entries in self._i18n_widgets.items():
@@ -632,8 +957,7 @@ class NDotClockSlider(QWidget):
     def _create_settings_panel(self, title_key: str, *, width_ratio: float = 0.42,
                                height_ratio: float = 0.58) -> Tuple[QFrame, QVBoxLayout]:
         """Create and position a reusable settings panel with a title."""
-        if self.edit_panel:
-            self.edit_panel.deleteLater()
+        self._release_edit_panel()
 
         self.edit_panel = AnimatedPanel(self)
         self.edit_panel.setObjectName("settingsPanel")
@@ -654,35 +978,54 @@ class NDotClockSlider(QWidget):
                 background-color: #ffffff;
                 color: #151515;
                 border: none;
-                border-radius: {self.get_ui_size(8, 6)}px;
-                padding: {self.get_ui_size(8, 6)}px {self.get_ui_size(16, 12)}px;
+                border-radius: {self._sized.ui_8_6}px;
+                padding: {self._sized.ui_8_6}px {self._sized.ui_16_12}px;
                 font-weight: 600;
-                font-size: {self.get_ui_size(12, 10)}px;
-                min-width: {self.get_ui_size(75, 60)}px;
-                min-height: {self.get_ui_size(32, 26)}px;
+                font-size: {self._sized.ui_12_10}px;
+                min-width: {self._sized.ui_75_60}px;
+                min-height: {self._sized.ui_32_26}px;
                 font-family: '{self.font_family}';
             }}
             QPushButton[buttonRole="secondary"] {{
                 background-color: rgba(255, 255, 255, 15);
                 border: 1px solid rgba(255, 255, 255, 30);
-                border-radius: {self.get_ui_size(8, 6)}px;
-                padding: {self.get_ui_size(8, 6)}px {self.get_ui_size(16, 12)}px;
+                border-radius: {self._sized.ui_8_6}px;
+                padding: {self._sized.ui_8_6}px {self._sized.ui_16_12}px;
                 color: #f0f0f0;
                 font-weight: 500;
-                font-size: {self.get_ui_size(12, 10)}px;
-                min-width: {self.get_ui_size(75, 60)}px;
-                min-height: {self.get_ui_size(32, 26)}px;
+                font-size: {self._sized.ui_12_10}px;
+                min-width: {self._sized.ui_75_60}px;
+                min-height: {self._sized.ui_32_26}px;
+                font-family: '{self.font_family}';
+            }}
+            QPushButton[buttonRole="delete"] {{
+                background-color: #dc3545;
+                color: white;
+                border: none;
+                border-radius: {self._sized.ui_8_6}px;
+                padding: {self._sized.ui_8_6}px {self._sized.ui_16_12}px;
+                font-weight: 600;
+                font-size: {self._sized.ui_12_10}px;
+                min-width: {self._sized.ui_75_60}px;
+                min-height: {self._sized.ui_32_26}px;
                 font-family: '{self.font_family}';
             }}
             QCheckBox {{
                 color: #f0f0f0;
-                font-size: {self.get_ui_size(12, 10)}px;
+                font-size: {self._sized.ui_12_10}px;
                 font-family: '{self.font_family}';
             }}
+            QCheckBox[cbRole="toggle"] {{
+                padding: {self._sized.sp_4_2}px 0;
+            }}
         """
         )
 
         layout = QVBoxLayout(self.edit_panel)
+        # Batch panel construction: the caller adds its rows and then calls
+        # _finish_settings_panel(), so Qt runs a single relayout/repaint.
+        layout.setEnabled(False)
+        self.edit_panel.setUpdatesEnabled(False)
         # Optimized spacing and margins for 800x480
         spacing = self.get_spacing(12, 6)
         margins = self.get_spacing(20, 12)
@@ -695,7 +1038,7 @@ class NDotClockSlider(QWidget):
         title_label.setStyleSheet(f"font-size: {title_size}px; font-weight: 700; font-family: '{self.font_family}';")
         self._register_i18n_widget(title_label, title_key)
         layout.addWidget(title_label)
-        layout.addSpacing(self.get_spacing(6, 3))
+        layout.addSpacing(self._sized.sp_6_3)
 
         self._edit_panel_ratios = (max(0.2, min(width_ratio, 0.9)),
                                    max(0.2, min(height_ratio, 0.9)))
@@ -710,6 +1053,21 @@ class NDotClockSlider(QWidget):
 
         return self.edit_panel, layout
 
+    def _finish_settings_panel(self, layout: QVBoxLayout):
+        """Re-enable a panel layout built by _create_settings_panel and lay it out once."""
+        layout.setEnabled(True)
+        layout.activate()
+        if self.edit_panel:
+            self.edit_panel.setUpdatesEnabled(True)
+
+    def _mk_role_button(self, role: str, i18n_key: str, slot) -> QPushButton:
+        """Create a translated settings panel button styled by its buttonRole."""
+        btn = QPushButton()
+        btn.setProperty("buttonRole", role)
+        self._register_i18n_widget(btn, i18n_key)
+        btn.clicked.connect(slot)
+        return btn
+
     def _settings_section_label(self, key: str) -> QLabel:
         """Create a styled section label bound to translations."""
         label = QLabel()
@@ -767,8 +1125,8 @@ class NDotClockSlider(QWidget):
 
     def _cleanup_panel_animations(self):
         """Clean up existing panel animations to prevent memory leaks"""
-        if hasattr(self, 'panel_opacity_animation') and self.panel_opacity_animation:
-            if self.panel_opacity_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_opacity_animation is not None:
+            if self.panel_opacity_animation.state() == _ANIM_RUNNING:
                 # Set current value before stopping to prevent jump
                 if self.edit_panel:
                     current_opacity = self.panel_opacity_animation.currentValue()
@@ -780,8 +1138,8 @@ class NDotClockSlider(QWidget):
             self.panel_opacity_animation.deleteLater()
             self.panel_opacity_animation = None
 
-        if hasattr(self, 'panel_scale_animation') and self.panel_scale_animation:
-            if self.panel_scale_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_scale_animation is not None:
+            if self.panel_scale_animation.state() == _ANIM_RUNNING:
                 # Set current value before stopping to prevent jump
                 if self.edit_panel:
                     current_scale = self.panel_scale_animation.currentValue()
@@ -802,12 +1160,12 @@ class NDotClockSlider(QWidget):
         current_opacity = 0.0
         current_scale = 0.8
 
-        if self.panel_opacity_animation and self.panel_opacity_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_opacity_animation and self.panel_opacity_animation.state() == _ANIM_RUNNING:
             current_opacity = self.panel_opacity_animation.currentValue() or 0.0
         else:
             current_opacity = self.edit_panel.get_opacity()
 
-        if self.panel_scale_animation and self.panel_scale_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_scale_animation and self.panel_scale_animation.state() == _ANIM_RUNNING:
             current_scale = self.panel_scale_animation.currentValue() or 0.8
         else:
             current_scale = self.edit_panel.get_scale()
@@ -842,12 +1200,12 @@ class NDotClockSlider(QWidget):
         current_opacity = 1.0
         current_scale = 1.0
 
-        if self.panel_opacity_animation and self.panel_opacity_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_opacity_animation and self.panel_opacity_animation.state() == _ANIM_RUNNING:
             current_opacity = self.panel_opacity_animation.currentValue() or 1.0
         else:
             current_opacity = self.edit_panel.get_opacity()
 
-        if self.panel_scale_animation and self.panel_scale_animation.state() == QPropertyAnimation.State.Running:
+        if self.panel_scale_animation and self.panel_scale_animation.state() == _ANIM_RUNNING:
             current_scale = self.panel_scale_animation.currentValue() or 1.0
         else:
             current_scale = self.edit_panel.get_scale()
@@ -885,7 +1243,8 @@ class NDotClockSlider(QWidget):
         if math.isclose(self._nav_opacity, value, abs_tol=0.001):
             return
         self._nav_opacity = value
-        self.update()
+        # Only the dot strip fades; leave the rest of the frame alone
+        self.update(self._dots_band_rect(self._sized.nav_dots_bottom))
 
     navOpacity = pyqtProperty(float, fget=get_nav_opacity, fset=set_nav_opacity)
 
@@ -922,6 +1281,7 @@ class NDotClockSlider(QWidget):
         self.slides.extend(other_slides)
         if add_slide:
             self.slides.append(add_slide)
+        self._rebuild_slide_index()
     
     def reset_clock_return_timer(self):
         """Reset the timer that returns to clock slide after inactivity"""
@@ -949,7 +1309,7 @@ class NDotClockSlider(QWidget):
     def show_navigation(self):
         """Show navigation dots"""
         self.nav_hidden = False
-        if self.nav_opacity_animation.state() == QPropertyAnimation.State.Running:
+        if self.nav_opacity_animation.state() == _ANIM_RUNNING:
             self.nav_opacity_animation.stop()
         self.nav_opacity_animation.setStartValue(self._nav_opacity)
         self.nav_opacity_animation.setEndValue(1.0)
@@ -963,7 +1323,7 @@ class NDotClockSlider(QWidget):
         if self.nav_hidden and math.isclose(self._nav_opacity, 0.0, abs_tol=0.001):
             return
         self.nav_hidden = True
-        if self.nav_opacity_animation.state() == QPropertyAnimation.State.Running:
+        if self.nav_opacity_animation.state() == _ANIM_RUNNING:
             self.nav_opacity_animation.stop()
         self.nav_opacity_animation.setStartValue(self._nav_opacity)
         self.nav_opacity_animation.setEndValue(0.0)
@@ -1081,9 +1441,9 @@ class NDotClockSlider(QWidget):
                         ['sudo', 'timedatectl', 'set-timezone', timezone],
                         capture_output=True, timeout=10
                     )
-                    logging.info(f"Timezone set to {timezone}")
+                    logger.info("Timezone set to %s", timezone)
         except Exception as e:
-            logging.warning(f"Failed to set timezone: {e}")
+            logger.warning("Failed to set timezone: %s", e)
 
     def fetch_weather(self):
         """Fetch weather data from API"""
@@ -1178,6 +1538,7 @@ class NDotClockSlider(QWidget):
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press"""
+        self._wake_main_timer()
         if event.button() == Qt.MouseButton.LeftButton:
             # Reset clock return timer on user interaction
             self.reset_clock_return_timer()
@@ -1509,7 +1870,7 @@ class NDotClockSlider(QWidget):
 
         width = max(1, self.width())
 
-        if hasattr(self, 'offset_animation') and self.offset_animation and self.offset_animation.state() == QPropertyAnimation.State.Running:
+        if self.offset_animation is not None and self.offset_animation.state() == _ANIM_RUNNING:
             self._finalize_offset_animation()
 
         previous_offset = self.slide_container.get_offset_x() if self.slide_container else 0.0
@@ -1658,7 +2019,7 @@ class NDotClockSlider(QWidget):
                 # Останавливаем старую анимацию для этого индекса
                 if idx in self.reorder_swap_animations:
                     old_anim = self.reorder_swap_animations[idx]
-                    if old_anim.state() == QPropertyAnimation.State.Running:
+                    if old_anim.state() == _ANIM_RUNNING:
                         old_anim.stop()
                     old_anim.deleteLater()
                     del self.reorder_swap_animations[idx]
@@ -1677,7 +2038,7 @@ class NDotClockSlider(QWidget):
     def finish_all_card_animations(self):
         """Stop and clean up all card reordering animations"""
         for anim in list(self.reorder_swap_animations.values()):
-            if anim.state() == QPropertyAnimation.State.Running:
+            if anim.state() == _ANIM_RUNNING:
                 anim.stop()
             anim.deleteLater()
 
@@ -1699,7 +2060,7 @@ class NDotClockSlider(QWidget):
         """Calculate rectangles for language/update/autostart buttons."""
         button_height = self.get_ui_size(28, 20)
         button_width = self.get_ui_size(60, 44)
-        lang_spacing = self.get_spacing(12, 8)
+        lang_spacing = self._sized.sp_12_8
         bottom_offset = self.get_spacing(34, 24)
         lang_y = self.height() - bottom_offset
 
@@ -1759,6 +2120,7 @@ class NDotClockSlider(QWidget):
             if rect.contains(pos):
                 if self.current_language != lang:
                     self.current_language = lang
+                    self._evict_panel_pool()
                     self._apply_language()
                     self.save_settings()
                     self.update()
@@ -2116,22 +2478,13 @@ class NDotClockSlider(QWidget):
         self.edit_panel.show()
         self._animate_panel_in()
 
-    def _default_weather_data(self) -> Dict[str, bool]:
+    def _default_weather_data(self) -> WeatherSlideData:
         """Return default visibility settings for weather slide elements."""
-        return {
-            'show_temp': True,
-            'show_icon': True,
-            'show_desc': True,
-            'show_wind': True,
-        }
+        return WeatherSlideData()
 
-    def _ensure_weather_defaults(self, data: Optional[dict]) -> dict:
-        """Ensure weather slide data has all expected keys set."""
-        if data is None:
-            data = {}
-        for key, value in self._default_weather_data().items():
-            data.setdefault(key, value)
-        return data
+    def _ensure_weather_defaults(self, data) -> WeatherSlideData:
+        """Return weather slide data as a WeatherSlideData (legacy dicts are converted)."""
+        return WeatherSlideData.from_dict(data)
 
     def save_weather_settings(self, checked=False):
         """Persist weather slide configuration"""
@@ -2144,11 +2497,12 @@ class NDotClockSlider(QWidget):
             self.exit_card_edit_mode()
             return
 
-        slide_data = self._ensure_weather_defaults(slide.setdefault('data', {}))
-        slide_data['show_temp'] = self.show_temp_cb.isChecked()
-        slide_data['show_icon'] = self.show_icon_cb.isChecked()
-        slide_data['show_desc'] = self.show_desc_cb.isChecked()
-        slide_data['show_wind'] = self.show_wind_cb.isChecked()
+        slide_data = self._ensure_weather_defaults(slide.get('data'))
+        slide_data.show_temp = self.show_temp_cb.isChecked()
+        slide_data.show_icon = self.show_icon_cb.isChecked()
+        slide_data.show_desc = self.show_desc_cb.isChecked()
+        slide_data.show_wind = self.show_wind_cb.isChecked()
+        slide['data'] = slide_data
         
         self._is_new_card = False  # Confirmed creation/edit
         self.save_settings()
@@ -2162,6 +2516,7 @@ class NDotClockSlider(QWidget):
             # Insert before the ADD card
             add_index = len(self.slides) - 1
             self.slides.insert(add_index, {'type': SlideType.WEATHER, 'data': self._default_weather_data()})
+            self._rebuild_slide_index()
             self.current_slide = add_index
             self.save_settings()
             self._is_new_card = True  # Flag as new card
@@ -2175,6 +2530,7 @@ class NDotClockSlider(QWidget):
             'type': SlideType.CUSTOM,
             'data': {'text': self._tr('custom_default_text')}
         })
+        self._rebuild_slide_index()
         self.current_slide = add_index
         self.save_settings()
         self._is_new_card = True  # Flag as new card
@@ -2197,6 +2553,7 @@ class NDotClockSlider(QWidget):
                 'title': self._tr('webview_default_title')
             }
         })
+        self._rebuild_slide_index()
         self.current_slide = add_index
         self.save_settings()
         self._is_new_card = True  # Flag as new card
@@ -2255,12 +2612,12 @@ class NDotClockSlider(QWidget):
         brightness_label_row.addStretch()
         layout.addLayout(brightness_label_row)
 
-        layout.addSpacing(self.get_spacing(6, 3))
+        layout.addSpacing(self._sized.sp_6_3)
 
         auto_row = QHBoxLayout()
         self.auto_brightness_checkbox = QCheckBox()
         self._register_i18n_widget(self.auto_brightness_checkbox, "auto_brightness_toggle")
-        cb_font_size = self.get_ui_size(12, 10)
+        cb_font_size = self._sized.ui_12_10
         cb_padding = self.get_spacing(2, 1)
         self.auto_brightness_checkbox.setStyleSheet(
             f"QCheckBox {{ font-size: {cb_font_size}px; padding: {cb_padding}px 0; font-family: '{self.font_family}'; }}"
@@ -2284,14 +2641,14 @@ class NDotClockSlider(QWidget):
         layout.addLayout(brightness_slider_row)
         self._set_auto_brightness_controls_state()
 
-        layout.addSpacing(self.get_spacing(12, 8))
+        layout.addSpacing(self._sized.sp_12_8)
 
         # Digits color row
         digits_row = QHBoxLayout()
         digits_label = self._settings_section_label("digits_label")
         digits_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         digits_row.addWidget(digits_label)
-        digits_row.addSpacing(self.get_spacing(8, 5))
+        digits_row.addSpacing(self._sized.sp_8_5)
         btn_size = self.get_ui_size(24, 20)
         digit_color_btn = ModernColorButton(self.digit_color, size=btn_size)
         digit_color_btn.setText("")
@@ -2300,14 +2657,14 @@ class NDotClockSlider(QWidget):
         digits_row.addStretch()
         layout.addLayout(digits_row)
 
-        layout.addSpacing(self.get_spacing(10, 6))
+        layout.addSpacing(self._sized.sp_10_6)
 
         # Colon color row
         colon_row = QHBoxLayout()
         colon_label = self._settings_section_label("colon_label")
         colon_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         colon_row.addWidget(colon_label)
-        colon_row.addSpacing(self.get_spacing(8, 5))
+        colon_row.addSpacing(self._sized.sp_8_5)
         colon_color_btn = ModernColorButton(self.colon_color, size=btn_size)
         colon_color_btn.setText("")
         colon_color_btn.color_changed.connect(lambda c: setattr(self, 'colon_color', c))
@@ -2315,14 +2672,14 @@ class NDotClockSlider(QWidget):
         colon_row.addStretch()
         layout.addLayout(colon_row)
 
-        layout.addSpacing(self.get_spacing(10, 6))
+        layout.addSpacing(self._sized.sp_10_6)
 
         # Background color row
         bg_row = QHBoxLayout()
         bg_label = self._settings_section_label("background_label")
         bg_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         bg_row.addWidget(bg_label)
-        bg_row.addSpacing(self.get_spacing(8, 5))
+        bg_row.addSpacing(self._sized.sp_8_5)
         bg_color_btn = ModernColorButton(self.background_color, "background", size=btn_size)
         bg_color_btn.setText("")
         bg_color_btn.color_changed.connect(lambda c: setattr(self, 'background_color', c))
@@ -2333,23 +2690,16 @@ class NDotClockSlider(QWidget):
         layout.addStretch()
 
         buttons_row = QHBoxLayout()
-        buttons_row.setSpacing(self.get_spacing(8, 6))
+        buttons_row.setSpacing(self._sized.sp_8_6)
         buttons_row.addStretch()
 
-        cancel_btn = QPushButton()
-        cancel_btn.setProperty("buttonRole", "secondary")
-        self._register_i18n_widget(cancel_btn, "cancel_button")
-        cancel_btn.clicked.connect(self.exit_card_edit_mode)
-        buttons_row.addWidget(cancel_btn)
+        buttons_row.addWidget(self._mk_role_button("secondary", "cancel_button", self.exit_card_edit_mode))
 
-        save_btn = QPushButton()
-        save_btn.setProperty("buttonRole", "primary")
-        self._register_i18n_widget(save_btn, "save_button")
-        save_btn.clicked.connect(self.save_clock_settings)
-        buttons_row.addWidget(save_btn)
+        buttons_row.addWidget(self._mk_role_button("primary", "save_button", self.save_clock_settings))
 
         buttons_row.addStretch()
         layout.addLayout(buttons_row)
+        self._finish_settings_panel(layout)
 
     def save_clock_settings(self, checked=False):
         """Commit clock settings and close the panel"""
@@ -2359,53 +2709,59 @@ class NDotClockSlider(QWidget):
     def setup_weather_edit_panel(self):
         """Create weather editor panel"""
         self.active_panel_type = ("weather", None)
-        _, layout = self._create_settings_panel("weather_editor_title", width_ratio=0.45, height_ratio=0.62)
-
         slide = self.slides[self.current_slide]
-        slide_data = self._ensure_weather_defaults(slide.get('data', {}))
+        slide_data = self._ensure_weather_defaults(slide.get('data'))
+
+        # The panel only depends on scale/language; reuse it and rebind the checkboxes
+        pool_key = ("weather", self.scale_factor, self.current_language)
+        if self._reuse_pooled_panel(pool_key, 0.45, 0.62):
+            self.show_temp_cb.setChecked(slide_data.show_temp)
+            self.show_icon_cb.setChecked(slide_data.show_icon)
+            self.show_desc_cb.setChecked(slide_data.show_desc)
+            self.show_wind_cb.setChecked(slide_data.show_wind)
+            return
 
-        layout.addSpacing(self.get_spacing(8, 4))
+        panel, layout = self._create_settings_panel("weather_editor_title", width_ratio=0.45, height_ratio=0.62)
 
-        cb_font_size = self.get_ui_size(12, 10)
-        cb_padding = self.get_spacing(4, 2)
+        layout.addSpacing(self._sized.sp_8_4)
 
         self.show_temp_cb = QCheckBox()
+        self.show_temp_cb.setProperty("cbRole", "toggle")
+        self.show_temp_cb.setChecked(slide_data.show_temp)
         self._register_i18n_widget(self.show_temp_cb, "show_temp")
-        self.show_temp_cb.setChecked(slide_data.get('show_temp', True))
-        self.show_temp_cb.setStyleSheet(f"QCheckBox {{ font-size: {cb_font_size}px; padding: {cb_padding}px 0; font-family: '{self.font_family}'; }}")
         cb_row1 = QHBoxLayout()
         cb_row1.addWidget(self.show_temp_cb)
         cb_row1.addStretch()
         layout.addLayout(cb_row1)
 
-        layout.addSpacing(self.get_spacing(4, 2))
+        layout.addSpacing(self._sized.sp_4_2)
 
         self.show_icon_cb = QCheckBox()
+        self.show_icon_cb.setProperty("cbRole", "toggle")
+        self.show_icon_cb.setChecked(slide_data.show_icon)
         self._register_i18n_widget(self.show_icon_cb, "show_icon")
-        self.show_icon_cb.setChecked(slide_data.get('show_icon', True))
-        self.show_icon_cb.setStyleSheet(f"QCheckBox {{ font-size: {cb_font_size}px; padding: {cb_padding}px 0; font-family: '{self.font_family}'; }}")
         cb_row2 = QHBoxLayout()
         cb_row2.addWidget(self.show_icon_cb)
         cb_row2.addStretch()
         layout.addLayout(cb_row2)
 
-        layout.addSpacing(self.get_spacing(4, 2))
+        layout.addSpacing(self._sized.sp_4_2)
 
         self.show_desc_cb = QCheckBox()
+        self.show_desc_cb.setProperty("cbRole", "toggle")
+        self.show_desc_cb.setChecked(slide_data.show_desc)
         self._register_i18n_widget(self.show_desc_cb, "show_desc")
-        self.show_desc_cb.setChecked(slide_data.get('show_desc', True))
-        self.show_desc_cb.setStyleSheet(f"QCheckBox {{ font-size: {cb_font_size}px; padding: {cb_padding}px 0; font-family: '{self.font_family}'; }}")
         cb_row3 = QHBoxLayout()
         cb_row3.addWidget(self.show_desc_cb)
         cb_row3.addStretch()
         layout.addLayout(cb_row3)
 
-        layout.addSpacing(self.get_spacing(4, 2))
+        layout.addSpacing(self._sized.sp_4_2)
 
         self.show_wind_cb = QCheckBox()
+        self.show_wind_cb.setProperty("cbRole", "toggle")
+        self.show_wind_cb.setChecked(slide_data.show_wind)
         self._register_i18n_widget(self.show_wind_cb, "show_wind")
-        self.show_wind_cb.setChecked(slide_data.get('show_wind', True))
-        self.show_wind_cb.setStyleSheet(f"QCheckBox {{ font-size: {cb_font_size}px; padding: {cb_padding}px 0; font-family: '{self.font_family}'; }}")
         cb_row4 = QHBoxLayout()
         cb_row4.addWidget(self.show_wind_cb)
         cb_row4.addStretch()
@@ -2414,57 +2770,27 @@ class NDotClockSlider(QWidget):
         layout.addStretch()
 
         buttons_row = QHBoxLayout()
-        buttons_row.setSpacing(self.get_spacing(8, 6))
+        buttons_row.setSpacing(self._sized.sp_8_6)
         buttons_row.addStretch()
 
         # Delete button (only for non-essential slides)
-        delete_btn = QPushButton()
-        delete_btn.setProperty("buttonRole", "delete")
-        btn_font_size = self.get_ui_size(12, 10)
-        btn_padding_v = self.get_ui_size(8, 6)
-        btn_padding_h = self.get_ui_size(16, 12)
-        btn_radius = self.get_ui_size(8, 6)
-        btn_min_w = self.get_ui_size(75, 60)
-        btn_min_h = self.get_ui_size(32, 26)
-        delete_btn.setStyleSheet(f"""
-            QPushButton[buttonRole="delete"] {{
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: {btn_radius}px;
-                padding: {btn_padding_v}px {btn_padding_h}px;
-                font-weight: 600;
-                font-size: {btn_font_size}px;
-                min-width: {btn_min_w}px;
-                min-height: {btn_min_h}px;
-                font-family: '{self.font_family}';
-            }}
-        """)
-        self._register_i18n_widget(delete_btn, "delete_button")
-        delete_btn.clicked.connect(self.confirm_delete_card)
-        buttons_row.addWidget(delete_btn)
+        buttons_row.addWidget(self._mk_role_button("delete", "delete_button", self.confirm_delete_card))
 
-        cancel_btn = QPushButton()
-        cancel_btn.setProperty("buttonRole", "secondary")
-        self._register_i18n_widget(cancel_btn, "cancel_button")
-        cancel_btn.clicked.connect(self.exit_card_edit_mode)
-        buttons_row.addWidget(cancel_btn)
+        buttons_row.addWidget(self._mk_role_button("secondary", "cancel_button", self.exit_card_edit_mode))
 
-        save_btn = QPushButton()
-        save_btn.setProperty("buttonRole", "primary")
-        self._register_i18n_widget(save_btn, "save_button")
-        save_btn.clicked.connect(self.save_weather_settings)
-        buttons_row.addWidget(save_btn)
+        buttons_row.addWidget(self._mk_role_button("primary", "save_button", self.save_weather_settings))
 
         buttons_row.addStretch()
         layout.addLayout(buttons_row)
+        self._finish_settings_panel(layout)
+        self._panel_pool[pool_key] = panel
 
     def setup_custom_edit_panel(self):
         """Create custom slide editor panel"""
         self.active_panel_type = ("custom", self.current_edit_index)
         _, layout = self._create_settings_panel("custom_editor_title", width_ratio=0.55, height_ratio=0.72)
 
-        layout.addSpacing(self.get_spacing(8, 4))
+        layout.addSpacing(self._sized.sp_8_4)
 
         self.custom_text_edit = QTextEdit()
         self.custom_text_edit.setPlainText(
@@ -2496,46 +2822,15 @@ class NDotClockSlider(QWidget):
         buttons_row.addStretch()
 
         # Delete button for custom slides
-        delete_btn = QPushButton()
-        delete_btn.setProperty("buttonRole", "delete")
-        btn_font_size = self.get_ui_size(12, 10)
-        btn_padding_v = self.get_ui_size(8, 6)
-        btn_padding_h = self.get_ui_size(16, 12)
-        btn_radius = self.get_ui_size(8, 6)
-        btn_min_w = self.get_ui_size(75, 60)
-        btn_min_h = self.get_ui_size(32, 26)
-        delete_btn.setStyleSheet(f"""
-            QPushButton[buttonRole="delete"] {{
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: {btn_radius}px;
-                padding: {btn_padding_v}px {btn_padding_h}px;
-                font-weight: 600;
-                font-size: {btn_font_size}px;
-                min-width: {btn_min_w}px;
-                min-height: {btn_min_h}px;
-                font-family: '{self.font_family}';
-            }}
-        """)
-        self._register_i18n_widget(delete_btn, "delete_button")
-        delete_btn.clicked.connect(self.confirm_delete_card)
-        buttons_row.addWidget(delete_btn)
+        buttons_row.addWidget(self._mk_role_button("delete", "delete_button", self.confirm_delete_card))
 
-        cancel_btn = QPushButton()
-        cancel_btn.setProperty("buttonRole", "secondary")
-        self._register_i18n_widget(cancel_btn, "cancel_button")
-        cancel_btn.clicked.connect(self.exit_card_edit_mode)
-        buttons_row.addWidget(cancel_btn)
+        buttons_row.addWidget(self._mk_role_button("secondary", "cancel_button", self.exit_card_edit_mode))
 
-        save_btn = QPushButton()
-        save_btn.setProperty("buttonRole", "primary")
-        self._register_i18n_widget(save_btn, "save_button")
-        save_btn.clicked.connect(self.save_custom_slide)
-        buttons_row.addWidget(save_btn)
+        buttons_row.addWidget(self._mk_role_button("primary", "save_button", self.save_custom_slide))
 
         buttons_row.addStretch()
         layout.addLayout(buttons_row)
+        self._finish_settings_panel(layout)
 
     def save_custom_slide(self, checked=False):
         """Save custom slide content"""
@@ -2551,18 +2846,18 @@ class NDotClockSlider(QWidget):
         self.active_panel_type = ("webview", self.current_edit_index)
         _, layout = self._create_settings_panel("webview_editor_title", width_ratio=0.55, height_ratio=0.65)
 
-        layout.addSpacing(self.get_spacing(8, 4))
+        layout.addSpacing(self._sized.sp_8_4)
 
         # URL input
         url_label = QLabel()
         self._register_i18n_widget(url_label, "youtube_url_label")
-        url_label_font_size = self.get_ui_size(12, 10)
+        url_label_font_size = self._sized.ui_12_10
         url_label.setStyleSheet(f"color: #ccc; font-size: {url_label_font_size}px; font-family: '{self.font_family}';")
         layout.addWidget(url_label)
 
-        input_height = self.get_ui_size(32, 26)
-        input_font_size = self.get_ui_size(12, 10)
-        input_padding = self.get_ui_size(8, 6)
+        input_height = self._sized.ui_32_26
+        input_font_size = self._sized.ui_12_10
+        input_padding = self._sized.ui_8_6
         input_radius = self.get_ui_size(6, 4)
         
         url_row = QHBoxLayout()
@@ -2603,7 +2898,7 @@ class NDotClockSlider(QWidget):
         
         layout.addLayout(url_row)
 
-        layout.addSpacing(self.get_spacing(12, 8))
+        layout.addSpacing(self._sized.sp_12_8)
 
         # Title input
         title_label = QLabel()
@@ -2656,46 +2951,15 @@ class NDotClockSlider(QWidget):
         buttons_row.addStretch()
 
         # Delete button
-        delete_btn = QPushButton()
-        delete_btn.setProperty("buttonRole", "delete")
-        btn_font_size = self.get_ui_size(12, 10)
-        btn_padding_v = self.get_ui_size(8, 6)
-        btn_padding_h = self.get_ui_size(16, 12)
-        btn_radius = self.get_ui_size(8, 6)
-        btn_min_w = self.get_ui_size(75, 60)
-        btn_min_h = self.get_ui_size(32, 26)
-        delete_btn.setStyleSheet(f"""
-            QPushButton[buttonRole="delete"] {{
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: {btn_radius}px;
-                padding: {btn_padding_v}px {btn_padding_h}px;
-                font-weight: 600;
-                font-size: {btn_font_size}px;
-                min-width: {btn_min_w}px;
-                min-height: {btn_min_h}px;
-                font-family: '{self.font_family}';
-            }}
-        """)
-        self._register_i18n_widget(delete_btn, "delete_button")
-        delete_btn.clicked.connect(self.confirm_delete_card)
-        buttons_row.addWidget(delete_btn)
+        buttons_row.addWidget(self._mk_role_button("delete", "delete_button", self.confirm_delete_card))
 
-        cancel_btn = QPushButton()
-        cancel_btn.setProperty("buttonRole", "secondary")
-        self._register_i18n_widget(cancel_btn, "cancel_button")
-        cancel_btn.clicked.connect(self.exit_card_edit_mode)
-        buttons_row.addWidget(cancel_btn)
+        buttons_row.addWidget(self._mk_role_button("secondary", "cancel_button", self.exit_card_edit_mode))
 
-        save_btn = QPushButton()
-        save_btn.setProperty("buttonRole", "primary")
-        self._register_i18n_widget(save_btn, "save_button")
-        save_btn.clicked.connect(self.save_webview)
-        buttons_row.addWidget(save_btn)
+        buttons_row.addWidget(self._mk_role_button("primary", "save_button", self.save_webview))
 
         buttons_row.addStretch()
         layout.addLayout(buttons_row)
+        self._finish_settings_panel(layout)
 
 
     def save_webview(self, checked=False):
@@ -2730,6 +2994,17 @@ class NDotClockSlider(QWidget):
             cancel_text=self._tr("no_button")
         )
 
+    def _remove_slide(self, index: int) -> dict:
+        """Remove a slide and release the webview cached for it, if no other slide uses it."""
+        removed = self.slides.pop(index)
+        self._rebuild_slide_index()
+        if removed['type'] == SlideType.WEBVIEW:
+            url = removed.get('data', {}).get('url')
+            if url and not any(s['type'] == SlideType.WEBVIEW and s['data'].get('url') == url
+                               for s in self.slides):
+                self.webview_manager.release_url(url)
+        return removed
+
     def delete_current_card(self):
         """Delete the currently edited card"""
         if self.current_edit_index is None or self.current_edit_index >= len(self.slides):
@@ -2739,8 +3014,7 @@ class NDotClockSlider(QWidget):
         if slide['type'] == SlideType.CLOCK:
             return  # Cannot delete clock slide
 
-        # Remove the slide
-        del self.slides[self.current_edit_index]
+        self._remove_slide(self.current_edit_index)
 
         # Adjust current slide index if necessary
         if self.current_slide >= len(self.slides):
@@ -2759,7 +3033,7 @@ class NDotClockSlider(QWidget):
         # Handle cancellation of new card creation
         if self._is_new_card and self.current_edit_index is not None:
             if 0 <= self.current_edit_index < len(self.slides):
-                del self.slides[self.current_edit_index]
+                self._remove_slide(self.current_edit_index)
                 if self.current_slide >= len(self.slides):
                     self.current_slide = max(0, len(self.slides) - 1)
                 self.save_settings()
@@ -2767,9 +3041,7 @@ class NDotClockSlider(QWidget):
 
         def cleanup_panel():
             self._cleanup_panel_animations()
-            if self.edit_panel:
-                self.edit_panel.deleteLater()
-                self.edit_panel = None
+            self._release_edit_panel()
             self.card_edit_mode = False
             self.active_panel_type = None
             self.current_edit_index = None
@@ -2793,6 +3065,7 @@ class NDotClockSlider(QWidget):
 
         self._edit_mode_entry_slide = max(0, min(self.current_slide, len(self.slides) - 1)) if self.slides else 0
         self.edit_mode = True
+        self._paint_impl = self._paint_edit
         self.hide_all_webviews()  # Hide embedded webviews when entering edit mode
         self._begin_edit_transition(self.scale_animation,
                                     self.offset_y_animation,
@@ -2814,6 +3087,7 @@ class NDotClockSlider(QWidget):
 
         self._stop_reorder_auto_scroll()
         self.edit_mode = False
+        self._paint_impl = self._paint_normal
         if self.slides:
             target_slide = max(0, min(self._edit_mode_entry_slide, len(self.slides) - 1))
             if target_slide != self.current_slide:
@@ -2829,6 +3103,7 @@ class NDotClockSlider(QWidget):
 
         self.reset_navigation_timer()
         self.save_settings()
+        self._edit_card_cache.clear()
         self.update()
         self._edit_mode_entry_slide = self.current_slide
         # Don't call update_active_webviews() here - it will be called after animations finish
@@ -2861,11 +3136,12 @@ class NDotClockSlider(QWidget):
         """Animate to current slide with duration based on swipe velocity"""
         if len(self.slides) == 0:
             return
+        self._wake_main_timer()
         
         self.current_slide = max(0, min(self.current_slide, len(self.slides) - 1))
         target_offset = -self.current_slide * self.width()
         
-        if hasattr(self, 'offset_animation') and self.offset_animation:
+        if self.offset_animation is not None:
             # Faster swipe = shorter animation (more responsive feel)
             if velocity > 800:
                 duration = 200
@@ -2936,31 +3212,31 @@ class NDotClockSlider(QWidget):
 
     def eventFilter(self, obj, event):
         """Filter events from webview to detect swipes"""
+        # Fast path: paint/layout/touch/etc. are never intercepted (touch events
+        # pass through for native scrolling)
+        event_type = event.type()
+        if event_type not in _WEBVIEW_SWIPE_EVENTS:
+            return False
+        if event_type == _EVT_MOUSE_MOVE and self._webview_mouse_start is None:
+            return False
+
         # Check if event is from the universal webview
-        if (self.webview_manager.webview and 
-            obj == self.webview_manager.webview and 
-            self.webview_manager.webview.isVisible()):
-            
-            webview = self.webview_manager.webview
-            
-            # Let touch events pass through for native scrolling (two-finger scroll)
-            if event.type() in (QEvent.Type.TouchBegin, QEvent.Type.TouchUpdate, QEvent.Type.TouchEnd):
-                return False  # Don't intercept - let webview handle natively
-            
-            if event.type() == QEvent.Type.MouseButtonPress:
+        webview = self.webview_manager.webview
+        if webview is not None and obj is webview and webview.isVisible():
+            if event_type == _EVT_MOUSE_PRESS:
                 self._webview_mouse_start = event.pos()
                 self._active_webview_for_swipe = webview
                 self._active_webview_type = SlideType.WEBVIEW
                 self._webview_was_transparent = False
                 return False
 
-            if event.type() == QEvent.Type.MouseMove and self._webview_mouse_start is not None:
+            if event_type == _EVT_MOUSE_MOVE:
                 delta_x = event.pos().x() - self._webview_mouse_start.x()
                 delta_y = event.pos().y() - self._webview_mouse_start.y()
 
                 if abs(delta_x) > 15 and abs(delta_x) > abs(delta_y) * 1.8:
                     if not self._webview_was_transparent:
-                        webview.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+                        webview.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, True)
                         self._webview_was_transparent = True
 
                         parent_pos = webview.mapToParent(self._webview_mouse_start)
@@ -2976,12 +3252,13 @@ class NDotClockSlider(QWidget):
 
                 return False
 
-            if event.type() == QEvent.Type.MouseButtonRelease:
+            if event_type == _EVT_MOUSE_RELEASE:
                 self._webview_mouse_start = None
                 self._active_webview_for_swipe = None
                 self._active_webview_type = None
                 if self._webview_was_transparent:
-                    QTimer.singleShot(100, lambda w=webview: self._restore_webview_interactivity(w))
+                    self._pending_restore_webview = webview
+                    QTimer.singleShot(100, self._restore_pending_webview_interactivity)
                     self._webview_was_transparent = False
                 return False
 
@@ -2997,6 +3274,12 @@ class NDotClockSlider(QWidget):
             return SlideType.WEBVIEW
         return None
 
+    def _restore_pending_webview_interactivity(self):
+        """Deferred slot for the webview released at the end of a swipe"""
+        webview, self._pending_restore_webview = self._pending_restore_webview, None
+        if webview is not None:
+            self._restore_webview_interactivity(webview)
+
     def _restore_webview_interactivity(self, webview: Optional[QWebEngineView] = None):
         """Restore webview interactivity after swipe"""
         webview = webview or self._active_webview_for_swipe
@@ -3011,7 +3294,7 @@ class NDotClockSlider(QWidget):
         if 0 <= self.current_slide < len(self.slides):
             slide = self.slides[self.current_slide]
             if slide['type'] == slide_type:
-                webview.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
+                webview.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, False)
 
 
     def show_webview(self, url: str):
@@ -3023,13 +3306,18 @@ class NDotClockSlider(QWidget):
         # Load URL (will skip if already loaded)
         self.webview_manager.load_url(url)
             
-        # Get current webview slide geometry
+        geom = self._current_webview_card_geometry()
+        if geom is None:
+            return False
+        # Show webview (will handle loading state internally)
+        return self.webview_manager.show_webview(geom)
+
+    def _current_webview_card_geometry(self) -> Optional[QRect]:
+        """Card geometry for the webview slide if it is the current slide, else None"""
         webview_slide_index = self.get_slide_index_for_type(SlideType.WEBVIEW)
         if webview_slide_index >= 0 and webview_slide_index == self.current_slide:
-            geom = self.get_embedded_card_geometry(webview_slide_index)
-            # Show webview (will handle loading state internally)
-            return self.webview_manager.show_webview(geom)
-        return False
+            return self.get_embedded_card_geometry(webview_slide_index)
+        return None
 
     def hide_webview(self):
         """Hide webview"""
@@ -3043,12 +3331,16 @@ class NDotClockSlider(QWidget):
         self._webview_mouse_start = None
         self._webview_was_transparent = False
 
+    def _rebuild_slide_index(self):
+        """Recompute first-index-per-type lookup; call after any change to self.slides."""
+        index_by_type: Dict[SlideType, int] = {}
+        for i, slide in enumerate(self.slides):
+            index_by_type.setdefault(slide['type'], i)
+        self._slide_index_by_type = index_by_type
+
     def get_slide_index_for_type(self, slide_type: SlideType) -> int:
         """Find the slide index for a given slide type, returns -1 if not found"""
-        for i, slide in enumerate(self.slides):
-            if slide['type'] == slide_type:
-                return i
-        return -1
+        return self._slide_index_by_type.get(slide_type, -1)
 
     def update_active_webviews(self):
         """Synchronize embedded webviews with slides (optimized for smooth transitions)
@@ -3059,6 +3351,11 @@ class NDotClockSlider(QWidget):
             self.hide_all_webviews()
             return
 
+        # No webview cards at all: nothing to position
+        if SlideType.WEBVIEW not in self._slide_index_by_type:
+            self.hide_webview()
+            return
+
         # Find the most visible webview slide
         best_slide_index = -1
         best_intersection_area = 0
@@ -3086,7 +3383,8 @@ class NDotClockSlider(QWidget):
             if not self._webview_initialized and not self._webview_init_pending:
                 self._webview_init_pending = True
                 self._webview_initialized = True
-                QTimer.singleShot(50, lambda: self._init_and_show_webview(best_url))
+                self._pending_webview_url = best_url
+                QTimer.singleShot(50, self._init_pending_webview)
                 return
 
             self.webview_manager.load_url(best_url)
@@ -3098,6 +3396,10 @@ class NDotClockSlider(QWidget):
         else:
             self.hide_webview()
     
+    def _init_pending_webview(self):
+        """Deferred slot: initialize the webview queued by update_active_webviews"""
+        self._init_and_show_webview(self._pending_webview_url)
+
     def _init_and_show_webview(self, url: str):
         """Инициализация и показ webview при первом обращении"""
         if not self.webview_manager:
@@ -3123,9 +3425,8 @@ class NDotClockSlider(QWidget):
                 slide = self.slides[self.current_slide]
                 if slide['type'] == SlideType.WEBVIEW:
                     # Page just loaded - show webview at correct position
-                    webview_slide_index = self.get_slide_index_for_type(SlideType.WEBVIEW)
-                    if webview_slide_index >= 0 and webview_slide_index == self.current_slide:
-                        geom = self.get_embedded_card_geometry(webview_slide_index)
+                    geom = self._current_webview_card_geometry()
+                    if geom is not None:
                         self.webview_manager.show_webview(geom)
                         
                         # Ensure brightness overlay is on top
@@ -3150,17 +3451,17 @@ class NDotClockSlider(QWidget):
 
         # Use different easing for slide transitions in normal mode
         if not self.edit_mode:
-            if hasattr(self, 'offset_animation') and self.offset_animation:
+            if self.offset_animation is not None:
                 # Smoother animation with OutExpo for snappy feel
                 self.offset_animation.setEasingCurve(QEasingCurve.Type.OutExpo)
                 self.offset_animation.setDuration(350)
         else:
-            if hasattr(self, 'offset_animation') and self.offset_animation:
+            if self.offset_animation is not None:
                 self.offset_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
                 self.offset_animation.setDuration(500)
                 self._begin_edit_transition(self.offset_animation)
 
-        if hasattr(self, 'offset_animation') and self.offset_animation:
+        if self.offset_animation is not None:
             self._start_property_animation(self.offset_animation, float(target_offset))
         
         # Update webviews after animation starts
@@ -3168,7 +3469,7 @@ class NDotClockSlider(QWidget):
         self.update()
 
     def _finalize_offset_animation(self):
-        if hasattr(self, 'offset_animation') and self.offset_animation and self.offset_animation.state() == QPropertyAnimation.State.Running:
+        if self.offset_animation is not None and self.offset_animation.state() == _ANIM_RUNNING:
             value = self.offset_animation.currentValue()
             if value is None:
                 value = self.slide_container.offset_x if self.slide_container else 0
@@ -3189,7 +3490,7 @@ class NDotClockSlider(QWidget):
         current_value = None
 
         # If animation is running, get current value and stop it properly
-        if animation.state() == QPropertyAnimation.State.Running:
+        if animation.state() == _ANIM_RUNNING:
             current_value = animation.currentValue()
             animation.stop()
             # Set the current value on the target object to prevent jumps
@@ -3216,9 +3517,8 @@ class NDotClockSlider(QWidget):
         except Exception:
             return
 
-        if (hasattr(self, '_active_edit_animations') and
-            animation in self._active_edit_animations and
-            animation.state() != QPropertyAnimation.State.Running):
+        if (animation in self._active_edit_animations and
+            animation.state() != _ANIM_RUNNING):
             self._handle_edit_transition_animation_finished(animation)
 
     def _begin_edit_transition(self, *animations: QPropertyAnimation):
@@ -3254,15 +3554,18 @@ class NDotClockSlider(QWidget):
         if not self.webview_manager.page_loaded:
             return
 
-        # Find current webview slide
-        webview_slide_index = self.get_slide_index_for_type(SlideType.WEBVIEW)
-        
         # Only update if we're currently on the webview slide
-        if webview_slide_index >= 0 and webview_slide_index == self.current_slide:
-             geom = self.get_embedded_card_geometry(webview_slide_index)
-             
-             # Use the centralized show_webview method which handles optimization
-             self.webview_manager.show_webview(geom)
+        geom = self._current_webview_card_geometry()
+        if geom is None:
+            return
+
+        # Slide hasn't moved since the last tick: nothing to do
+        if geom == self._last_webview_geom and self.webview_manager.is_placed:
+            return
+        self._last_webview_geom = QRect(geom)
+
+        # Use the centralized show_webview method which handles optimization
+        self.webview_manager.show_webview(geom)
 
     def on_timeout(self):
         """ARM-optimized timer callback with dynamic interval adjustment
@@ -3271,27 +3574,23 @@ class NDotClockSlider(QWidget):
         - Animation mode: 16ms (60 FPS) - during slide transitions
         - Breathing mode: 33ms (30 FPS) - on clock slide for smooth colon
         - Idle mode: 1000ms (1 FPS) - on other slides, only for clock updates
+        - Deep idle: 3000ms - after 5 idle ticks with nothing animating outside edit
+          mode; user input or a slide change wakes the timer (_wake_main_timer)
 
         This reduces CPU usage by ~75-85% on ARM devices during idle time.
         """
-        # Check if any animations are running
-        has_active_animation = False
-        if hasattr(self, 'offset_animation') and self.offset_animation:
-            has_active_animation |= (self.offset_animation.state() == QPropertyAnimation.State.Running)
-        if hasattr(self, 'scale_animation') and self.scale_animation:
-            has_active_animation |= (self.scale_animation.state() == QPropertyAnimation.State.Running)
-        if hasattr(self, 'offset_y_animation') and self.offset_y_animation:
-            has_active_animation |= (self.offset_y_animation.state() == QPropertyAnimation.State.Running)
-        if hasattr(self, 'panel_opacity_animation') and self.panel_opacity_animation:
-            has_active_animation |= (self.panel_opacity_animation.state() == QPropertyAnimation.State.Running)
-        if hasattr(self, 'panel_scale_animation') and self.panel_scale_animation:
-            has_active_animation |= (self.panel_scale_animation.state() == QPropertyAnimation.State.Running)
+        # Check if any animations are running (stops at the first running one;
+        # panel animations are recreated per panel so they are read each tick)
+        has_active_animation = any(
+            anim is not None and anim.state() == _ANIM_RUNNING
+            for anim in (self.offset_animation, self.scale_animation, self.offset_y_animation,
+                         self.panel_opacity_animation, self.panel_scale_animation)
+        )
 
         self._animation_active = has_active_animation
 
         # Detect if animation just finished
-        prev_animation_active = getattr(self, '_prev_animation_active', False)
-        if prev_animation_active and not has_active_animation:
+        if self._prev_animation_active and not has_active_animation:
             self.update_active_webviews()
         self._prev_animation_active = has_active_animation
 
@@ -3300,14 +3599,20 @@ class NDotClockSlider(QWidget):
         # Keep legacy breathing_time for compatibility
         self.breathing_time = (self.breathing_time + self.breathing_speed) % 1.0
 
-        # Update digit change animations
+        # Update digit change animations (remember who animated: finished fades need a final repaint)
+        animating_digits = tuple(self._digit_animations)
         has_digit_animation = self._update_digit_animations()
 
         # Check if time has changed (for clock updates)
-        current_second = datetime.now().second
+        now = datetime.now()
+        current_second = now.second
         time_changed = (current_second != self._last_update_second)
         if time_changed:
             self._last_update_second = current_second
+        current_minute = now.hour * 60 + now.minute
+        minute_changed = (current_minute != self._last_update_minute)
+        if minute_changed:
+            self._last_update_minute = current_minute
 
         # Check if on clock slide (breathing colon needs smooth animation)
         on_clock_slide = False
@@ -3321,6 +3626,14 @@ class NDotClockSlider(QWidget):
         elif on_clock_slide:
             desired_state = 'breathing'
 
+        if (desired_state == 'idle' and not has_digit_animation and
+                not self.edit_mode and not self.card_edit_mode):
+            self._idle_ticks += 1
+            if self._idle_ticks >= 5:
+                desired_state = 'deep_idle'
+        else:
+            self._idle_ticks = 0
+
         # Fix: Stop timer before changing interval to prevent race conditions with lock
         if desired_state != self._timer_interval_state:
             self._timer_interval_state = desired_state
@@ -3335,6 +3648,8 @@ class NDotClockSlider(QWidget):
                 self.main_timer.setInterval(16)  # 60 FPS
             elif desired_state == 'breathing':
                 self.main_timer.setInterval(33)  # 30 FPS
+            elif desired_state == 'deep_idle':
+                self.main_timer.setInterval(3000)
             else:  # idle
                 self.main_timer.setInterval(1000)  # 1 FPS
 
@@ -3342,14 +3657,37 @@ class NDotClockSlider(QWidget):
             if was_active and self.isVisible() and not self.isMinimized():
                 self.main_timer.start()
 
-        # Only trigger repaint if something actually changed or breathing animation is visible
-        if has_active_animation or time_changed or on_clock_slide or has_digit_animation:
+        # Only trigger repaint if something visible actually changed
+        if has_active_animation:
             self.update()
             self.update_webview_geometry()
-        # If no animations, time hasn't changed, and not on clock slide, skip repaint to save CPU
+        elif self.edit_mode or self.card_edit_mode:
+            # Edit cards show the clock at arbitrary positions - keep full repaints there
+            if time_changed or on_clock_slide or has_digit_animation:
+                self.update()
+                self.update_webview_geometry()
+        elif on_clock_slide:
+            if minute_changed or self._colon_update_rect is None:
+                self.update()  # digits change (draw_clock_slide starts the fade)
+            else:
+                # Qt merges these into one clipped repaint region
+                self.update(self._colon_update_rect)  # breathing colon
+                digit_rects = self._digit_update_rects
+                for position in animating_digits:
+                    if 0 <= position < len(digit_rects):
+                        self.update(digit_rects[position])
+        # Other slides show nothing time-dependent: skip the repaint entirely
+
+    def _wake_main_timer(self):
+        """Leave deep idle right away; the next tick picks the proper interval."""
+        self._idle_ticks = 0
+        if self._timer_interval_state == 'deep_idle':
+            self._timer_interval_state = 'normal'
+            self.main_timer.setInterval(16)
 
     def keyPressEvent(self, event):
         """Handle key press"""
+        self._wake_main_timer()
         # Reset clock return timer on user interaction
         self.reset_clock_return_timer()
 
@@ -3405,6 +3743,7 @@ class NDotClockSlider(QWidget):
         super().resizeEvent(event)
         self.update_scale_factor()
         self.calculate_display_parameters()
+        self._icon_prewarm_timer.start()
         if self.edit_panel:
             self._apply_settings_panel_geometry()
 
@@ -3419,21 +3758,23 @@ class NDotClockSlider(QWidget):
             target_offset_x = -self.current_slide * self.width()
             target_offset_y = 0.0
 
-        current_offset_x = self.slide_container.get_offset_x()
-        if not math.isclose(current_offset_x, target_offset_x, rel_tol=1e-4, abs_tol=0.5):
-            if self.offset_animation.state() == QPropertyAnimation.State.Running:
+        offset_x_running = self.offset_animation.state() == _ANIM_RUNNING
+        offset_y_running = self.offset_y_animation.state() == _ANIM_RUNNING
+
+        if abs(self.slide_container.get_offset_x() - target_offset_x) > 0.5:
+            if offset_x_running:
                 self.offset_animation.stop()
+                offset_x_running = False
             self.slide_container.set_offset_x(target_offset_x)
 
-        current_offset_y = self.slide_container.get_offset_y()
-        if not math.isclose(current_offset_y, target_offset_y, rel_tol=1e-4, abs_tol=0.5):
-            if self.offset_y_animation.state() == QPropertyAnimation.State.Running:
+        if abs(self.slide_container.get_offset_y() - target_offset_y) > 0.5:
+            if offset_y_running:
                 self.offset_y_animation.stop()
+                offset_y_running = False
             self.slide_container.set_offset_y(target_offset_y)
 
-        if (self.offset_animation.state() != QPropertyAnimation.State.Running and
-                self.scale_animation.state() != QPropertyAnimation.State.Running and
-                self.offset_y_animation.state() != QPropertyAnimation.State.Running):
+        if (not offset_x_running and not offset_y_running and
+                self.scale_animation.state() != _ANIM_RUNNING):
             self._clear_edit_transition_guard()
             
         # Resize brightness overlay
@@ -3443,93 +3784,139 @@ class NDotClockSlider(QWidget):
                 self.brightness_overlay.raise_()
 
     def paintEvent(self, event):
-        """Main paint event"""
+        """Main paint event (mode-specific work lives in _paint_normal/_paint_edit)"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
         # Background
-        painter.fillRect(self.rect(), self.background_color)
-        
-        # Apply transformations
-        painter.save()
-        
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        
-        scale = self.slide_container.scale
-        offset_x = self.slide_container.offset_x
-        offset_y = self.slide_container.offset_y
-        
-        painter.translate(center_x, center_y)
-        painter.scale(scale, scale)
+        painter.fillRect(event.rect(), self._background_color)
+        self._paint_impl(painter, event.rect())
 
-        if self.edit_mode:
-            effective_offset_x = 0.0
-        else:
-            effective_offset_x = offset_x
+    def _paint_normal(self, painter: QPainter, dirty_rect: QRect):
+        """Paint the slide strip and navigation dots (normal mode)"""
+        container = self.slide_container
+        scale = container.scale
+        offset_x = container.offset_x
+        offset_y = container.offset_y
 
-        painter.translate(-center_x + effective_offset_x, -center_y + offset_y)
-        
-        # Draw slides
-        if self.edit_mode:
-            self.draw_slides_edit_mode(painter)
+        painter.save()
+        if abs(scale - 1.0) < 1e-6:
+            # Steady state: the centre-scale-uncentre sandwich reduces to the offsets
+            if offset_x or offset_y:
+                painter.translate(offset_x, offset_y)
         else:
-            self.draw_slides_normal_mode(painter)
-        
+            center_x = self.width() // 2
+            center_y = self.height() // 2
+            painter.translate(center_x, center_y)
+            painter.scale(scale, scale)
+            painter.translate(-center_x + offset_x, -center_y + offset_y)
+        self.draw_slides_normal_mode(painter, dirty_rect if scale == 1.0 and offset_y == 0 else None)
         painter.restore()
-        
-        # Draw UI overlays
-        if self.edit_mode and not self.card_edit_mode:
-            self.draw_edit_mode_ui(painter)
-        
-        if not self.edit_mode and (not self.nav_hidden or self._nav_opacity > 0.0):
+
+        if (not self.nav_hidden or self._nav_opacity > 0.0) and self._dots_band_dirty(dirty_rect, self._sized.nav_dots_bottom):
             self.draw_navigation_dots(painter)
 
-    def draw_slides_normal_mode(self, painter: QPainter):
-        """Draw slides in normal viewing mode"""
-        viewport_left = -self.slide_container.offset_x
-        viewport_right = viewport_left + self.width()
-        
-        for i, slide in enumerate(self.slides):
-            x_offset = i * self.width()
-            
-            # Performance optimization: Culling off-screen slides
-            # Skip drawing if the slide is strictly outside the viewport
-            if x_offset + self.width() < viewport_left or x_offset > viewport_right:
-                continue
+    def _dots_band_rect(self, bottom_offset: int) -> QRect:
+        """Full-width strip holding a row of dots drawn ``bottom_offset`` px above the bottom edge"""
+        # One spare pixel row for the antialiased rounded-rect edge
+        return QRect(0, self.height() - bottom_offset, self.width(), self._sized.nav_dot_h + 1)
 
-            painter.save()
-            painter.translate(x_offset, 0)
+    def _dots_band_dirty(self, dirty_rect: Optional[QRect], bottom_offset: int) -> bool:
+        """Whether a repaint of ``dirty_rect`` touches that dot strip"""
+        return dirty_rect is None or dirty_rect.intersects(self._dots_band_rect(bottom_offset))
 
-            if slide['type'] == SlideType.CLOCK:
-                self.draw_clock_slide(painter)
-            elif slide['type'] == SlideType.WEATHER:
-                self.draw_weather_slide(painter, slide)
-            elif slide['type'] == SlideType.CUSTOM:
-                self.draw_custom_slide(painter, slide)
-            elif slide['type'] == SlideType.WEBVIEW:
+    def _paint_edit(self, painter: QPainter, dirty_rect: QRect):
+        """Paint the edit-mode card carousel and its overlay UI"""
+        container = self.slide_container
+        scale = container.scale
+        offset_y = container.offset_y
+
+        painter.save()
+        # Cards position themselves horizontally, so only the vertical offset applies
+        if abs(scale - 1.0) < 1e-6:
+            if offset_y:
+                painter.translate(0, offset_y)
+        else:
+            center_x = self.width() // 2
+            center_y = self.height() // 2
+            painter.translate(center_x, center_y)
+            painter.scale(scale, scale)
+            painter.translate(-center_x, -center_y + offset_y)
+        self.draw_slides_edit_mode(painter)
+        painter.restore()
+
+        if not self.card_edit_mode:
+            self.draw_edit_mode_ui(painter, dirty_rect)
+
+    def draw_slides_normal_mode(self, painter: QPainter, dirty_rect: Optional[QRect] = None):
+        """Draw slides in normal viewing mode (culled to ``dirty_rect`` when given, unscaled only)"""
+        slides = self.slides
+        if not slides:
+            return
+        width = max(1, self.width())
+        offset_x = self.slide_container.offset_x
+        if dirty_rect is not None:
+            viewport_left = dirty_rect.left() - offset_x
+            viewport_right = dirty_rect.right() + 1 - offset_x
+        else:
+            # Visible span in slide coordinates; paintEvent scales around the widget centre
+            scale = self.slide_container.scale or 1.0
+            center_x = width // 2
+            viewport_left = center_x - offset_x - center_x / scale
+            viewport_right = center_x - offset_x + (width - center_x) / scale
+
+        # Performance optimization: only slides overlapping the viewport are visited at all
+        first = max(0, math.floor(viewport_left / width))
+        last = min(len(slides) - 1, math.ceil(viewport_right / width) - 1)
+
+        save = painter.save
+        restore = painter.restore
+        translate = painter.translate
+        for i in range(first, last + 1):
+            slide = slides[i]
+            save()
+            translate(i * width, 0)
+
+            if slide['type'] == SlideType.WEBVIEW:
                 # Draw placeholder if page hasn't loaded yet OR webview is not visible
                 if not self.webview_manager.page_loaded or not (self.webview_manager.webview and self.webview_manager.webview.isVisible() and i == self.current_slide):
                     self.draw_webview_slide(painter, slide)
-            elif slide['type'] == SlideType.ADD:
-                self.draw_add_slide(painter)
+            else:
+                self._draw_slide_content(painter, slide)
 
-            painter.restore()
+            restore()
+
+    def _ensure_edit_card_geometry(self):
+        """Rebuild the edit-mode card geometry and border pens after a resize/scale change."""
+        if not self._edit_card_geom_dirty:
+            return
+        card_scale = 0.62
+        self._edit_card_scale = card_scale
+        self._edit_card_width = int(self.width() * card_scale)
+        self._edit_card_height = int(self.height() * card_scale)
+        self._edit_start_y = max(60, int(80 * self.scale_factor))
+        self._edit_center_x = self.width() // 2
+        self._edit_width = max(1, self.width())
+        self._edit_focus_pen = QPen(QColor(255, 255, 255, 220), 3)
+        self._edit_normal_pen = QPen(QColor(255, 255, 255, 90), 1)
+        self._edit_elevated_pen = QPen(QColor(255, 255, 255, 255), 3)
+        self._edit_card_geom_dirty = False
 
     def draw_slides_edit_mode(self, painter: QPainter):
         """Draw slides in edit mode with animated swiping and reordering"""
         if not self.slides:
             return
 
-        card_scale = 0.62
-        card_width = int(self.width() * card_scale)
-        card_height = int(self.height() * card_scale)
-        start_y = max(60, int(80 * self.scale_factor))
-        center_x = self.width() // 2
+        self._ensure_edit_card_geometry()
+        card_scale = self._edit_card_scale
+        card_width = self._edit_card_width
+        card_height = self._edit_card_height
+        start_y = self._edit_start_y
+        center_x = self._edit_center_x
 
-        width = max(1, self.width())
+        width = self._edit_width
         focus_position = -self.slide_container.offset_x / width
         focus_index = int(round(focus_position))
         focus_index = max(0, min(focus_index, len(self.slides) - 1))
@@ -3573,26 +3960,31 @@ class NDotClockSlider(QWidget):
     def _draw_card_at_position(self, painter: QPainter, slide: dict, card_x: float, card_y: float,
                                card_width: int, card_height: int, card_scale: float,
                                is_focus: bool, elevation: int = 0):
-        """Helper method to draw a single card at a specific position with optional elevation"""
-        painter.save()
+        """Helper method to draw a single card at a specific position with optional elevation
 
+        Pen/brush changes are left on the painter (every card sets its own and paintEvent
+        restores around the whole slide pass); only the content pass needs save/restore.
+        """
         # Draw shadow for elevation effect
         if elevation > 0:
             shadow_offset = elevation // 2
             shadow_blur = elevation * 2
+            set_brush = painter.setBrush
+            draw_rounded_rect = painter.drawRoundedRect
+            painter.setPen(_NO_PEN)
             for i in range(shadow_blur, 0, -2):
                 alpha = int(30 * (1 - i / shadow_blur))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QColor(0, 0, 0, alpha))
-                painter.drawRoundedRect(
+                set_brush(QColor(0, 0, 0, alpha))
+                draw_rounded_rect(
                     int(card_x - i // 2), int(card_y - i // 2 + shadow_offset),
                     card_width + i, card_height + i, 12 + i // 4, 12 + i // 4
                 )
 
-        # Draw card border/highlight
-        border_alpha = 255 if elevation > 0 else (220 if is_focus else 90)
-        border_width = 3 if (elevation > 0 or is_focus) else 1
-        painter.setPen(QPen(QColor(255, 255, 255, border_alpha), border_width))
+        # Draw card border/highlight (pens built in _ensure_edit_card_geometry)
+        if elevation > 0:
+            painter.setPen(self._edit_elevated_pen)
+        else:
+            painter.setPen(self._edit_focus_pen if is_focus else self._edit_normal_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(int(card_x), int(card_y), card_width, card_height, 12, 12)
 
@@ -3606,43 +3998,44 @@ class NDotClockSlider(QWidget):
             handle_x = card_x + (card_width - handle_width) / 2
             handle_y = card_y + handle_margin_top
 
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(255, 255, 255, 60))
-            painter.drawRoundedRect(
-                QRectF(handle_x, handle_y, handle_width, handle_height),
-                handle_height / 2,
-                handle_height / 2
-            )
-
-            dot_diameter = max(4, handle_height // 4)
-            dot_radius = dot_diameter / 2
-            dot_color = QColor(255, 255, 255, 170)
-            columns = 3
-            rows = 2
-            spacing_x = handle_width / (columns + 1)
-            spacing_y = handle_height / (rows + 1)
-
-            for row in range(rows):
-                for col in range(columns):
-                    cx = handle_x + (col + 1) * spacing_x
-                    cy = handle_y + (row + 1) * spacing_y
-                    painter.setBrush(dot_color)
-                    painter.drawEllipse(
-                        QRectF(
-                            cx - dot_radius,
-                            cy - dot_radius,
-                            dot_diameter,
-                            dot_diameter
-                        )
-                    )
+            # Paths are built in handle-local coordinates; only the origin moves per card
+            pill_path, dots_path = self._get_drag_handle_paths(handle_width, handle_height)
+            painter.translate(handle_x, handle_y)
+            painter.setPen(_NO_PEN)
+            painter.setBrush(_DRAG_HANDLE_COLOR)
+            painter.drawPath(pill_path)
+            painter.setBrush(_DRAG_HANDLE_DOT_COLOR)
+            painter.drawPath(dots_path)
+            painter.translate(-handle_x, -handle_y)
 
         # Draw slide content with opacity based on focus/elevation
+        if elevation == 0 and not is_focus:
+            # Unfocused cards are dimmed and static: blit a cached rendering
+            pixmap = self._get_edit_card_pixmap(slide, card_width, card_height, card_scale)
+            if pixmap is not None:
+                previous_opacity = painter.opacity()
+                painter.setOpacity(0.45)
+                painter.drawPixmap(int(card_x), int(card_y), pixmap)
+                if slide['type'] == SlideType.CLOCK:
+                    # The cached face has no colon: it keeps breathing, drawn live on top
+                    painter.save()
+                    painter.translate(int(card_x), int(card_y))
+                    painter.scale(card_scale, card_scale)
+                    self.draw_colon(painter, self._colon_center_x, self.colon_center_y)
+                    painter.restore()
+                painter.setOpacity(previous_opacity)
+                return
+
         painter.save()
         painter.translate(card_x, card_y)
         painter.setClipRect(0, 0, card_width, card_height)
         painter.scale(card_scale, card_scale)
         painter.setOpacity(1.0 if (elevation > 0 or is_focus) else 0.45)
+        self._draw_slide_content(painter, slide)
+        painter.restore()
 
+    def _draw_slide_content(self, painter: QPainter, slide: dict):
+        """Dispatch to the draw method for the slide's type"""
         if slide['type'] == SlideType.CLOCK:
             self.draw_clock_slide(painter)
         elif slide['type'] == SlideType.WEATHER:
@@ -3654,11 +4047,100 @@ class NDotClockSlider(QWidget):
         elif slide['type'] == SlideType.ADD:
             self.draw_add_slide(painter)
 
-        painter.restore()
-        painter.restore()
+    def _edit_card_content_key(self, slide: dict, card_width: int, card_height: int) -> Optional[tuple]:
+        """Cheap key describing what a card renders, or None when it must be drawn live"""
+        slide_type = slide['type']
+        data = slide.get('data') or {}
+        if slide_type == SlideType.CLOCK:
+            if self._digit_animations:
+                return None  # mid-fade frames must not be cached
+            # The breathing colon is drawn live over the cached card, so it is not part of the key
+            content = (datetime.now().strftime("%Y%m%d%H%M"), self._digit_color_scaled.rgba(),
+                       self._date_color.rgba())
+        elif slide_type == SlideType.WEATHER:
+            weather_options = self._ensure_weather_defaults(data)
+            content = (
+                tuple(weather_options.to_dict().items()),
+                tuple(self.weather_data.items()) if self.weather_data else None,
+                self.weather_loading,
+                self.location_city,
+            )
+        elif slide_type == SlideType.CUSTOM:
+            content = (data.get('text'),)
+        elif slide_type == SlideType.WEBVIEW:
+            content = (data.get('title'), data.get('url'), self.webview_manager.error_message)
+        elif slide_type == SlideType.ADD:
+            content = ()
+        else:
+            return None
+        return (slide_type, content, card_width, card_height, self.current_language, self.font_family)
+
+    def _get_drag_handle_paths(self, handle_width: int, handle_height: int) -> Tuple[QPainterPath, QPainterPath]:
+        """(pill, 3x2 grip dots) paths of the card drag handle, relative to its top-left"""
+        cache_key = (handle_width, handle_height)
+        paths = self._drag_handle_path_cache.get(cache_key)
+        if paths is not None:
+            return paths
+
+        pill_path = QPainterPath()
+        pill_path.addRoundedRect(QRectF(0, 0, handle_width, handle_height), handle_height / 2, handle_height / 2)
+
+        dot_diameter = max(4, handle_height // 4)
+        dot_radius = dot_diameter / 2
+        columns = 3
+        rows = 2
+        spacing_x = handle_width / (columns + 1)
+        spacing_y = handle_height / (rows + 1)
+        dots_path = QPainterPath()
+        for row in range(rows):
+            for col in range(columns):
+                cx = (col + 1) * spacing_x
+                cy = (row + 1) * spacing_y
+                dots_path.addEllipse(QRectF(cx - dot_radius, cy - dot_radius, dot_diameter, dot_diameter))
+
+        # Cards come in a handful of sizes (focused / unfocused / dragged)
+        if len(self._drag_handle_path_cache) >= 8:
+            del self._drag_handle_path_cache[next(iter(self._drag_handle_path_cache))]
+        paths = (pill_path, dots_path)
+        self._drag_handle_path_cache[cache_key] = paths
+        return paths
+
+    def _get_edit_card_pixmap(self, slide: dict, card_width: int, card_height: int,
+                              card_scale: float) -> Optional[QPixmap]:
+        """Return the cached rendering of an unfocused edit-mode card, rendering it on a miss"""
+        if card_width <= 0 or card_height <= 0:
+            return None
+        key = self._edit_card_content_key(slide, card_width, card_height)
+        if key is None:
+            return None
+        pixmap = self._edit_card_cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(card_width, card_height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        card_painter = QPainter(pixmap)
+        card_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card_painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        card_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        card_painter.scale(card_scale, card_scale)
+        if slide['type'] == SlideType.CLOCK:
+            self.draw_clock_slide(card_painter, with_colon=False)
+        else:
+            self._draw_slide_content(card_painter, slide)
+        card_painter.end()
+
+        # Rendering the clock may have just started a digit fade; keep that frame uncached
+        if self._edit_card_content_key(slide, card_width, card_height) != key:
+            return pixmap
+
+        if len(self._edit_card_cache) >= self._edit_card_cache_max_size:
+            del self._edit_card_cache[next(iter(self._edit_card_cache))]
+        self._edit_card_cache[key] = pixmap
+        return pixmap
 
-    def draw_clock_slide(self, painter: QPainter):
-        """Draw clock slide with digit change animations"""
+    def draw_clock_slide(self, painter: QPainter, with_colon: bool = True):
+        """Draw clock slide with digit change animations (``with_colon=False`` leaves out the colon)"""
         now = datetime.now()
         current_time = now.strftime("%H%M")
 
@@ -3677,6 +4159,31 @@ class NDotClockSlider(QWidget):
         canvas_width = self.width()
         canvas_height = self.height()
 
+        if not self._digit_animations and canvas_width > 0 and canvas_height > 0:
+            # Digits and date only change per minute: blit them and draw the breathing colon live
+            face_key = (current_time, now.day, now.month, now.year, canvas_width, canvas_height,
+                        self._digit_color_scaled.rgba(), self._date_color.rgba(),
+                        self.current_language, self.font_family)
+            cached = self._clock_face_cache
+            if cached is None or cached[0] != face_key:
+                # Repaint the previous minute's backbuffer in place when the size still fits
+                if cached is not None and cached[1].width() == canvas_width and cached[1].height() == canvas_height:
+                    face = cached[1]
+                else:
+                    face = QPixmap(canvas_width, canvas_height)
+                face.fill(_TRANSPARENT)
+                face_painter = QPainter(face)
+                face_painter.setRenderHint(_RH_ANTIALIASING)
+                face_painter.setRenderHint(_RH_SMOOTH_PIXMAP)
+                face_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+                self._draw_clock_face(face_painter, current_time, canvas_width, canvas_height, now)
+                face_painter.end()
+                cached = self._clock_face_cache = (face_key, face)
+            painter.drawPixmap(0, 0, cached[1])
+            if with_colon:
+                self.draw_colon(painter, self._colon_center_x, self.colon_center_y)
+            return
+
         current_x = float(self.clock_left_margin)
 
         # Draw digits with animations
@@ -3690,13 +4197,24 @@ class NDotClockSlider(QWidget):
             if index == 0 or index == 2:
                 current_x += self.inter_digit_spacing
             elif index == 1:
-                colon_center_x = current_x + self.colon_gap / 2
-                self.draw_colon(painter, colon_center_x, self.colon_center_y)
+                if with_colon:
+                    self.draw_colon(painter, current_x + self.colon_gap / 2, self.colon_center_y)
                 current_x += self.colon_gap
 
         # Draw date
         self.draw_date(painter, canvas_width, canvas_height, now)
 
+    def _draw_clock_face(self, painter: QPainter, current_time: str, canvas_width: int,
+                         canvas_height: int, now: datetime):
+        """Draw the static part of the clock (digits + date, no colon) for the clock face cache"""
+        current_x = float(self.clock_left_margin)
+        for index, digit_char in enumerate(current_time):
+            self.draw_digit(painter, digit_char, current_x + self.dot_size / 2, self.time_start_y,
+                            position=index)
+            current_x += self.digit_actual_width
+            current_x += self.colon_gap if index == 1 else self.inter_digit_spacing
+        self.draw_date(painter, canvas_width, canvas_height, now)
+
     def _get_dot_pixmap(self, radius: float, color: QColor, *, with_highlight: bool) -> QPixmap:
         radius_key = int(round(radius * 1000))
         cache_key = (radius_key, color.rgba(), with_highlight)
@@ -3708,11 +4226,11 @@ class NDotClockSlider(QWidget):
             if size % 2:
                 size += 1
             pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap.fill(_TRANSPARENT)
 
             temp_painter = QPainter(pixmap)
-            temp_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            temp_painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            temp_painter.setRenderHint(_RH_ANTIALIASING)
+            temp_painter.setRenderHint(_RH_SMOOTH_PIXMAP)
             center = size / 2
             self.draw_glow_dot(temp_painter, center, center, radius, color, with_highlight=with_highlight)
             temp_painter.end()
@@ -3733,11 +4251,10 @@ class NDotClockSlider(QWidget):
     def draw_digit(self, painter: QPainter, digit: str, start_x: float, start_y: float,
                   animation_data: Optional[Dict[str, any]] = None, position: int = 0):
         """Draw a single digit with optional fade animation"""
-        pattern = self.digit_patterns.get(digit, self.digit_patterns["0"])
         radius = self.dot_size / 2
-        pixmap = self._get_dot_pixmap(radius, self._digit_color_scaled, with_highlight=True)
-        half_w = pixmap.width() / 2
-        half_h = pixmap.height() / 2
+        dot_pixmap = self._get_dot_pixmap(radius, self._digit_color_scaled, with_highlight=True)
+        left = int(start_x - dot_pixmap.width() / 2)
+        top = int(start_y - dot_pixmap.height() / 2)
 
         if animation_data and animation_data['progress'] < 1.0:
             # Digit is animating - simple fade transition
@@ -3745,163 +4262,131 @@ class NDotClockSlider(QWidget):
 
             # Old digit fades out (first half)
             if progress < 0.5:
-                old_pattern = self.digit_patterns.get(animation_data['old_digit'], self.digit_patterns["0"])
                 old_alpha = 1.0 - (progress * 2)  # Fade out in first half
-
-                painter.save()
-                painter.setOpacity(old_alpha)
-
-                for row in range(5):
-                    for col in range(3):
-                        if old_pattern[row][col]:
-                            x = start_x + col * self.dot_spacing
-                            y = start_y + row * self.dot_spacing
-                            painter.drawPixmap(int(x - half_w), int(y - half_h), pixmap)
-
-                painter.restore()
+                glyph = self._get_digit_glyph(animation_data['old_digit'], dot_pixmap)
+                self._draw_pixmap_batch(painter, glyph, [(left, top)], old_alpha)
 
             # New digit fades in (second half)
             if progress > 0.5:
                 new_alpha = (progress - 0.5) * 2  # Fade in in second half
-
-                painter.save()
-                painter.setOpacity(new_alpha)
-
-                for row in range(5):
-                    for col in range(3):
-                        if pattern[row][col]:
-                            x = start_x + col * self.dot_spacing
-                            y = start_y + row * self.dot_spacing
-                            painter.drawPixmap(int(x - half_w), int(y - half_h), pixmap)
-
-                painter.restore()
+                glyph = self._get_digit_glyph(digit, dot_pixmap)
+                self._draw_pixmap_batch(painter, glyph, [(left, top)], new_alpha)
         else:
             # No animation - draw normally
-            for row in range(5):
-                for col in range(3):
-                    if pattern[row][col]:
-                        x = start_x + col * self.dot_spacing
-                        y = start_y + row * self.dot_spacing
-                        painter.drawPixmap(int(x - half_w), int(y - half_h), pixmap)
+            painter.drawPixmap(left, top, self._get_digit_glyph(digit, dot_pixmap))
+
+    def _get_digit_glyph(self, digit: str, dot_pixmap: QPixmap) -> QPixmap:
+        """Return the whole digit pre-composed from ``dot_pixmap`` (top-left = first dot's pixmap corner)"""
+        cache_key = (digit, dot_pixmap.cacheKey())
+        glyph = self._digit_glyph_cache.get(cache_key)
+        if glyph is None:
+            offsets_by_digit = self._digit_on_offsets
+            offsets = offsets_by_digit.get(digit) or offsets_by_digit["0"]
+            glyph = QPixmap(2 * self.dot_spacing + dot_pixmap.width(),
+                            4 * self.dot_spacing + dot_pixmap.height())
+            glyph.fill(_TRANSPARENT)
+            glyph_painter = QPainter(glyph)
+            self._draw_pixmap_batch(glyph_painter, dot_pixmap, offsets)
+            glyph_painter.end()
+            if len(self._digit_glyph_cache) >= 40:
+                # Stale entries for evicted dot pixmaps - start over
+                self._digit_glyph_cache.clear()
+            self._digit_glyph_cache[cache_key] = glyph
+        return glyph
+
+    @staticmethod
+    def _draw_pixmap_batch(painter: QPainter, pixmap: QPixmap, top_lefts: List[Tuple[int, int]],
+                           opacity: float = 1.0):
+        """Draw ``pixmap`` at every top-left point with a single drawPixmapFragments call"""
+        count = len(top_lefts)
+        if not count:
+            return
+        width = pixmap.width()
+        height = pixmap.height()
+        source = QRectF(0, 0, width, height)
+        half_w = width / 2
+        half_h = height / 2
+        create = QPainter.PixmapFragment.create
+        fragments = sip.array(QPainter.PixmapFragment, count)
+        for i, (left, top) in enumerate(top_lefts):
+            # Fragments are positioned by their centre
+            fragments[i] = create(QPointF(left + half_w, top + half_h), source, 1.0, 1.0, 0.0, opacity)
+        painter.drawPixmapFragments(fragments, pixmap)
 
     def draw_colon(self, painter: QPainter, x: float, y: float):
         """Draw colon between hours and minutes - ARM optimized with lookup table"""
-        # ARM optimization: Use pre-calculated breathing intensity from lookup table
-        breathing_intensity = self._breathing_lookup[self._breathing_frame]
-        
+        # ARM optimization: the glow pixmap for every breathing frame is precomputed
+        if self._colon_breathing_pixmaps is None:
+            self._rebuild_colon_breathing_cache()
+        pixmap = self._colon_breathing_pixmaps[self._breathing_frame]
+
+        vertical_offset = self.dot_spacing * 0.85
+        half_size = pixmap.width() // 2
+        left = int(x - half_size)
+        self._draw_pixmap_batch(painter, pixmap, [
+            (left, int(y - vertical_offset - half_size)),
+            (left, int(y + vertical_offset - half_size)),
+        ])
+
+    def _rebuild_colon_breathing_cache(self):
+        """Precompute the colon glow pixmap for every breathing frame"""
         # Use effective_brightness for stable rendering during software dimming
         brightness = self.effective_brightness
-
-        if self.colon_color.red() > max(self.colon_color.green(), self.colon_color.blue()):
-            color = QColor(
-                int(self.colon_color.red() * brightness * breathing_intensity),
-                int(self.colon_color.green() * brightness * breathing_intensity),
-                int(self.colon_color.blue() * brightness * breathing_intensity)
-            )
-            dot_radius = (self.dot_size / 2) * (0.95 + 0.05 * breathing_intensity)
+        colon = self._colon_color
+        red, green, blue = colon.red(), colon.green(), colon.blue()
+        base_radius = self.dot_size / 2
+
+        if red > max(green, blue):
+            # Red colons breathe. Intensity is quantized to 16 levels so the 100 frames
+            # share at most 16 glow pixmaps and the glow cache stays hot.
+            levels = self._COLON_BREATHING_LEVELS - 1
+            by_level: Dict[int, QPixmap] = {}
+            pixmaps = []
+            for intensity in self._breathing_lookup:
+                level = int(round(intensity * levels))
+                pixmap = by_level.get(level)
+                if pixmap is None:
+                    quantized = level / levels
+                    color = QColor(int(red * brightness * quantized),
+                                   int(green * brightness * quantized),
+                                   int(blue * brightness * quantized))
+                    pixmap = self._glow_dot_pixmap(base_radius * (0.95 + 0.05 * quantized), color)
+                    by_level[level] = pixmap
+                pixmaps.append(pixmap)
+            self._colon_breathing_pixmaps = pixmaps
         else:
-            color = QColor(self._colon_color_scaled)
-            dot_radius = self.dot_size / 2
-
-        vertical_offset = self.dot_spacing * 0.85
-        self.draw_glow_dot(painter, x, y - vertical_offset, dot_radius, color, with_highlight=False)
-        self.draw_glow_dot(painter, x, y + vertical_offset, dot_radius, color, with_highlight=False)
+            pixmap = self._glow_dot_pixmap(base_radius, self._colon_color_scaled)
+            self._colon_breathing_pixmaps = [pixmap] * len(self._breathing_lookup)
 
     def draw_glow_dot(self, painter: QPainter, x: float, y: float, radius: float,
                      color: QColor, *, with_highlight: bool = True):
         """ARM-optimized: Draw a glowing dot with full pixmap caching (матовый вид)"""
-        # Use effective_brightness to maintain cache stability
-        brightness = self.effective_brightness
-        
-        # Round radius and color for cache key (10% buckets for brightness variations - better for ARM)
-        radius_rounded = int(radius)
-        brightness_bucket = int(brightness * 10) / 10.0  # 10% increments - reduces cache misses
-        r = int(color.red() * brightness_bucket)
-        g = int(color.green() * brightness_bucket)
-        b = int(color.blue() * brightness_bucket)
-
-        # with_highlight больше не используется, убран из cache_key для инвалидации старого кэша
-        cache_key = (radius_rounded, r, g, b)
-
-        # Check cache
-        if cache_key in self._glow_dot_cache:
-            pixmap = self._glow_dot_cache[cache_key]
-            half_size = pixmap.width() // 2
-            painter.drawPixmap(int(x - half_size), int(y - half_size), pixmap)
-            return
-
-        # Not in cache - render to pixmap
-        is_red = color.red() > max(color.green(), color.blue()) * 1.2
-
-        # Calculate maximum size needed for pixmap
-        if brightness > 0.3:
-            halo_radius = radius * 2.0 if is_red else radius * 1.6
-        else:
-            halo_radius = radius
-
-        pixmap_size = int(halo_radius * 2.5)  # Extra padding for smooth edges
-        pixmap = QPixmap(pixmap_size, pixmap_size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        # Render to pixmap
-        pix_painter = QPainter(pixmap)
-        pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        pix_painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-        pix_painter.setPen(Qt.PenStyle.NoPen)
-
-        center_x = pixmap_size / 2
-        center_y = pixmap_size / 2
-
-        base_color = QColor(color)
-        base_alpha = int(235 * brightness)
-        base_color.setAlpha(base_alpha)
-
-        # Halo
-        if brightness > 0.3:
-            if is_red:
-                halo_alpha = int(180 * brightness)
-            else:
-                halo_alpha = int(120 * brightness * 0.7)
-
-            halo_gradient = QRadialGradient(QPointF(center_x, center_y), halo_radius)
-            glow_color = QColor(base_color)
-            glow_color.setAlpha(halo_alpha)
-            halo_gradient.setColorAt(0.0, glow_color)
-            glow_color.setAlpha(0)
-            halo_gradient.setColorAt(1.0, glow_color)
-
-            pix_painter.setBrush(halo_gradient)
-            pix_painter.drawEllipse(QPointF(center_x, center_y), halo_radius, halo_radius)
-
-        # Main circle - матовый вид без глянцевого highlight
-        inner_radius = radius * 0.9 if is_red else radius * 0.82
-        pix_painter.setBrush(base_color)
-        pix_painter.drawEllipse(QPointF(center_x, center_y), inner_radius, inner_radius)
-
-        pix_painter.end()
-
-        # Fix: Improved LRU cache management - remove oldest 20% when limit exceeded
-        if len(self._glow_dot_cache) >= self._glow_dot_cache_max_size:
-            # Remove oldest 20% of entries to prevent thrashing during resize
-            remove_count = max(1, self._glow_dot_cache_max_size // 5)
-            for _ in range(remove_count):
-                if self._glow_dot_cache:
-                    first_key = next(iter(self._glow_dot_cache))
-                    del self._glow_dot_cache[first_key]
-
-        # Add to cache
-        self._glow_dot_cache[cache_key] = pixmap
-
-        # Draw cached pixmap
+        pixmap = self._glow_dot_pixmap(radius, color)
         half_size = pixmap.width() // 2
         painter.drawPixmap(int(x - half_size), int(y - half_size), pixmap)
 
-    def _get_cached_font(self, family: str, size: int) -> QFont:
+    def _glow_dot_pixmap(self, radius: float, color: QColor) -> QPixmap:
+        """Return the cached glow-dot pixmap for ``radius``/``color`` at the current brightness"""
+        # Round radius and color for cache key (10% buckets for brightness variations - better for ARM)
+        brightness_bucket = int(self.effective_brightness * 10) / 10.0  # 10% increments - reduces cache misses
+        if brightness_bucket == 1.0:
+            # Full brightness (the usual case): channels are the key as-is
+            return _build_glow_dot_pixmap(int(radius), color.red(), color.green(), color.blue(), 1.0)
+        return _build_glow_dot_pixmap(
+            int(radius),
+            int(color.red() * brightness_bucket),
+            int(color.green() * brightness_bucket),
+            int(color.blue() * brightness_bucket),
+            brightness_bucket,
+        )
+
+    def _get_cached_font(self, family: str, size: int, weight: Optional[QFont.Weight] = None) -> QFont:
         """Get cached QFont object for performance with LRU eviction"""
-        cache_key = (family, size)
+        cache_key = (family, size, weight)
 
-        if cache_key in self._font_cache:
-            return self._font_cache[cache_key]
+        font = self._font_cache.get(cache_key)
+        if font is not None:
+            return font
 
         # LRU eviction if cache is full
         if len(self._font_cache) >= self._font_cache_max_size:
@@ -3910,7 +4395,7 @@ class NDotClockSlider(QWidget):
             del self._font_cache[oldest_key]
 
         # Create new font
-        font = QFont(family, size)
+        font = QFont(family, size) if weight is None else QFont(family, size, weight)
         try:
             font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias | QFont.StyleStrategy.PreferQuality)
         except AttributeError:
@@ -3923,10 +4408,14 @@ class NDotClockSlider(QWidget):
 
     def _get_cached_fontmetrics(self, family: str, size: int) -> QFontMetrics:
         """Get cached QFontMetrics object for performance with LRU eviction"""
-        cache_key = (family, size)
+        return self._get_font_and_metrics(family, size)[1]
 
-        if cache_key in self._fontmetrics_cache:
-            return self._fontmetrics_cache[cache_key]
+    def _get_font_and_metrics(self, family: str, size: int) -> Tuple[QFont, QFontMetrics]:
+        """Get the cached (QFont, QFontMetrics) pair for ``family``/``size`` in one lookup"""
+        cache_key = (family, size)
+        entry = self._fontmetrics_cache.get(cache_key)
+        if entry is not None:
+            return entry
 
         # LRU eviction if cache is full
         if len(self._fontmetrics_cache) >= self._fontmetrics_cache_max_size:
@@ -3935,34 +4424,40 @@ class NDotClockSlider(QWidget):
 
         # Create new font metrics
         font = self._get_cached_font(family, size)
-        metrics = QFontMetrics(font)
-        self._fontmetrics_cache[cache_key] = metrics
-        return metrics
+        entry = (font, QFontMetrics(font))
+        self._fontmetrics_cache[cache_key] = entry
+        return entry
 
     def draw_date(self, painter: QPainter, canvas_width: int, canvas_height: int, now: datetime):
         """Draw date below clock"""
         base_font_size = getattr(self, "_date_font_size", max(18, int(self.dot_size * 0.85)))
-        font = self._get_cached_font(self.font_family, base_font_size)
-        painter.setFont(font)
+        layout_key = (self.font_family, base_font_size, self.time_start_y, self.digit_actual_height,
+                      getattr(self, "_date_gap", None), canvas_width, canvas_height)
+        if layout_key != self._cached_date_layout_key:
+            metrics = self._get_cached_fontmetrics(self.font_family, base_font_size)
+            gap = getattr(self, "_date_gap", max(2, int(self.dot_spacing * 0.14)))
+            base_top = self.time_start_y + self.digit_actual_height + gap
+            rect_top = int(base_top - metrics.ascent() * 0.2)
+            self._cached_date_font = self._get_cached_font(self.font_family, base_font_size)
+            self._cached_date_rect = QRect(0, rect_top, canvas_width, canvas_height - rect_top)
+            self._cached_date_layout_key = layout_key
+
+        date_key = (now.year, now.month, now.day, self.current_language)
+        if date_key != self._cached_date_key:
+            weekday = self._weekdays_cur[now.weekday()]
+            month = self._months_cur[now.month - 1]
+            if self._date_month_first:
+                date_str = f"{weekday}, {month} {now.day}, {now.year}"
+            else:
+                date_str = f"{weekday}, {now.day} {month} {now.year}"
+            self._cached_date_str = date_str
+            self._cached_date_key = date_key
+
+        painter.setFont(self._cached_date_font)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         painter.setPen(self._date_color)
-
-        metrics = self._get_cached_fontmetrics(self.font_family, base_font_size)
-        text_height = metrics.height()
-        gap = getattr(self, "_date_gap", max(2, int(self.dot_spacing * 0.14)))
-        base_top = self.time_start_y + self.digit_actual_height + gap
-        rect_top = int(base_top - metrics.ascent() * 0.2)
-        rect_height = int(text_height + max(4, self.dot_spacing * 0.4))
-        weekdays = self.WEEKDAYS.get(self.current_language, self.WEEKDAYS["EN"])
-        months = self.MONTHS.get(self.current_language, self.MONTHS["EN"])
-
-        if self.current_language == "EN":
-            date_str = f"{weekdays[now.weekday()]}, {months[now.month - 1]} {now.day}, {now.year}"
-        else:
-            date_str = f"{weekdays[now.weekday()]}, {now.day} {months[now.month - 1]} {now.year}"
-
-        date_rect = QRect(0, rect_top, canvas_width, canvas_height - rect_top)
-        painter.drawText(date_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, date_str)
+        painter.drawText(self._cached_date_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                         self._cached_date_str)
 
     def draw_weather_loading(self, painter: QPainter):
         """Draw loading state for weather slide"""
@@ -3991,18 +4486,23 @@ class NDotClockSlider(QWidget):
 
     def _get_or_create_weather_icon(self, code: int, is_day: int, height: int) -> Optional[QPixmap]:
         """Get weather icon from cache or create it"""
-        cache_key = (code, is_day, height)
-        
-        if cache_key in self._svg_weather_cache:
-            return self._svg_weather_cache[cache_key]
-
-        # Not in cache, create it
-        icon_name = self.get_weather_icon_name(code, is_day)
-        icon_path = self._get_weather_icon_path(icon_name)
-        
-        if not os.path.exists(icon_path):
+        path_key = (code, is_day)
+        if path_key in self._icon_path_cache:
+            icon_path = self._icon_path_cache[path_key]
+        else:
+            icon_path = self._get_weather_icon_path(self.get_weather_icon_name(code, is_day))
+            self._icon_path_cache[path_key] = icon_path
+        if icon_path is None:
             return None
-            
+
+        cache_key = (icon_path, height)
+        pixmap = self._svg_weather_cache.get(cache_key)
+        if pixmap is not None:
+            return pixmap
+        return self._rasterize_weather_icon(icon_path, height)
+
+    def _rasterize_weather_icon(self, icon_path: str, height: int) -> Optional[QPixmap]:
+        """Render an SVG weather icon at ``height`` and store it in the icon cache"""
         try:
             svg_renderer = QSvgRenderer(icon_path)
             if not svg_renderer.isValid():
@@ -4012,13 +4512,15 @@ class NDotClockSlider(QWidget):
             aspect_ratio = svg_size.width() / max(1, svg_size.height())
             icon_width = int(height * aspect_ratio)
             
-            pixmap = QPixmap(icon_width, height)
-            pixmap.fill(Qt.GlobalColor.transparent)
+            # Rasterize into a QImage (CPU-side), then upload once as a QPixmap
+            image = QImage(icon_width, height, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
             
-            painter = QPainter(pixmap)
+            painter = QPainter(image)
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
             svg_renderer.render(painter, QRectF(0, 0, icon_width, height))
             painter.end()
+            pixmap = QPixmap.fromImage(image)
             
             # LRU Cache management
             if len(self._svg_weather_cache) >= self._svg_weather_cache_max_size:
@@ -4029,13 +4531,34 @@ class NDotClockSlider(QWidget):
                 except StopIteration:
                     pass
             
-            self._svg_weather_cache[cache_key] = pixmap
+            self._svg_weather_cache[(icon_path, height)] = pixmap
             return pixmap
             
         except Exception as e:
-            print(f"Error creating weather icon: {e}")
+            logger.debug("Error creating weather icon: %s", e)
             return None
 
+    def _weather_icon_height(self) -> int:
+        """Icon height used by draw_weather_slide for the current window size"""
+        content_height = int(self.height() * 0.7)
+        return max(60, int(content_height * 0.4))
+
+    def _prewarm_svg_icons(self):
+        """Rasterize every weather icon at the current size so weather paints only blit"""
+        icon_height = self._weather_icon_height()
+        seen: Set[str] = set()
+        for code in self._WEATHER_CODE_DESCRIPTIONS:
+            for is_day in (0, 1):
+                icon_path = self._icon_path_cache.get((code, is_day))
+                if icon_path is None and (code, is_day) not in self._icon_path_cache:
+                    icon_path = self._get_weather_icon_path(self.get_weather_icon_name(code, is_day))
+                    self._icon_path_cache[(code, is_day)] = icon_path
+                if icon_path is None or icon_path in seen:
+                    continue
+                seen.add(icon_path)
+                if (icon_path, icon_height) not in self._svg_weather_cache:
+                    self._rasterize_weather_icon(icon_path, icon_height)
+
     def draw_weather_slide(self, painter: QPainter, slide: Optional[dict] = None):
         """Draw weather slide"""
         slide_data_source = (slide or {}).get('data') if isinstance(slide, dict) else None
@@ -4067,18 +4590,17 @@ class NDotClockSlider(QWidget):
         # Draw city name above icon
         if hasattr(self, 'location_city') and self.location_city:
             city_font_size = max(12, int(content_height * 0.055))
-            city_font = self._get_cached_font(self.font_family, city_font_size)
+            city_font, city_metrics = self._get_font_and_metrics(self.font_family, city_font_size)
             city_color = self._scale_color_by_brightness(QColor(150, 150, 150))
             painter.setPen(city_color)
             painter.setFont(city_font)
-            city_metrics = self._get_cached_fontmetrics(self.font_family, city_font_size)
             city_height = city_metrics.height()
             city_rect = QRect(start_x, current_y, content_width, city_height)
             painter.drawText(city_rect, Qt.AlignmentFlag.AlignCenter, self.location_city)
             current_y += city_height + line_gap // 2
         
-        if slide_data.get('show_icon', True):
-            icon_height = max(60, int(content_height * 0.4))
+        if slide_data.show_icon:
+            icon_height = self._weather_icon_height()
             
             # Get icon (cached or created)
             cached_pixmap = self._get_or_create_weather_icon(code, is_day, icon_height)
@@ -4096,17 +4618,16 @@ class NDotClockSlider(QWidget):
             current_y += icon_height + line_gap
             sections_drawn = True
 
-        if slide_data.get('show_temp', True):
+        if slide_data.show_temp:
             temp = self.weather_data.get('temp', 0)
             temp_font_size = max(24, int(content_height * 0.25))
-            temp_font = self._get_cached_font(self.font_family, temp_font_size)
+            temp_font, temp_metrics = self._get_font_and_metrics(self.font_family, temp_font_size)
             temp_color = self.get_temperature_color(temp)
             temp_color = self._scale_color_by_brightness(temp_color)
             
             painter.setPen(temp_color)
             painter.setFont(temp_font)
             
-            temp_metrics = self._get_cached_fontmetrics(self.font_family, temp_font_size)
             temp_height = temp_metrics.height()
             temp_rect = QRect(start_x, current_y, content_width, temp_height)
             painter.drawText(temp_rect, Qt.AlignmentFlag.AlignCenter, f"{temp}°C")
@@ -4114,29 +4635,27 @@ class NDotClockSlider(QWidget):
             current_y += temp_height + line_gap
             sections_drawn = True
 
-        if slide_data.get('show_desc', True):
+        if slide_data.show_desc:
             desc = self.get_weather_description(code)
             desc_font_size = max(13, int(content_height * 0.065))
-            desc_font = self._get_cached_font(self.font_family, desc_font_size)
+            desc_font, desc_metrics = self._get_font_and_metrics(self.font_family, desc_font_size)
             desc_color = self._scale_color_by_brightness(QColor(200, 200, 200))
             painter.setPen(desc_color)
             painter.setFont(desc_font)
-            desc_metrics = self._get_cached_fontmetrics(self.font_family, desc_font_size)
             desc_height = desc_metrics.height()
             desc_rect = QRect(start_x, current_y, content_width, desc_height)
             painter.drawText(desc_rect, Qt.AlignmentFlag.AlignCenter, desc)
             current_y += desc_height + line_gap
             sections_drawn = True
 
-        if slide_data.get('show_wind', True):
+        if slide_data.show_wind:
             wind_speed = self.weather_data.get('wind', 0)
             wind_text = self._tr("weather_wind", speed=wind_speed)
             wind_font_size = max(11, int(content_height * 0.05))
-            wind_font = self._get_cached_font(self.font_family, wind_font_size)
+            wind_font, wind_metrics = self._get_font_and_metrics(self.font_family, wind_font_size)
             wind_color = self._scale_color_by_brightness(QColor(150, 150, 150))
             painter.setPen(wind_color)
             painter.setFont(wind_font)
-            wind_metrics = self._get_cached_fontmetrics(self.font_family, wind_font_size)
             wind_height = wind_metrics.height()
             wind_rect = QRect(start_x, current_y, content_width, wind_height)
             painter.drawText(wind_rect, Qt.AlignmentFlag.AlignCenter, wind_text)
@@ -4167,66 +4686,40 @@ class NDotClockSlider(QWidget):
 
     def get_weather_description(self, code: int) -> str:
         """Get weather description from code"""
-        weather_codes = {
-            0: {"RU": "Ясно", "EN": "Clear", "UA": "Ясно"},
-            1: {"RU": "Преимущественно ясно", "EN": "Mainly clear", "UA": "Переважно ясно"},
-            2: {"RU": "Переменная облачность", "EN": "Partly cloudy", "UA": "Мінлива хмарність"},
-            3: {"RU": "Пасмурно", "EN": "Overcast", "UA": "Похмуро"},
-            45: {"RU": "Туман", "EN": "Fog", "UA": "Туман"},
-            48: {"RU": "Изморозь", "EN": "Depositing rime fog", "UA": "Паморозь"},
-            51: {"RU": "Легкая морось", "EN": "Light drizzle", "UA": "Легка мряка"},
-            53: {"RU": "Морось", "EN": "Moderate drizzle", "UA": "Мряка"},
-            55: {"RU": "Сильная морось", "EN": "Dense drizzle", "UA": "Сильна мряка"},
-            56: {"RU": "Ледяная морось", "EN": "Light freezing drizzle", "UA": "Крижана мряка"},
-            57: {"RU": "Сильная ледяная морось", "EN": "Dense freezing drizzle", "UA": "Сильна крижана мряка"},
-            61: {"RU": "Небольшой дождь", "EN": "Light rain", "UA": "Невеликий дощ"},
-            63: {"RU": "Дождь", "EN": "Rain", "UA": "Дощ"},
-            65: {"RU": "Сильный дождь", "EN": "Heavy rain", "UA": "Сильний дощ"},
-            66: {"RU": "Ледяной дождь", "EN": "Light freezing rain", "UA": "Крижаний дощ"},
-            67: {"RU": "Сильный ледяной дождь", "EN": "Heavy freezing rain", "UA": "Сильний крижаний дощ"},
-            71: {"RU": "Небольшой снег", "EN": "Light snow", "UA": "Невеликий сніг"},
-            73: {"RU": "Снег", "EN": "Snow", "UA": "Сніг"},
-            75: {"RU": "Сильный снег", "EN": "Heavy snow", "UA": "Сильний сніг"},
-            77: {"RU": "Снежные зерна", "EN": "Snow grains", "UA": "Снігові зерна"},
-            80: {"RU": "Легкий ливень", "EN": "Light rain showers", "UA": "Легкий злива"},
-            81: {"RU": "Ливень", "EN": "Rain showers", "UA": "Злива"},
-            82: {"RU": "Сильный ливень", "EN": "Heavy rain showers", "UA": "Сильна злива"},
-            85: {"RU": "Снег с дождем", "EN": "Light snow showers", "UA": "Сніг з дощем"},
-            86: {"RU": "Сильный снег с дождем", "EN": "Heavy snow showers", "UA": "Сильний сніг з дощем"},
-            95: {"RU": "Гроза", "EN": "Thunderstorm", "UA": "Гроза"},
-            96: {"RU": "Гроза с градом", "EN": "Thunderstorm with slight hail", "UA": "Гроза з градом"},
-            99: {"RU": "Гроза с сильным градом", "EN": "Thunderstorm with heavy hail", "UA": "Гроза з сильним градом"}
-        }
-
-        desc_dict = weather_codes.get(code, {"RU": "Неизвестно", "EN": "Unknown", "UA": "Невідомо"})
+        desc_dict = self._WEATHER_CODE_DESCRIPTIONS.get(code, self._WEATHER_UNKNOWN_DESCRIPTION)
         return desc_dict.get(self.current_language, desc_dict["EN"])
 
     def get_weather_icon_name(self, code: int, is_day: int) -> str:
         """Get icon filename for weather code"""
-        if code in [0, 1]:  # Clear / Mainly clear
+        if code in self._WEATHER_CLEAR_CODES:  # Clear / Mainly clear
             return "clear day.svg" if is_day else "clear night.svg"
         elif code == 2:  # Partly cloudy
             return "partly cloudy day.svg" if is_day else "partly cloudy night.svg"
-        elif code in [3, 45, 48]:  # Overcast / Fog / Rime fog
+        elif code in self._WEATHER_CLOUDY_CODES:  # Overcast / Fog / Rime fog
             return "cloudy day.svg"
-        elif code in [51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82]:  # Rain / Drizzle / Showers
+        elif code in self._WEATHER_RAIN_CODES:  # Rain / Drizzle / Showers
             return "showers day.svg"
-        elif code in [71, 73, 75, 77, 85, 86]:  # Snow / Snow grains / Snow showers
+        elif code in self._WEATHER_SNOW_CODES:  # Snow / Snow grains / Snow showers
             return "cloudy day.svg"  # Use cloudy icon for snow
-        elif code in [95, 96, 99]:  # Thunderstorm / Hail
+        elif code in self._WEATHER_STORM_CODES:  # Thunderstorm / Hail
             return "showers day.svg"
         else:
             return "no data.svg"
 
-    def _get_weather_icon_path(self, icon_name: str) -> str:
-        """Get absolute path for weather icon"""
+    def _get_weather_icon_path(self, icon_name: str) -> Optional[str]:
+        """Get absolute path for weather icon (None if neither it nor the fallback exists)"""
         resources_dir = self.get_resource_dir("resources")
-        icon_path = os.path.join(resources_dir, icon_name)
-        
-        if not os.path.exists(icon_path):
-            icon_path = os.path.join(resources_dir, "no data.svg")
-            
-        return icon_path
+        if self._available_icons is None:
+            try:
+                self._available_icons = set(os.listdir(resources_dir))
+            except OSError:
+                self._available_icons = set()
+
+        if icon_name not in self._available_icons:
+            icon_name = "no data.svg"
+            if icon_name not in self._available_icons:
+                return None
+        return os.path.join(resources_dir, icon_name)
 
     def draw_custom_slide(self, painter: QPainter, slide: dict):
         """Draw custom text slide"""
@@ -4234,7 +4727,7 @@ class NDotClockSlider(QWidget):
 
         painter.setPen(self._scale_color_by_brightness(QColor(220, 220, 220)))
         font_size = max(14, int(24 * self.scale_factor))
-        painter.setFont(QFont(self.font_family, font_size))
+        painter.setFont(self._get_cached_font(self.font_family, font_size))
 
         margin = int(50 * self.scale_factor)
         text_rect = QRect(margin, margin, self.width() - 2 * margin, self.height() - 2 * margin)
@@ -4259,50 +4752,92 @@ class NDotClockSlider(QWidget):
             
         icon_color = self._scale_color_by_brightness(icon_color)
 
-        # Draw icon
-        painter.setPen(icon_color)
+        # Draw icon (glyph pre-rendered once per icon/colour/size)
         icon_size = max(50, int(80 * self.scale_factor))
         icon_font_size = max(30, int(50 * self.scale_factor))
-        painter.setFont(QFont(self.font_family, icon_font_size, QFont.Weight.Bold))
+        icon_pixmap = self._get_webview_icon_pixmap(icon, icon_color, icon_font_size, icon_size)
 
         icon_y = int(self.height() * 0.4)
-        icon_rect = QRect(0, icon_y - icon_size // 2, self.width(), icon_size)
-        painter.drawText(icon_rect, Qt.AlignmentFlag.AlignCenter, icon)
+        painter.drawPixmap((self.width() - icon_pixmap.width()) // 2, icon_y - icon_size // 2, icon_pixmap)
 
         # Draw title below
         painter.setPen(self._scale_color_by_brightness(QColor(240, 240, 240)))
         title_font_size = max(16, int(24 * self.scale_factor))
-        painter.setFont(QFont(self.font_family, title_font_size, QFont.Weight.Bold))
+        title_font = self._get_cached_font(self.font_family, title_font_size, QFont.Weight.Bold)
+        painter.setFont(title_font)
 
         title_y = int(self.height() * 0.58)
         margin = int(30 * self.scale_factor)
         title_rect = QRect(margin, title_y, self.width() - 2 * margin, int(self.height() * 0.2))
-        painter.drawText(title_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap, title)
+        # Wrapped, centred title: laid out once per (title, font, width)
+        painter.drawStaticText(title_rect.topLeft(), self._get_webview_title_static(title, title_font, title_rect.width()))
 
         # Show error message if any
         if self.webview_manager.error_message:
             painter.setPen(self._scale_color_by_brightness(QColor(255, 110, 110)))
-            error_font = QFont(self.font_family, max(12, int(16 * self.scale_factor)))
+            error_font = self._get_cached_font(self.font_family, max(12, int(16 * self.scale_factor)))
             painter.setFont(error_font)
-            error_rect = QRect(margin, title_rect.bottom() + self.get_spacing(8, 6),
+            error_rect = QRect(margin, title_rect.bottom() + self._sized.sp_8_6,
                                self.width() - 2 * margin, int(self.height() * 0.18))
             painter.drawText(error_rect,
                              Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
                              self.webview_manager.error_message)
 
 
+    def _get_webview_title_static(self, title: str, font: QFont, width: int) -> QStaticText:
+        """Word-wrapped, horizontally centred webview title as a prepared QStaticText"""
+        cache_key = (title, font.key(), width)
+        static_text = self._webview_title_static_cache.get(cache_key)
+        if static_text is not None:
+            return static_text
+
+        static_text = QStaticText(title)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setTextWidth(max(1, width))
+        static_text.setTextOption(QTextOption(Qt.AlignmentFlag.AlignHCenter))
+        static_text.prepare(QTransform(), font)
+
+        if len(self._webview_title_static_cache) >= 8:
+            del self._webview_title_static_cache[next(iter(self._webview_title_static_cache))]
+        self._webview_title_static_cache[cache_key] = static_text
+        return static_text
+
+    def _get_webview_icon_pixmap(self, icon: str, color: QColor, font_size: int, icon_size: int) -> QPixmap:
+        """Render a webview slide icon glyph (house/play/globe) into a cached transparent pixmap"""
+        cache_key = (icon, color.rgba(), font_size, icon_size, self.font_family)
+        pixmap = self._webview_icon_cache.get(cache_key)
+        if pixmap is not None:
+            return pixmap
+
+        font = self._get_cached_font(self.font_family, font_size, QFont.Weight.Bold)
+        glyph_width = QFontMetrics(font).horizontalAdvance(icon)
+        pixmap = QPixmap(max(icon_size, glyph_width + 4), icon_size)
+        pixmap.fill(_TRANSPARENT)
+        icon_painter = QPainter(pixmap)
+        icon_painter.setRenderHint(_RH_ANTIALIASING)
+        icon_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        icon_painter.setPen(color)
+        icon_painter.setFont(font)
+        icon_painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, icon)
+        icon_painter.end()
+
+        if len(self._webview_icon_cache) >= 8:
+            del self._webview_icon_cache[next(iter(self._webview_icon_cache))]
+        self._webview_icon_cache[cache_key] = pixmap
+        return pixmap
+
     def draw_add_slide(self, painter: QPainter):
         """Draw add button slide"""
         painter.setPen(self._scale_color_by_brightness(QColor(150, 150, 150)))
         plus_font_size = max(28, int(40 * self.scale_factor))
-        painter.setFont(QFont(self.font_family, plus_font_size, QFont.Weight.Bold))
+        painter.setFont(self._get_cached_font(self.font_family, plus_font_size, QFont.Weight.Bold))
 
         plus_text = "+"
         text_rect = QRect(0, 0, self.width(), self.height())
         painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, plus_text)
 
         label_font_size = max(12, int(16 * self.scale_factor))
-        painter.setFont(QFont(self.font_family, label_font_size))
+        painter.setFont(self._get_cached_font(self.font_family, label_font_size))
         offset = int(40 * self.scale_factor)
         label_rect = QRect(0, self.height() // 2 + offset, self.width(), self.height() - (self.height() // 2 + offset))
         painter.drawText(label_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self._tr("add_card_slide_label"))
@@ -4314,193 +4849,203 @@ class NDotClockSlider(QWidget):
 
         painter.save()
         painter.setOpacity(self._nav_opacity)
+        self._draw_dot_strip(painter, self.height() - self._sized.nav_dots_bottom)
+        painter.restore()
 
-        dot_width = int(22 * self.scale_factor)
-        dot_height = int(6 * self.scale_factor)
-        dot_spacing = int(12 * self.scale_factor)
+    def _draw_dot_strip(self, painter: QPainter, y: int):
+        """Draw one dot per slide at ``y``: inactive dots in one batch, then the active dot"""
+        sized = self._sized
+        dot_width = sized.nav_dot_w
+        dot_step = dot_width + sized.nav_dot_gap
+        slide_count = len(self.slides)
 
-        total_width = len(self.slides) * dot_width + (len(self.slides) - 1) * dot_spacing
+        total_width = slide_count * dot_width + (slide_count - 1) * sized.nav_dot_gap
         start_x = (self.width() - total_width) // 2
-        y = self.height() - int(42 * self.scale_factor)
-
-        radius = dot_height / 2
-        for i in range(len(self.slides)):
-            x = start_x + i * (dot_width + dot_spacing)
-
-            painter.setPen(Qt.PenStyle.NoPen)
-            if i == self.current_slide:
-                dot_color = self._scale_color_by_brightness(QColor(255, 255, 255))
-                painter.setBrush(dot_color)
-            else:
-                dot_color = self._scale_color_by_brightness(QColor(70, 70, 70))
-                painter.setBrush(dot_color)
 
-            painter.drawRoundedRect(x, y, dot_width, dot_height, radius, radius)
+        active_pixmap, inactive_pixmap = self._get_nav_dot_pixmaps()
+        current = self.current_slide
+        self._draw_pixmap_batch(
+            painter, inactive_pixmap,
+            [(start_x + i * dot_step, y) for i in range(slide_count) if i != current],
+        )
+        if 0 <= current < slide_count:
+            painter.drawPixmap(start_x + current * dot_step, y, active_pixmap)
 
-        painter.restore()
+    def _get_nav_dot_pixmaps(self) -> Tuple[QPixmap, QPixmap]:
+        """(active, inactive) pill pixmaps for the dot strips, re-rendered on size/colour change"""
+        # Use cached colors if available, otherwise generate (lazy init)
+        if not hasattr(self, '_edit_lang_active_bg'):
+            self._update_cached_colors()
 
-    def draw_edit_mode_ui(self, painter: QPainter):
-        """Draw edit mode UI elements"""
+        sized = self._sized
+        active_color = self._edit_active_dot_color
+        inactive_color = self._edit_inactive_dot_color
+        key = (sized.nav_dot_w, sized.nav_dot_h, active_color.rgba(), inactive_color.rgba())
+        cached = self._nav_dot_pixmaps
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        width = max(1, sized.nav_dot_w)
+        height = max(1, sized.nav_dot_h)
+        radius = height / 2
+        pixmaps = []
+        for color in (active_color, inactive_color):
+            pixmap = QPixmap(width, height)
+            pixmap.fill(_TRANSPARENT)
+            dot_painter = QPainter(pixmap)
+            dot_painter.setRenderHint(_RH_ANTIALIASING)
+            dot_painter.setPen(_NO_PEN)
+            dot_painter.setBrush(color)
+            dot_painter.drawRoundedRect(pixmap.rect(), radius, radius)
+            dot_painter.end()
+            pixmaps.append(pixmap)
+
+        self._nav_dot_pixmaps = (key, pixmaps[0], pixmaps[1])
+        return pixmaps[0], pixmaps[1]
+
+    def draw_edit_mode_ui(self, painter: QPainter, dirty_rect: Optional[QRect] = None):
+        """Draw edit mode UI elements (the dot strip and buttons are skipped when ``dirty_rect`` misses them)"""
+        if not self.edit_mode:
+            return  # only _paint_edit calls this; guard against stray callers in normal mode
+        sized = self._sized
+        if not hasattr(self, '_edit_lang_active_bg'):
+            self._update_cached_colors()
         # Fullscreen toggle button in top-right corner
-        button_size = int(40 * self.scale_factor)
-        button_margin = int(20 * self.scale_factor)
+        button_size = sized.fs_button
+        button_margin = sized.fs_margin
         button_x = self.width() - button_size - button_margin
         button_y = button_margin
 
         # Draw button background
-        button_rect = QRectF(button_x, button_y, button_size, button_size)
+        button_rect = QRect(button_x, button_y, button_size, button_size)
         painter.setPen(Qt.PenStyle.NoPen)
-        bg_color = self._scale_color_by_brightness(QColor(70, 70, 70, 180))
-        painter.setBrush(bg_color)
+        painter.setBrush(self._edit_button_bg)
         radius = button_size / 4
         painter.drawRoundedRect(button_rect, radius, radius)
 
         # Draw fullscreen icon
-        icon_padding = int(10 * self.scale_factor)
+        icon_padding = sized.fs_icon_pad
         icon_x = button_x + icon_padding
         icon_y = button_y + icon_padding
-        icon_size = button_size - 2 * icon_padding
 
-        icon_color = self._scale_color_by_brightness(QColor(220, 220, 220))
-        painter.setPen(QPen(icon_color, max(2, int(2 * self.scale_factor))))
+        pen_width = sized.fs_pen_w
+        icon_pen = self._pen_icon_cache.get(pen_width)
+        if icon_pen is None:
+            icon_pen = QPen(self._edit_lang_inactive_text, pen_width)
+            self._pen_icon_cache[pen_width] = icon_pen
+        painter.setPen(icon_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
 
-        if self.is_fullscreen:
-            # Draw "exit fullscreen" icon (arrows pointing inward)
-            corner_size = icon_size // 3
-            # Top-left arrow
-            painter.drawLine(icon_x + corner_size, icon_y, icon_x, icon_y)
-            painter.drawLine(icon_x, icon_y, icon_x, icon_y + corner_size)
-            # Top-right arrow
-            painter.drawLine(icon_x + icon_size - corner_size, icon_y, icon_x + icon_size, icon_y)
-            painter.drawLine(icon_x + icon_size, icon_y, icon_x + icon_size, icon_y + corner_size)
-            # Bottom-left arrow
-            painter.drawLine(icon_x, icon_y + icon_size - corner_size, icon_x, icon_y + icon_size)
-            painter.drawLine(icon_x, icon_y + icon_size, icon_x + corner_size, icon_y + icon_size)
-            # Bottom-right arrow
-            painter.drawLine(icon_x + icon_size, icon_y + icon_size - corner_size, icon_x + icon_size, icon_y + icon_size)
-            painter.drawLine(icon_x + icon_size - corner_size, icon_y + icon_size, icon_x + icon_size, icon_y + icon_size)
-        else:
-            # Draw "enter fullscreen" icon (arrows pointing outward)
-            corner_size = icon_size // 3
-            # Top-left arrow
-            painter.drawLine(icon_x, icon_y + corner_size, icon_x, icon_y)
-            painter.drawLine(icon_x, icon_y, icon_x + corner_size, icon_y)
-            # Top-right arrow
-            painter.drawLine(icon_x + icon_size, icon_y + corner_size, icon_x + icon_size, icon_y)
-            painter.drawLine(icon_x + icon_size, icon_y, icon_x + icon_size - corner_size, icon_y)
-            # Bottom-left arrow
-            painter.drawLine(icon_x, icon_y + icon_size - corner_size, icon_x, icon_y + icon_size)
-            painter.drawLine(icon_x, icon_y + icon_size, icon_x + corner_size, icon_y + icon_size)
-            # Bottom-right arrow
-            painter.drawLine(icon_x + icon_size, icon_y + icon_size - corner_size, icon_x + icon_size, icon_y + icon_size)
-            painter.drawLine(icon_x + icon_size, icon_y + icon_size, icon_x + icon_size - corner_size, icon_y + icon_size)
-
-        # Hint text at top
-        painter.setPen(QColor(170, 170, 170))
-        hint_font_size = max(10, int(12 * self.scale_factor))
-        hint_font = QFont(self.font_family, hint_font_size, QFont.Weight.Medium)
+        painter.translate(icon_x, icon_y)
+        painter.drawLines(sized.fs_lines_exit if self.is_fullscreen else sized.fs_lines_enter)
+        painter.translate(-icon_x, -icon_y)
+
+        # Hint text at top (laid out once per text/font, see _get_hint_static_text)
+        painter.setPen(self._edit_hint_color)
+        hint_font = self._get_cached_font(self.font_family, sized.hint_font, QFont.Weight.Medium)
         painter.setFont(hint_font)
-        hint_text = self._tr("edit_hint")
-        hint_top = int(26 * self.scale_factor)
-        hint_rect = QRect(0, hint_top, self.width(), self.height() - hint_top)
-        painter.drawText(hint_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, hint_text)
+        hint_static = self._get_hint_static_text(hint_font)
+        hint_x = (self.width() - hint_static.size().width()) / 2
+        painter.drawStaticText(QPointF(hint_x, sized.hint_top), hint_static)
 
         # Navigation dots indicator
-        self.draw_edit_mode_dots(painter)
+        if self._dots_band_dirty(dirty_rect, sized.edit_dots_bottom):
+            self.draw_edit_mode_dots(painter)
         
         # Language buttons at bottom
-        self.draw_language_buttons(painter)
+        self.draw_language_buttons(painter, dirty_rect)
+
+    def _get_hint_static_text(self, font: QFont) -> QStaticText:
+        """Edit-mode hint as QStaticText, re-laid out only when the text or font changes"""
+        hint_text = self._tr("edit_hint")
+        key = (hint_text, font.key())
+        if self._hint_static is None or self._hint_static_key != key:
+            static_text = QStaticText(hint_text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), font)
+            self._hint_static = static_text
+            self._hint_static_key = key
+        return self._hint_static
 
     def draw_edit_mode_dots(self, painter: QPainter):
         """Draw navigation dots in edit mode"""
-        dot_width = int(22 * self.scale_factor)
-        dot_height = int(6 * self.scale_factor)
-        dot_spacing = int(12 * self.scale_factor)
-
-        total_width = len(self.slides) * dot_width + (len(self.slides) - 1) * dot_spacing
-        start_x = (self.width() - total_width) // 2
-        y = self.height() - int(76 * self.scale_factor)
-
-        # Use cached colors if available, otherwise generate (lazy init)
-        if not hasattr(self, '_edit_active_dot_color'):
-            self._edit_active_dot_color = self._scale_color_by_brightness(QColor(255, 255, 255))
-            self._edit_inactive_dot_color = self._scale_color_by_brightness(QColor(70, 70, 70))
-
-        radius = dot_height / 2
-        painter.setPen(Qt.PenStyle.NoPen)
-        
-        for i in range(len(self.slides)):
-            x = start_x + i * (dot_width + dot_spacing)
+        self._draw_dot_strip(painter, self.height() - self._sized.edit_dots_bottom)
 
-            if i == self.current_slide:
-                painter.setBrush(self._edit_active_dot_color)
-            else:
-                painter.setBrush(self._edit_inactive_dot_color)
-
-            painter.drawRoundedRect(x, y, dot_width, dot_height, radius, radius)
-
-    def draw_language_buttons(self, painter: QPainter):
+    def draw_language_buttons(self, painter: QPainter, dirty_rect: Optional[QRect] = None):
         """Draw language selection buttons and update button"""
-        layout = self._compute_language_control_layout()  # исправлено: унифицируем размеры и hit-box контролов
+        # Same geometry as the hit-tests; invalidated on resize/scale change
+        layout = self._language_control_layout or self._compute_language_control_layout()  # исправлено: унифицируем размеры и hit-box контролов
+        if dirty_rect is not None and dirty_rect.bottom() < layout["baseline_y"]:
+            return  # the repaint ends above the bottom button row
 
         # Initialize cache if needed (lazy)
         if not hasattr(self, '_edit_lang_active_bg'):
              self._update_cached_colors()
 
-        lang_font_size = self.get_ui_size(12, 10)
-        painter.setFont(QFont(self.font_family, lang_font_size, QFont.Weight.Medium))
-        radius = layout["button_height"] / 2
-
+        button = self._get_control_button_pixmap
+        draw_pixmap = painter.drawPixmap
+        current_language = self.current_language
         for lang, rect in layout["language_rects"]:
-            painter.setPen(Qt.PenStyle.NoPen)
-            if lang == self.current_language:
-                painter.setBrush(self._edit_lang_active_bg)
-                text_color = self._edit_lang_active_text
+            if lang == current_language:
+                pixmap = button(lang, rect, self._edit_lang_active_bg, self._edit_lang_active_text)
             else:
-                painter.setBrush(self._edit_lang_inactive_bg)
-                text_color = self._edit_lang_inactive_text
-                
-            painter.drawRoundedRect(rect, radius, radius)
-            painter.setPen(text_color)
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, lang)
+                pixmap = button(lang, rect, self._edit_lang_inactive_bg, self._edit_lang_inactive_text)
+            draw_pixmap(rect.topLeft(), pixmap)
 
         update_rect = layout["update_rect"]
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(self._edit_update_bg)
-        painter.drawRoundedRect(update_rect, radius, radius)
-        painter.setPen(self._edit_update_text)
-        painter.drawText(update_rect, Qt.AlignmentFlag.AlignCenter, f"UPDATE · v{__version__}")
+        painter.drawPixmap(update_rect.topLeft(), button(
+            f"UPDATE · v{__version__}", update_rect, self._edit_update_bg, self._edit_update_text))
 
         autostart_rect = layout["autostart_rect"]
         autostart_enabled = AutostartManager.get_autostart_status()
-        painter.setPen(Qt.PenStyle.NoPen)
         if autostart_enabled:
-            painter.setBrush(self._edit_autostart_active_bg)
-            text_color = self._edit_autostart_text
+            bg_color, text_color = self._edit_autostart_active_bg, self._edit_autostart_text
         else:
-            painter.setBrush(self._edit_lang_inactive_bg)
-            text_color = self._edit_lang_inactive_text
-            
-        painter.drawRoundedRect(autostart_rect, radius, radius)
-        painter.setPen(text_color)
-        painter.drawText(autostart_rect, Qt.AlignmentFlag.AlignCenter, self._tr("autostart_button"))
+            bg_color, text_color = self._edit_lang_inactive_bg, self._edit_lang_inactive_text
+        painter.drawPixmap(autostart_rect.topLeft(), button(
+            self._tr("autostart_button"), autostart_rect, bg_color, text_color))
 
         # WiFi button
         wifi_rect = layout["wifi_rect"]
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(self._scale_color_by_brightness(QColor(50, 120, 180, 200)))
-        painter.drawRoundedRect(wifi_rect, radius, radius)
-        painter.setPen(self._scale_color_by_brightness(QColor(255, 255, 255)))
-        painter.drawText(wifi_rect, Qt.AlignmentFlag.AlignCenter, "WiFi")
+        painter.drawPixmap(wifi_rect.topLeft(), button("WiFi", wifi_rect, self._edit_wifi_bg, self._edit_autostart_text))
+
+    def _get_control_button_pixmap(self, text: str, rect: QRect, bg_color: QColor, text_color: QColor) -> QPixmap:
+        """Pill-shaped edit-mode control button (background + label), rasterized once per look"""
+        font_size = self._sized.ui_12_10
+        cache_key = (text, rect.width(), rect.height(), bg_color.rgba(), text_color.rgba(),
+                     font_size, self.font_family)
+        pixmap = self._control_button_cache.get(cache_key)
+        if pixmap is not None:
+            return pixmap
 
-    def save_settings(self):
-        """Save settings to file"""
+        pixmap = QPixmap(rect.width(), rect.height())
+        pixmap.fill(_TRANSPARENT)
+        button_painter = QPainter(pixmap)
+        button_painter.setRenderHint(_RH_ANTIALIASING)
+        button_painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        local_rect = pixmap.rect()
+        radius = rect.height() / 2
+        button_painter.setPen(_NO_PEN)
+        button_painter.setBrush(bg_color)
+        button_painter.drawRoundedRect(local_rect, radius, radius)
+        button_painter.setPen(text_color)
+        button_painter.setFont(self._get_cached_font(self.font_family, font_size, QFont.Weight.Medium))
+        button_painter.drawText(local_rect, Qt.AlignmentFlag.AlignCenter, text)
+        button_painter.end()
+
+        if len(self._control_button_cache) >= self._control_button_cache_max_size:
+            del self._control_button_cache[next(iter(self._control_button_cache))]
+        self._control_button_cache[cache_key] = pixmap
+        return pixmap
+
+    def save_settings(self, blocking: bool = False):
+        """Save settings to file (written in the background unless blocking)"""
         settings = {
             'user_brightness': self.brightness_manager.manual_brightness,
-            'digit_color': self.digit_color,
-            'background_color': self.background_color,
-            'colon_color': self.colon_color,
+            # Read-only snapshot; the public getters would hand out defensive copies
+            'digit_color': self._digit_color,
+            'background_color': self._background_color,
+            'colon_color': self._colon_color,
             'language': self.current_language,
             'slides': self.slides,
             'location': {'lat': self.location_lat, 'lon': self.location_lon, 'city': self.location_city},
@@ -4510,8 +5055,9 @@ class NDotClockSlider(QWidget):
             'auto_brightness_interval_ms': self.brightness_manager._auto_brightness_interval_ms,
             'auto_brightness_min': self.brightness_manager._auto_brightness_min,
             'auto_brightness_max': self.brightness_manager._auto_brightness_max,
+            'webview_cache_to_disk': self.webview_manager.cache_to_disk,
         }
-        self.settings_manager.save_settings(settings)
+        self.settings_manager.save_settings(settings, blocking=blocking)
 
     def _scale_color_by_brightness(self, color: QColor) -> QColor:
         """Scales color by current effective brightness"""
@@ -4554,7 +5100,14 @@ class NDotClockSlider(QWidget):
 
     @digit_color.setter
     def digit_color(self, value):
-        color = value if isinstance(value, QColor) else QColor(*value)
+        # Color buttons emit ARGB ints; only build a QColor when the value changed
+        if isinstance(value, int):
+            value &= 0xFFFFFFFF  # a signed ARGB int would overflow QColor.fromRgba
+            if self._digit_color.rgba() == value:
+                return
+            color = QColor.fromRgba(value)
+        else:
+            color = value if isinstance(value, QColor) else QColor(*value)
         if self._digit_color.rgba() != color.rgba():
             self._digit_color = QColor(color)
             self._update_cached_colors()
@@ -4566,7 +5119,13 @@ class NDotClockSlider(QWidget):
 
     @background_color.setter
     def background_color(self, value):
-        color = value if isinstance(value, QColor) else QColor(*value)
+        if isinstance(value, int):
+            value &= 0xFFFFFFFF  # a signed ARGB int would overflow QColor.fromRgba
+            if self._background_color.rgba() == value:
+                return
+            color = QColor.fromRgba(value)
+        else:
+            color = value if isinstance(value, QColor) else QColor(*value)
         if self._background_color.rgba() != color.rgba():
             self._background_color = QColor(color)
             self.update()
@@ -4577,9 +5136,16 @@ class NDotClockSlider(QWidget):
 
     @colon_color.setter
     def colon_color(self, value):
-        color = value if isinstance(value, QColor) else QColor(*value)
+        if isinstance(value, int):
+            value &= 0xFFFFFFFF  # a signed ARGB int would overflow QColor.fromRgba
+            if self._colon_color.rgba() == value:
+                return
+            color = QColor.fromRgba(value)
+        else:
+            color = value if isinstance(value, QColor) else QColor(*value)
         if self._colon_color.rgba() != color.rgba():
             self._colon_color = QColor(color)
+            self._colon_breathing_pixmaps = None
             self._update_cached_colors()
             self.update()
 
@@ -4638,36 +5204,42 @@ class NDotClockSlider(QWidget):
 
     def _update_digit_animations(self) -> bool:
         """Update digit change animations, returns True if any animation is active"""
-        if not self._digit_animations:
+        animations = self._digit_animations
+        if not animations:
             return False
 
-        has_active = False
-        current_time = datetime.now()
+        # Increment progress based on timer interval (same step for every digit)
+        # At 33ms (breathing mode), increment by 33/400 = 0.0825 per frame
+        # At 16ms (animation mode), increment by 16/400 = 0.04 per frame
+        step = self.main_timer.interval() / (self._digit_animation_duration * 1000)
 
-        # Update all active animations
-        positions_to_remove = []
-        for position, anim_data in self._digit_animations.items():
-            # Increment progress based on timer interval
-            # At 33ms (breathing mode), increment by 33/400 = 0.0825 per frame
-            # At 16ms (animation mode), increment by 16/400 = 0.04 per frame
-            interval_ms = self.main_timer.interval()
-            anim_data['progress'] += interval_ms / (self._digit_animation_duration * 1000)
-
-            if anim_data['progress'] >= 1.0:
-                positions_to_remove.append(position)
-            else:
-                has_active = True
+        finished = False
+        for anim_data in animations.values():
+            progress = anim_data['progress'] + step
+            anim_data['progress'] = progress
+            if progress >= 1.0:
+                finished = True
 
         # Remove completed animations
-        for position in positions_to_remove:
-            del self._digit_animations[position]
+        if finished:
+            self._digit_animations = animations = {
+                position: anim_data for position, anim_data in animations.items()
+                if anim_data['progress'] < 1.0
+            }
+
+        return bool(animations)
 
-        return has_active
+    @staticmethod
+    def _brightness_bucket_of(brightness: float) -> float:
+        """Quantize a 0.0-1.0 brightness to one of _BRIGHTNESS_BUCKETS steps"""
+        return round(max(0.0, min(1.0, brightness)) * _BRIGHTNESS_BUCKETS) / _BRIGHTNESS_BUCKETS
 
     def _update_cached_colors(self):
         """ARM-optimized: Update color cache with smart invalidation"""
-        # Use effective_brightness to avoid cache thrashing when using software overlay
-        brightness = self.effective_brightness
+        # Use effective_brightness to avoid cache thrashing when using software overlay,
+        # bucketed so near-identical brightness values share one set of cached colours
+        brightness = self._brightness_bucket_of(self.effective_brightness)
+        self._brightness_bucket = brightness
         
         # Calculate new colors
         digit_scaled = QColor(self._digit_color)
@@ -4692,10 +5264,12 @@ class NDotClockSlider(QWidget):
             date_color.setGreen(int(date_color.green() * brightness * 0.6))
             date_color.setBlue(int(date_color.blue() * brightness * 0.6))
             self._date_color = date_color
+            self._colon_breathing_pixmaps = None
 
             # ARM optimization: Clear only digit pixmap cache, not glow dots (they use brightness buckets)
             self._dot_pixmap_cache.clear()
-            # Note: _glow_dot_cache uses brightness buckets so it doesn't need to be cleared
+            self._digit_glyph_cache.clear()
+            # Note: _build_glow_dot_pixmap uses brightness buckets so it doesn't need to be cleared
 
             # Update edit mode cached colors
             self._edit_active_dot_color = self._scale_color_by_brightness(QColor(255, 255, 255))
@@ -4710,6 +5284,12 @@ class NDotClockSlider(QWidget):
             self._edit_update_text = self._scale_color_by_brightness(QColor(200, 200, 200))
             self._edit_autostart_active_bg = self._scale_color_by_brightness(QColor(60, 180, 100))
             self._edit_autostart_text = self._scale_color_by_brightness(QColor(255, 255, 255))
+            self._edit_wifi_bg = self._scale_color_by_brightness(QColor(50, 120, 180, 200))
+            self._edit_button_bg = self._scale_color_by_brightness(QColor(70, 70, 70, 180))
+            self._edit_hint_color = QColor(170, 170, 170)  # hint text is not brightness-scaled
+            # Fullscreen icon pens (keyed by pen width) embed the scaled icon colour
+            self._pen_icon_cache.clear()
+            self._control_button_cache.clear()
 
 
 
@@ -4717,7 +5297,7 @@ class NDotClockSlider(QWidget):
         """Handle window close"""
         try:
             # FIRST: Save settings before any cleanup that might fail
-            self.save_settings()
+            self.save_settings(blocking=True)
             
             # Fix: Graceful cleanup to prevent crashes on exit
             self._cleanup_panel_animations()
@@ -4738,12 +5318,11 @@ class NDotClockSlider(QWidget):
                     timer.deleteLater()
 
             # Clean up webview fade animations
-            if hasattr(self, '_webview_fade_animations'):
-                for anim in self._webview_fade_animations:
-                    if anim.state() == QPropertyAnimation.State.Running:
-                        anim.stop()
-                    anim.deleteLater()
-                self._webview_fade_animations.clear()
+            for anim in self._webview_fade_animations:
+                if anim.state() == _ANIM_RUNNING:
+                    anim.stop()
+                anim.deleteLater()
+            self._webview_fade_animations.clear()
 
             # Clean up webviews
             self.webview_manager.cleanup()
@@ -4752,7 +5331,7 @@ class NDotClockSlider(QWidget):
             if hasattr(self, 'brightness_manager') and self.brightness_manager:
                 self.brightness_manager.cleanup()
         except Exception as e:
-            print(f"[CloseEvent] Error during cleanup: {e}")  # Log for debugging
+            logger.debug("Error during close cleanup: %s", e)
         finally:
             super().closeEvent(event)
 
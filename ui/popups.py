@@ -3,6 +3,8 @@
 import os
 import subprocess
 import threading
+from typing import Dict, Optional, Tuple
+
 from PyQt6.QtCore import QEasingCurve, Qt, QPropertyAnimation, QTimer, pyqtSignal, QThread, pyqtSlot, QSize
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtSvg import QSvgRenderer
@@ -28,22 +30,42 @@ def _get_icon_path(name: str) -> str:
     return os.path.join(base, "resources", "icons", f"{name}.svg")
 
 
-def _load_svg_icon(name: str, size: int = 24, color: str = "#ffffff") -> QIcon:
-    """Load SVG icon and colorize it"""
+# Rendered icon cache: (name, size, color) -> pixmap.
+# Icons are rasterized once per process so popups and list items never
+# re-open and re-parse the SVG files (slow on SD-card storage).
+_svg_pixmap_cache: Dict[Tuple[str, int, str], QPixmap] = {}
+
+
+def _render_svg_pixmap(name: str, size: int = 24, color: str = "#ffffff") -> Optional[QPixmap]:
+    """Render SVG icon into a colorized pixmap (cached)"""
+    cache_key = (name, size, color)
+    pixmap = _svg_pixmap_cache.get(cache_key)
+    if pixmap is not None:
+        return pixmap
+
     path = _get_icon_path(name)
     if not os.path.exists(path):
-        return QIcon()
-    
+        return None
+
     renderer = QSvgRenderer(path)
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
-    
+
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
     painter.fillRect(pixmap.rect(), QColor(color))
     painter.end()
-    
+
+    _svg_pixmap_cache[cache_key] = pixmap
+    return pixmap
+
+
+def _load_svg_icon(name: str, size: int = 24, color: str = "#ffffff") -> QIcon:
+    """Load SVG icon and colorize it"""
+    pixmap = _render_svg_pixmap(name, size, color)
+    if pixmap is None:
+        return QIcon()
     return QIcon(pixmap)
 
 
@@ -1185,15 +1207,9 @@ class WiFiPopup(QWidget):
         header = QHBoxLayout()
         
         wifi_icon = QLabel()
-        wifi_pixmap = QPixmap(24, 24)
-        wifi_pixmap.fill(Qt.GlobalColor.transparent)
-        wifi_renderer = QSvgRenderer(_get_icon_path("wifi"))
-        wifi_painter = QPainter(wifi_pixmap)
-        wifi_renderer.render(wifi_painter)
-        wifi_painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-        wifi_painter.fillRect(wifi_pixmap.rect(), QColor("#4a9eff"))
-        wifi_painter.end()
-        wifi_icon.setPixmap(wifi_pixmap)
+        wifi_pixmap = _render_svg_pixmap("wifi", 24, "#4a9eff")
+        if wifi_pixmap is not None:
+            wifi_icon.setPixmap(wifi_pixmap)
         header.addWidget(wifi_icon)
         
         title = QLabel("WiFi Networks")
@@ -1,32 +1,56 @@
 import json
 import os
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
+from PyQt6.QtCore import QRunnable, QThreadPool
 from PyQt6.QtGui import QColor
-from ui.animations import SlideType
+from ui.animations import SlideType, WeatherSlideData
+
+# Defaults for every settings key; nested dicts are copied before they are handed out
+_DEFAULT_SETTINGS: Dict[str, Any] = {
+    'user_brightness': 0.8,
+    'digit_color': (246, 246, 255),
+    'background_color': (0, 0, 0),
+    'colon_color': (220, 40, 40),
+    'language': 'RU',
+    'slides': (),
+    'location': {'lat': None, 'lon': None},
+    'fullscreen': False,
+    'auto_brightness_enabled': False,
+    'auto_brightness_camera': 0,
+    'auto_brightness_interval_ms': 1000,
+    'auto_brightness_min': 0.0,
+    'auto_brightness_max': 1.0,
+    'window_position': {'x': 100, 'y': 100},
+    'webview_cache_to_disk': False,
+}
+
+_SLIDE_TYPES_BY_VALUE: Dict[str, SlideType] = {t.value: t for t in SlideType}
+
+class _SaveWorker(QRunnable):
+    """Writes queued settings snapshots off the GUI thread."""
+
+    def __init__(self, manager: 'SettingsManager'):
+        super().__init__()
+        self._manager = manager
+
+    def run(self):
+        self._manager._drain_pending_saves()
+
 
 class SettingsManager:
     def __init__(self, config_dir: str):
         self.settings_file = os.path.join(config_dir, 'ndot_clock_settings.json')
-        self.default_settings = {
-            'user_brightness': 0.8,
-            'digit_color': (246, 246, 255),
-            'background_color': (0, 0, 0),
-            'colon_color': (220, 40, 40),
-            'language': 'RU',
-            'slides': [],
-            'location': {'lat': None, 'lon': None},
-            'fullscreen': False,
-            'auto_brightness_enabled': False,
-            'auto_brightness_camera': 0,
-            'auto_brightness_interval_ms': 1000,
-            'auto_brightness_min': 0.0,
-            'auto_brightness_max': 1.0,
-            'window_position': {'x': 100, 'y': 100},
-        }
+        self.default_settings = dict(_DEFAULT_SETTINGS)
+        # Background saves: only the newest pending snapshot is written (bursts coalesce)
+        self._save_lock = threading.Lock()  # guards _pending_payload/_save_in_flight
+        self._write_lock = threading.Lock()  # serializes file writes, keeps them in order
+        self._pending_payload: Optional[str] = None
+        self._save_in_flight = False
 
     def load_settings(self) -> Dict[str, Any]:
         """Load and validate settings, returning a dictionary with native types"""
-        settings = self.default_settings.copy()
+        settings = _DEFAULT_SETTINGS
         
         print(f"[SettingsManager] Loading from: {self.settings_file}")
         print(f"[SettingsManager] File exists: {os.path.exists(self.settings_file)}")
@@ -38,9 +62,8 @@ class SettingsManager:
                     print(f"[SettingsManager] Loaded JSON keys: {list(loaded.keys())}")
                     print(f"[SettingsManager] fullscreen in file: {loaded.get('fullscreen')}")
                     print(f"[SettingsManager] auto_brightness_enabled in file: {loaded.get('auto_brightness_enabled')}")
-                    # Update only keys that exist in loaded settings to preserve defaults
-                    # But here we want to override defaults with loaded values
-                    settings.update(loaded)
+                    # Loaded values override the defaults; missing keys keep them
+                    settings = {**_DEFAULT_SETTINGS, **loaded}
             except Exception as e:
                 print(f"[SettingsManager] Error loading settings: {e}")
 
@@ -48,44 +71,52 @@ class SettingsManager:
         validated = {}
         
         # Brightness
-        validated['user_brightness'] = max(0.0, min(1.0, float(settings.get('user_brightness', 0.8))))
+        validated['user_brightness'] = max(0.0, min(1.0, float(settings['user_brightness'])))
         
         # Auto brightness
-        validated['auto_brightness_enabled'] = bool(settings.get('auto_brightness_enabled', False))
-        validated['auto_brightness_camera'] = int(settings.get('auto_brightness_camera', 0))
-        validated['auto_brightness_interval_ms'] = max(250, int(settings.get('auto_brightness_interval_ms', 1000)))
+        validated['auto_brightness_enabled'] = bool(settings['auto_brightness_enabled'])
+        validated['auto_brightness_camera'] = int(settings['auto_brightness_camera'])
+        validated['auto_brightness_interval_ms'] = max(250, int(settings['auto_brightness_interval_ms']))
         
-        auto_min = float(settings.get('auto_brightness_min', 0.0))
-        auto_max = float(settings.get('auto_brightness_max', 1.0))
+        auto_min = float(settings['auto_brightness_min'])
+        auto_max = float(settings['auto_brightness_max'])
         if auto_min > auto_max:
             auto_min, auto_max = auto_max, auto_min
         validated['auto_brightness_min'] = max(0.0, min(1.0, auto_min))
         validated['auto_brightness_max'] = max(validated['auto_brightness_min'], min(1.0, auto_max))
 
         # Colors
-        validated['digit_color'] = QColor(*settings.get('digit_color', (246, 246, 255)))
-        validated['background_color'] = QColor(*settings.get('background_color', (0, 0, 0)))
-        validated['colon_color'] = QColor(*settings.get('colon_color', (220, 40, 40)))
+        _qc = QColor
+        validated['digit_color'] = _qc(*settings['digit_color'])
+        validated['background_color'] = _qc(*settings['background_color'])
+        validated['colon_color'] = _qc(*settings['colon_color'])
         
         # General
-        validated['language'] = settings.get('language', 'RU')
-        validated['fullscreen'] = settings.get('fullscreen', False)
-        validated['location'] = settings.get('location', {'lat': None, 'lon': None})
-        validated['window_position'] = settings.get('window_position', {'x': 100, 'y': 100})
+        validated['language'] = settings['language']
+        validated['fullscreen'] = settings['fullscreen']
+        location = settings['location']
+        validated['location'] = dict(location) if isinstance(location, dict) else location
+        window_position = settings['window_position']
+        validated['window_position'] = dict(window_position) if isinstance(window_position, dict) else window_position
+        validated['webview_cache_to_disk'] = bool(settings['webview_cache_to_disk'])
         
         # Slides
-        slides_data = settings.get('slides', [])
+        slides_data = settings['slides']
         validated_slides = []
+        slide_types = _SLIDE_TYPES_BY_VALUE
         for s in slides_data:
             try:
-                slide_type = SlideType(s['type'])
+                slide_type = slide_types[s['type']]
                 # Skip ADD slides from saved data - we'll add it at the end
                 if slide_type != SlideType.ADD:
+                    data = s.get('data', {})
+                    if slide_type == SlideType.WEATHER:
+                        data = WeatherSlideData.from_dict(data)
                     validated_slides.append({
                         'type': slide_type,
-                        'data': s.get('data', {})
+                        'data': data
                     })
-            except (ValueError, KeyError):
+            except (ValueError, KeyError, TypeError):
                 continue
         
         # If no slides, add default clock slide
@@ -99,8 +130,12 @@ class SettingsManager:
         
         return validated
 
-    def save_settings(self, settings: Dict[str, Any]):
-        """Save settings dictionary to file"""
+    def save_settings(self, settings: Dict[str, Any], blocking: bool = False):
+        """Save settings dictionary to file.
+
+        The snapshot is serialized on the caller's thread; the (possibly slow) disk
+        write happens in the global thread pool unless ``blocking`` is set, as on close.
+        """
         # Convert QColor and Enums back to serializable formats
         serializable = settings.copy()
         
@@ -119,13 +154,55 @@ class SettingsManager:
         # Convert slides (exclude ADD slides - they're added automatically)
         if 'slides' in serializable:
             serializable['slides'] = [
-                {'type': s['type'].value, 'data': s['data']} 
+                {
+                    'type': s['type'].value,
+                    'data': s['data'].to_dict() if isinstance(s['data'], WeatherSlideData) else s['data']
+                }
                 for s in serializable['slides']
                 if s['type'] != SlideType.ADD
             ]
             
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable, f, indent=4, ensure_ascii=False)
-        except Exception:
-            pass
+            payload = json.dumps(serializable, indent=4, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"[SettingsManager] Error serializing settings: {e}")
+            return
+
+        if blocking:
+            # Take the write lock first so an in-flight background write cannot land after us
+            with self._write_lock:
+                with self._save_lock:
+                    self._pending_payload = None
+                self._write_payload(payload)
+            return
+
+        with self._save_lock:
+            self._pending_payload = payload
+            if self._save_in_flight:
+                return  # the running worker picks up the newest payload
+            self._save_in_flight = True
+        QThreadPool.globalInstance().start(_SaveWorker(self))
+
+    def _drain_pending_saves(self):
+        """Write pending snapshots until none is left (runs in the thread pool)."""
+        while True:
+            with self._write_lock:
+                with self._save_lock:
+                    payload = self._pending_payload
+                    self._pending_payload = None
+                    if payload is None:
+                        self._save_in_flight = False
+                        return
+                self._write_payload(payload)
+
+    def _write_payload(self, payload: str):
+        """Atomically replace the settings file: temp file, fsync, os.replace."""
+        tmp_path = self.settings_file + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_file)
+        except OSError as e:
+            print(f"[SettingsManager] Error saving settings: {e}")
@@ -1,5 +1,6 @@
 import sys
 import os
+from functools import lru_cache
 
 def get_resource_dir(subdir=''):
     """Get resource directory path, compatible with PyInstaller and development"""
@@ -16,8 +17,9 @@ def get_resource_dir(subdir=''):
         return os.path.join(base_path, subdir)
     return base_path
 
+@lru_cache(maxsize=None)
 def get_config_dir():
-    """Get platform-specific user config directory for settings"""
+    """Get platform-specific user config directory for settings (resolved and created once)"""
     app_name = "Ndot Clock"
 
     if sys.platform == 'win32':
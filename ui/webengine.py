@@ -0,0 +1,28 @@
+"""QtWebEngine classes used by the webview slides.
+
+Importing QtWebEngine loads Chromium, which is slow and memory hungry on the
+Pi, so ``ui.webviews`` imports this module only when the first webview is
+created.
+"""
+
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+__all__ = [
+    "QWebChannel",
+    "QWebEnginePage",
+    "QWebEngineProfile",
+    "QWebEngineSettings",
+    "QWebEngineView",
+    "SilentWebEnginePage",
+]
+
+
+class SilentWebEnginePage(QWebEnginePage):
+    """Кастомная страница webview которая подавляет JavaScript логи"""
+    
+    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
+        """Подавляем JavaScript консольные сообщения"""
+        # Игнорируем все JS логи
+        pass
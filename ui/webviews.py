@@ -1,14 +1,26 @@
+from __future__ import annotations
+
 import os
-from typing import Optional
-from PyQt6.QtCore import QUrl, QTimer, Qt, QRectF, pyqtSignal, pyqtSlot, QObject
-from PyQt6.QtGui import QColor, QPainterPath, QRegion
-from PyQt6.QtWebChannel import QWebChannel
+from typing import TYPE_CHECKING, Optional
+from PyQt6.QtCore import QUrl, QTimer, Qt, pyqtSignal, pyqtSlot, QObject
+from PyQt6.QtGui import QColor, QRegion
 # Note: QGraphicsOpacityEffect removed - causes window recreation with WebEngine
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
-from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 from ui.utils import get_config_dir
 
+if TYPE_CHECKING:
+    from PyQt6.QtWebEngineCore import QWebEngineProfile
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+# Resolved once: toggled on every show/hide of a webview
+_WA_TRANSPARENT_FOR_MOUSE = Qt.WidgetAttribute.WA_TransparentForMouseEvents
+
+
+def _webengine():
+    """Import QtWebEngine on first use (it pulls in Chromium)."""
+    from ui import webengine
+    return webengine
+
 
 class KeyboardBridge(QObject):
     """Bridge to communicate between JavaScript and Python for keyboard"""
@@ -23,34 +35,44 @@ class KeyboardBridge(QObject):
         self.keyboardRequested.emit(element_id, current_value)
 
 
-class SilentWebEnginePage(QWebEnginePage):
-    """Кастомная страница webview которая подавляет JavaScript логи"""
-    
-    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
-        """Подавляем JavaScript консольные сообщения"""
-        # Игнорируем все JS логи
-        pass
-
-
 class WebviewManager:
-    def __init__(self, parent):
+    # Hidden views are torn down after this long to free their renderer process
+    IDLE_UNLOAD_MS = 60_000
+    # In-memory HTTP cache size used unless cache_to_disk is enabled
+    MEMORY_CACHE_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, parent, cache_to_disk: bool = False):
         self.parent = parent
+        # Disk cache flushes on every navigation; kiosks default to an in-memory cache
+        self.cache_to_disk = cache_to_disk
+        # Corner radius and view stylesheet, recomputed only on scale change
+        self._border_radius = 0
+        self._view_stylesheet = ""
         self.webviews: dict[str, QWebEngineView] = {}  # Cache: url -> view
         self.current_key: Optional[str] = None
         self.profile: Optional[QWebEngineProfile] = None
         
         # Cache geometry to avoid redundant updates
         self._last_mask_size: Optional[tuple[int, int]] = None
+        self._mask_cache: dict[tuple[int, int, int], QRegion] = {}  # (w, h, radius) -> mask
+        self._mask_cache_max_size = 8
         self._last_geometry: Optional[tuple[int, int, int, int]] = None
         
         # Scroll position cache per URL
         self._scroll_positions: dict[str, tuple[int, int]] = {}  # url -> (x, y)
 
+        self.set_scale_factor(getattr(parent, 'scale_factor', 1.0) or 1.0)
+
     @property
     def webview(self) -> Optional[QWebEngineView]:
         """Backwards compatibility: get current webview"""
         return self.webviews.get(self.current_key) if self.current_key else None
 
+    @property
+    def is_placed(self) -> bool:
+        """True while the current view is on-screen at the last geometry it was shown with"""
+        return self._last_geometry is not None
+
     @property
     def page_loaded(self) -> bool:
         """Backwards compatibility: get current page load status"""
@@ -80,9 +102,18 @@ class WebviewManager:
         """Backwards compatibility: set current url key"""
         self.current_key = value if value else None
 
-    def _border_radius_px(self) -> int:
-        scale = getattr(self.parent, 'scale_factor', 1.0) or 1.0
-        return max(8, int(12 * scale))
+    def set_scale_factor(self, scale: float):
+        """Update the cached corner radius (and existing views) for a new UI scale"""
+        border_radius = max(8, int(12 * scale))
+        if border_radius == self._border_radius:
+            return
+        self._border_radius = border_radius
+        self._view_stylesheet = f"QWebEngineView {{ border-radius: {border_radius}px; background: #1e1e1e; }}"
+        for view in self.webviews.values():
+            view.setStyleSheet(self._view_stylesheet)
+        # Force the next show_webview() to re-apply the mask with the new radius
+        self._last_mask_size = None
+        self._last_geometry = None
 
     def _apply_mask(self, width: int, height: int):
         view = self.webview
@@ -92,11 +123,28 @@ class WebviewManager:
         if size_key == self._last_mask_size:
             return
         self._last_mask_size = size_key
-        border_radius = self._border_radius_px()
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(0, 0, width, height), border_radius, border_radius)
-        region = QRegion(path.toFillPolygon().toPolygon())
-        view.setMask(region)
+        view.setMask(self._rounded_mask(width, height, self._border_radius))
+
+    def _rounded_mask(self, width: int, height: int, radius: int) -> QRegion:
+        """Rounded-rect mask region, cached by size and radius"""
+        key = (width, height, radius)
+        region = self._mask_cache.get(key)
+        if region is None:
+            # Union of two cross rects and four corner ellipses: exact rounded
+            # rect without tessellating a QPainterPath into a polygon
+            r = max(0, min(radius, width // 2, height // 2))
+            d = 2 * r
+            ellipse = QRegion.RegionType.Ellipse
+            region = (QRegion(r, 0, width - d, height)
+                      | QRegion(0, r, width, height - d)
+                      | QRegion(0, 0, d, d, ellipse)
+                      | QRegion(width - d, 0, d, d, ellipse)
+                      | QRegion(0, height - d, d, d, ellipse)
+                      | QRegion(width - d, height - d, d, d, ellipse))
+            if len(self._mask_cache) >= self._mask_cache_max_size:
+                self._mask_cache.pop(next(iter(self._mask_cache)))
+            self._mask_cache[key] = region
+        return region
 
     def _prepare_url(self, raw_url: str, *, default_scheme: str = "https") -> Optional[QUrl]:
         """Normalize user-provided URL before loading it into webviews."""
@@ -113,21 +161,30 @@ class WebviewManager:
 
         return url
 
-    def _ensure_profile(self):
-        """Initialize shared profile if needed"""
+    def _ensure_profile(self) -> QWebEngineProfile:
+        """Return the profile shared by all webviews, creating it on first use"""
         if self.profile is None:
-            cookies_dir = os.path.join(get_config_dir(), "cookies")
+            QWebEngineProfile = _webengine().QWebEngineProfile
+            config_dir = get_config_dir()
+            cookies_dir = os.path.join(config_dir, "cookies")
             os.makedirs(cookies_dir, exist_ok=True)
 
             self.profile = QWebEngineProfile("webview_profile", self.parent)
             self.profile.setPersistentStoragePath(cookies_dir)
             self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
 
-            # Enable Disk Cache for optimization
-            cache_dir = os.path.join(get_config_dir(), "cache")
-            os.makedirs(cache_dir, exist_ok=True)
-            self.profile.setCachePath(cache_dir)
-            self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+            if self.cache_to_disk:
+                cache_dir = os.path.join(config_dir, "cache")
+                os.makedirs(cache_dir, exist_ok=True)
+                self.profile.setCachePath(cache_dir)
+                self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+            else:
+                self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.MemoryHttpCache)
+                self.profile.setHttpCacheMaximumSize(self.MEMORY_CACHE_BYTES)
+
+            # Enable dark mode preference (once per profile - every view shares it)
+            self.profile.setHttpUserAgent(self.profile.httpUserAgent() + " prefers-color-scheme: dark")
+        return self.profile
 
     def create_webview(self):
         """Initialize profile (webview creation is now lazy in load_url)"""
@@ -135,14 +192,17 @@ class WebviewManager:
 
     def _create_webview_instance(self, url_key: str) -> QWebEngineView:
         """Create a new webview instance for the given URL"""
-        self._ensure_profile()
+        profile = self._ensure_profile()
+        webengine = _webengine()
+        QWebEngineSettings = webengine.QWebEngineSettings
         
-        page = SilentWebEnginePage(self.profile, self.parent)
-        view = QWebEngineView(self.parent)
+        view = webengine.QWebEngineView(self.parent)
+        # The view owns its page, so disposing the view frees the page, channel and renderer
+        page = webengine.SilentWebEnginePage(profile, view)
         view.setPage(page)
         
         # Setup WebChannel for keyboard bridge
-        channel = QWebChannel(page)
+        channel = webengine.QWebChannel(page)
         bridge = KeyboardBridge(view)
         bridge.keyboardRequested.connect(self._on_keyboard_requested)
         channel.registerObject("keyboardBridge", bridge)
@@ -154,6 +214,8 @@ class WebviewManager:
         view.error_message = ""
         view.error_notified = False
         view.load_timeout_timer = None
+        view.idle_unload_timer = None
+        view.frozen = False
         
         # Store URL key on the view for reference
         view._url_key = url_key
@@ -182,24 +244,26 @@ class WebviewManager:
             settings.setAttribute(QWebEngineSettings.WebAttribute.TouchIconsEnabled, True)
 
         view.page().setBackgroundColor(QColor(30, 30, 30))  # Dark background
-        view.installEventFilter(self.parent)
+        self._install_swipe_filter(view)
         view.setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents, True)
         # Ensure child widget (focusProxy) also accepts touch events
         if view.focusProxy():
             view.focusProxy().setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents, True)
         
-        border_radius = self._border_radius_px()
-        view.setStyleSheet(f"QWebEngineView {{ border-radius: {border_radius}px; background: #1e1e1e; }}")
-        
-        # Enable dark mode preference
-        view.page().profile().setHttpUserAgent(
-            view.page().profile().httpUserAgent() + " prefers-color-scheme: dark"
-        )
-        view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        view.setStyleSheet(self._view_stylesheet)
+
+        view.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, True)
         
         view.setUpdatesEnabled(True)
         return view
 
+    def _install_swipe_filter(self, view: QWebEngineView):
+        """Install the parent's swipe event filter on a view exactly once"""
+        if getattr(view, '_swipe_filter_installed', False):
+            return
+        view.installEventFilter(self.parent)
+        view._swipe_filter_installed = True
+
     def load_url(self, url: str):
         """Load URL in webview (find existing or create new)"""
         url_object = self._prepare_url(url)
@@ -261,6 +325,10 @@ class WebviewManager:
         view = self.webview
         if not view:
             return False
+        if view.idle_unload_timer:
+            view.idle_unload_timer.stop()
+        if view.frozen:
+            self._set_view_frozen(view, False)
         
         geom_tuple = (geometry.x(), geometry.y(), geometry.width(), geometry.height())
         needs_geometry_update = self._last_geometry != geom_tuple
@@ -269,28 +337,87 @@ class WebviewManager:
             if needs_geometry_update:
                 current_geom = view.geometry()
                 if current_geom.x() < 0 or current_geom.y() < 0:
+                    view.setUpdatesEnabled(False)
                     view.setGeometry(-10000, -10000, geometry.width(), geometry.height())
                     self._apply_mask(geometry.width(), geometry.height())
-            view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+                    view.setUpdatesEnabled(True)
+            if not view.testAttribute(_WA_TRANSPARENT_FOR_MOUSE):
+                view.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, True)
             return False
         
-        if needs_geometry_update:
+        # Already on-screen and interactive: skip the attribute churn
+        needs_interactive = view.testAttribute(_WA_TRANSPARENT_FOR_MOUSE)
+        if needs_geometry_update or needs_interactive:
+            # Batch geometry, mask and attribute changes into one repaint
             view.setUpdatesEnabled(False)
-            view.setGeometry(geometry)
-            self._apply_mask(geometry.width(), geometry.height())
-            view.setUpdatesEnabled(True)
-            self._last_geometry = geom_tuple
-        
-        view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
+            try:
+                if needs_geometry_update:
+                    view.setGeometry(geometry)
+                    self._apply_mask(geometry.width(), geometry.height())
+                    self._last_geometry = geom_tuple
+                if needs_interactive:
+                    view.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, False)
+            finally:
+                view.setUpdatesEnabled(True)
         return True
 
     def _hide_view_instance(self, view: QWebEngineView):
         """Helper to hide a specific view"""
         if view:
-            view.setUpdatesEnabled(False)
-            view.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-            view.setGeometry(-10000, -10000, 1, 1)
-            view.setUpdatesEnabled(True)
+            already_hidden = (view.x() == -10000 and view.width() == 1 and
+                              view.testAttribute(_WA_TRANSPARENT_FOR_MOUSE))
+            if not already_hidden:
+                view.setUpdatesEnabled(False)
+                view.setAttribute(_WA_TRANSPARENT_FOR_MOUSE, True)
+                view.setGeometry(-10000, -10000, 1, 1)
+                view.setUpdatesEnabled(True)
+            if view.page_loaded and not view.frozen:
+                self._set_view_frozen(view, True)
+            self._schedule_idle_unload(view)
+
+    def _set_view_frozen(self, view: QWebEngineView, frozen: bool):
+        """Pause (or resume) JS timers and media of an off-screen view"""
+        view.frozen = frozen
+        page = view.page()
+        lifecycle = getattr(page, 'LifecycleState', None)
+        if frozen:
+            page.runJavaScript("document.querySelectorAll('video, audio').forEach(function (m) { m.pause(); });")
+            # Views stay parked off-screen rather than hidden, so mark the page
+            # itself invisible; Chromium only freezes invisible pages
+            page.setVisible(False)
+            if lifecycle is not None:
+                page.setLifecycleState(lifecycle.Frozen)
+        else:
+            if lifecycle is not None:
+                page.setLifecycleState(lifecycle.Active)
+            page.setVisible(True)
+
+    def _schedule_idle_unload(self, view: QWebEngineView):
+        """Start the countdown after which a hidden view is unloaded"""
+        if view.idle_unload_timer is None:
+            url_key = view._url_key
+            view.idle_unload_timer = QTimer(self.parent)
+            view.idle_unload_timer.setSingleShot(True)
+            view.idle_unload_timer.timeout.connect(lambda: self._unload_idle_view(url_key))
+        # Repeated hide calls must not keep postponing the unload
+        if not view.idle_unload_timer.isActive():
+            view.idle_unload_timer.start(self.IDLE_UNLOAD_MS)
+
+    def _unload_idle_view(self, url_key: str):
+        """Tear down a view that stayed hidden; load_url() recreates it on demand"""
+        view = self.webviews.get(url_key)
+        if view is None:
+            return
+
+        if view.page_loaded:
+            pos = view.page().scrollPosition()
+            self._scroll_positions[url_key] = (int(pos.x()), int(pos.y()))
+
+        self.webviews.pop(url_key)
+        if self.current_key == url_key:
+            self._last_geometry = None
+            self._last_mask_size = None
+        self._dispose_view(view)
 
     def hide_webview(self):
         """Hide current webview"""
@@ -309,6 +436,10 @@ class WebviewManager:
             view.error_notified = False
             # Inject keyboard helper script
             self._inject_keyboard_script(view)
+            # Restore scroll position of a view that was unloaded while idle
+            scroll = self._scroll_positions.pop(getattr(view, '_url_key', None), None)
+            if scroll:
+                view.page().runJavaScript(f"window.scrollTo({scroll[0]}, {scroll[1]});")
         else:
             view.error_message = "Failed to load page"
             view.page_loaded = False
@@ -416,16 +547,46 @@ class WebviewManager:
         if self.webview == view and hasattr(self.parent, 'update'):
             self.parent.update()
 
-    def cleanup(self):
-        """Clean up all webviews"""
-        for view in self.webviews.values():
-            timer = getattr(view, 'load_timeout_timer', None)
+    def _dispose_view(self, view: QWebEngineView):
+        """Stop a view's timers and schedule the view and its page for deletion"""
+        # Detach first: a late urlChanged must not save a URL over the slide's settings
+        view.page_loaded = False
+        for signal in (view.loadFinished, view.urlChanged):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+
+        for timer in (getattr(view, 'load_timeout_timer', None),
+                      getattr(view, 'idle_unload_timer', None)):
             if timer:
                 timer.stop()
                 timer.deleteLater()
-            
-            view.setParent(None)
-            view.deleteLater()
+
+        # Delete the page explicitly so it goes before the shared profile can be released
+        view.page().deleteLater()
+        view.setParent(None)
+        view.deleteLater()
+
+    def release_url(self, url: str):
+        """Drop the cached view for a URL (e.g. when its slide was deleted)"""
+        url_object = self._prepare_url(url)
+        if url_object is None:
+            return
+        url_key = url_object.toString()
+        view = self.webviews.pop(url_key, None)
+        if view is None:
+            return
+        if self.current_key == url_key:
+            self.current_key = None
+            self._last_geometry = None
+            self._last_mask_size = None
+        self._dispose_view(view)
+
+    def cleanup(self):
+        """Clean up all webviews"""
+        for view in self.webviews.values():
+            self._dispose_view(view)
             
         self.webviews.clear()
         self.current_key = None